@@ -0,0 +1,226 @@
+"""
+Factory Workers - Benchmark Suite (benchmark.py)
+Measures the Employee hierarchy at increasing roster sizes: construction
+through the super().__init__ chain, validated setters (with and without a
+registry listening), __str__ rendering, EmployeeRegistry lookups and
+PayrollEngine runs. Also reports bytes per object for each class and the
+top cProfile hot spots of one pass (roster generation excluded). Results
+are printed or written as JSON so they can be compared across releases.
+
+Usage: python benchmark.py --sizes 1000 10000 100000 --output results.json
+"""
+
+import argparse
+import cProfile
+import gc
+import json
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+
+from employee_registry import EmployeeRegistry
+from payroll import PayrollEngine
+from production_worker import ProductionWorker
+from roster_generator import RosterGenerator
+from team_leader import TeamLeader
+
+
+def rate(count, seconds):
+    """Returns operations per second (None if the timer did not advance)."""
+    return count / seconds if seconds else None
+
+
+def timed(fn, *args):
+    """Returns (result, elapsed seconds) for fn(*args) with the GC paused."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+# ---- Individual Benchmarks ----
+
+def _construct(rows):
+    return [cls(*args) for cls, args in rows]
+
+
+def _set_pay_rates(workers):
+    for w in workers:
+        w.hourly_pay_rate = w.hourly_pay_rate + 0.25
+
+
+def _set_hire_dates(employees, dates):
+    for e, d in zip(employees, dates):
+        e.hire_date = d
+
+
+def _format_all(employees):
+    for e in employees:
+        str(e)
+
+
+def _lookups(registry, numbers):
+    get = registry.get
+    for n in numbers:
+        get(n)
+
+
+def _prefix_searches(registry, prefixes):
+    return sum(len(registry.find_by_name(p)) for p in prefixes)
+
+
+def _workload(rows, timesheet, prefixes):
+    """One untimed pass over every benchmarked operation, for profiling."""
+    roster = _construct(rows)
+    workers = [e for e in roster if isinstance(e, ProductionWorker)]
+    _set_pay_rates(workers)
+    _set_hire_dates(roster, [e.hire_date for e in reversed(roster)])
+    _format_all(roster)
+    registry = EmployeeRegistry(roster)
+    _set_pay_rates(workers)
+    _lookups(registry, [e.employee_number for e in roster])
+    _prefix_searches(registry, prefixes)
+    PayrollEngine().run(roster, timesheet)
+
+
+def _prefixes():
+    return [f"{first} {last[0]}" for first in RosterGenerator.FIRST_NAMES
+            for last in RosterGenerator.LAST_NAMES]
+
+
+def run_size(n, seed):
+    """Runs every benchmark for an n-employee roster and returns a result dict."""
+    generator = RosterGenerator(seed=seed)
+    rows = generator.generate_args(n)
+    by_class = {}
+    for cls, args in rows:
+        by_class.setdefault(cls, []).append((cls, args))
+
+    construct = {}
+    for cls in RosterGenerator.CLASSES:
+        group = by_class.get(cls, [])
+        if group:
+            _, elapsed = timed(_construct, group)
+            construct[cls.__name__] = rate(len(group), elapsed)
+    roster, elapsed = timed(_construct, rows)
+    construct["mixed"] = rate(n, elapsed)
+
+    workers = [e for e in roster if isinstance(e, ProductionWorker)]
+    leaders = [e for e in roster if isinstance(e, TeamLeader)]
+    _, setter = timed(_set_pay_rates, workers)
+    # Reversed so every assignment is a real change the listeners see
+    dates = [e.hire_date for e in reversed(roster)]
+    _, hire_setter = timed(_set_hire_dates, roster, dates)
+    _, formatting = timed(_format_all, roster)
+
+    registry, build = timed(EmployeeRegistry, roster)
+    _, listened = timed(_set_pay_rates, workers)
+    numbers = [e.employee_number for e in roster]
+    _, lookups = timed(_lookups, registry, numbers)
+    prefixes = _prefixes()
+    matches, searches = timed(_prefix_searches, registry, prefixes)
+
+    timesheet = generator.timesheet(roster)
+    engine = PayrollEngine()
+    _, payroll = timed(engine.run, roster, timesheet)
+
+    return {
+        "size": n,
+        "team_leaders": len(leaders),
+        "construct_per_second": construct,
+        "setter_per_second": rate(len(workers), setter),
+        "hire_date_setter_per_second": rate(n, hire_setter),
+        "setter_with_registry_per_second": rate(len(workers), listened),
+        "str_per_second": rate(n, formatting),
+        "registry_build_per_second": rate(n, build),
+        "registry_lookup_per_second": rate(n, lookups),
+        "name_prefix_search_per_second": rate(len(prefixes), searches),
+        "name_prefix_matches": matches,
+        "payroll_employees_per_second": rate(n, payroll),
+    }
+
+
+def bytes_per_object(count, seed):
+    """Returns traced bytes per object for each class (the list not counted)."""
+    generator = RosterGenerator(seed=seed)
+    result = {}
+    for index, cls in enumerate(RosterGenerator.CLASSES):
+        mix = [0] * len(RosterGenerator.CLASSES)
+        mix[index] = 1
+        generator.mix = tuple(mix)
+        rows = generator.generate_args(count)
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        employees = _construct(rows)
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        result[cls.__name__] = (after - before - sys.getsizeof(employees)) / count
+    return result
+
+
+def hot_spots(n, seed, top):
+    """Profiles the benchmarked operations once; returns the top functions by own time."""
+    generator = RosterGenerator(seed=seed)
+    rows = generator.generate_args(n)
+    timesheet = {number: 80.0 for number in range(1, n + 1)}
+    profiler = cProfile.Profile()
+    profiler.runcall(_workload, rows, timesheet, _prefixes())
+    stats = pstats.Stats(profiler)
+    ranked = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [{"function": f"{file.rsplit('/', 1)[-1]}:{line}({name})",
+             "calls": calls, "tottime": tottime, "cumtime": cumtime}
+            for (file, line, name), (_, calls, tottime, cumtime, _) in ranked[:top]]
+
+
+def run(sizes, seed, memory_count, profile_size, top):
+    """Runs the benchmark at every size; returns the JSON-ready report."""
+    results = []
+    for n in sizes:
+        results.append(run_size(n, seed))
+        print(f"size {n:,}: done", file=sys.stderr)
+    return {
+        "benchmark": "factory_workers",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"seed": seed, "memory_count": memory_count,
+                   "profile_size": profile_size},
+        "bytes_per_object": bytes_per_object(memory_count, seed),
+        "results": results,
+        "hot_spots": hot_spots(profile_size, seed, top) if profile_size else [],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the factory_workers classes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--memory-count", type=int, default=50_000,
+                        help="objects per class traced for bytes/object")
+    parser.add_argument("--profile-size", type=int, default=20_000,
+                        help="roster size for the cProfile pass (0 to skip)")
+    parser.add_argument("--top", type=int, default=15, help="hot spots to report")
+    parser.add_argument("--output", help="write JSON to this file instead of stdout")
+    args = parser.parse_args(argv)
+    if any(n <= 0 for n in args.sizes) or args.memory_count <= 0:
+        parser.error("Sizes and memory count must be greater than 0.")
+    if args.profile_size < 0 or args.top <= 0:
+        parser.error("Profile size cannot be negative and top must be greater than 0.")
+
+    report = run(args.sizes, args.seed, args.memory_count, args.profile_size, args.top)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
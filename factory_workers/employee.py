@@ -1,12 +1,38 @@
 """
 Employee Class - Base class for the Factory Workers hierarchy.
 Stores basic employee information: name, employee number, and hire date.
+Every setter in the hierarchy reports real changes to listeners registered
+with add_listener, so indexes over employees can stay consistent. Before
+assigning, a setter also runs the validators registered with
+add_validator; any of them can veto the change by raising, and then
+nothing is modified and no listener hears about it.
+
+Hire dates are parsed once, on assignment, into a proleptic Gregorian day
+ordinal (hire_ordinal) so seniority queries never re-parse; the value as
+given is kept for display.
 """
 
+import calendar
+from datetime import date
+
+from validators import check_employee_number, check_hire_date, check_name, hire_date_ordinal
+
+
+def _ordinal_or_none(value):
+    """Constructor-time parse: the constructors have never validated."""
+    try:
+        return hire_date_ordinal(value)
+    except (TypeError, ValueError):
+        return None
+
 
 class Employee:
     """Base class representing a generic employee."""
 
+    # No per-instance __dict__: every field lives in a fixed slot
+    __slots__ = ("_name", "_employee_number", "_hire_date", "_hire_ordinal", "_listeners",
+                 "_validators")
+
     def __init__(self, name, employee_number, hire_date):
         """
         Preconditions: name is a non-empty string, employee_number is int or str,
@@ -16,6 +42,9 @@ class Employee:
         self._name = name
         self._employee_number = employee_number
         self._hire_date = hire_date
+        self._hire_ordinal = _ordinal_or_none(hire_date)
+        self._listeners = None  # list created by the first add_listener
+        self._validators = None  # list created by the first add_validator
 
     # ---- Getters and Setters ----
 
@@ -25,9 +54,11 @@ class Employee:
 
     @name.setter
     def name(self, value):
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError("Name must be a non-empty string.")
+        check_name(value)
+        old = self._name
+        self._validate_change("name", old, value)
         self._name = value
+        self._changed("name", old, value)
 
     @property
     def employee_number(self):
@@ -35,9 +66,11 @@ class Employee:
 
     @employee_number.setter
     def employee_number(self, value):
-        if not isinstance(value, (int, str)):
-            raise TypeError("Employee number must be an int or string.")
+        check_employee_number(value)
+        old = self._employee_number
+        self._validate_change("employee_number", old, value)
         self._employee_number = value
+        self._changed("employee_number", old, value)
 
     @property
     def hire_date(self):
@@ -45,9 +78,87 @@ class Employee:
 
     @hire_date.setter
     def hire_date(self, value):
-        if not isinstance(value, (str, tuple)):
-            raise TypeError("Hire date must be a string or tuple.")
+        ordinal = check_hire_date(value)
+        old = self._hire_date
+        self._validate_change("hire_date", old, value)
         self._hire_date = value
+        self._hire_ordinal = ordinal
+        self._changed("hire_date", old, value)
+
+    @property
+    def hire_ordinal(self):
+        """Hire date as a day ordinal, or None if it could not be parsed."""
+        return self._hire_ordinal
+
+    def hire_date_value(self):
+        """Returns the hire date as a datetime.date (None if unparsed)."""
+        if self._hire_ordinal is None:
+            return None
+        return date.fromordinal(self._hire_ordinal)
+
+    def years_of_service(self, as_of=None):
+        """
+        Preconditions: as_of is a datetime.date (defaults to today)
+        Postconditions: Returns completed years since the hire date, or None;
+                        a Feb 29 hire completes a year on Feb 28 in common
+                        years, as in SeniorityIndex.anniversaries
+        """
+        if self._hire_ordinal is None:
+            return None
+        hired = date.fromordinal(self._hire_ordinal)
+        as_of = as_of or date.today()
+        years = as_of.year - hired.year
+        day = (as_of.month, as_of.day)
+        if day == (2, 28) and not calendar.isleap(as_of.year):
+            day = (2, 29)  # Feb 28 completes the year for Feb 29 hires
+        if day < (hired.month, hired.day):
+            years -= 1
+        return years
+
+    # ---- Change Notification ----
+
+    def add_listener(self, callback):
+        """
+        Preconditions: callback accepts (employee, field, old_value, new_value)
+        Postconditions: callback is called whenever a setter changes a field
+        """
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stops notifying callback about changes."""
+        self._listeners.remove(callback)
+        if not self._listeners:
+            self._listeners = None
+
+    def add_validator(self, callback):
+        """
+        Preconditions: callback accepts (employee, field, old_value, new_value)
+        Postconditions: callback runs before every setter assignment and may
+                        raise to reject the change
+        """
+        if self._validators is None:
+            self._validators = []
+        self._validators.append(callback)
+
+    def remove_validator(self, callback):
+        """Stops consulting callback before changes."""
+        self._validators.remove(callback)
+        if not self._validators:
+            self._validators = None
+
+    def _validate_change(self, field, old, new):
+        """Called by every setter before assignment; validators may veto."""
+        if self._validators is not None and old != new:
+            for callback in tuple(self._validators):
+                callback(self, field, old, new)
+
+    def _changed(self, field, old, new):
+        """Called by every setter after assignment; notifies on real changes."""
+        if self._listeners is not None and old != new:
+            for callback in tuple(self._listeners):
+                callback(self, field, old, new)
 
     # ---- Display ----
 
@@ -61,12 +172,12 @@ class Employee:
         """Returns a developer-friendly string representation."""
         return f"Employee({self._name!r}, {self._employee_number!r}, {self._hire_date!r})"
 
-    def print_employee(self):
+    def print_employee(self, file=None):
         """
-        Preconditions: None
-        Postconditions: Displays all employee attributes to console
+        Preconditions: file is a writable text stream, or None for the console
+        Postconditions: Displays all employee attributes
         """
-        print(self.__str__())
+        print(self.__str__(), file=file)
 
 
 # ---- Unit Tests ----
@@ -0,0 +1,214 @@
+"""
+EmployeeRegistry Class - Indexed container for the Factory Workers hierarchy.
+Keeps a hash index on employee_number, a sorted name index for
+case-insensitive prefix search, and secondary indexes on shift and
+employee type. The registry listens to each employee's setters, so the
+indexes follow name, number and shift changes made after registration.
+"""
+
+from bisect import bisect_left, insort
+
+from employee import Employee
+
+
+def _name_entry(name, number):
+    """Sort key for the name index; the type name keeps int and str numbers apart."""
+    return (name.casefold(), type(number).__name__, number)
+
+
+class EmployeeRegistry:
+    """Looks employees up by number, name prefix, shift and type."""
+
+    def __init__(self, employees=()):
+        """
+        Preconditions: employees is an iterable of Employee objects with
+                       distinct employee numbers
+        Postconditions: Registry holds every employee, fully indexed
+        """
+        self._by_number = {}
+        self._names = []      # sorted _name_entry tuples
+        self._by_shift = {}   # shift -> set of employee numbers
+        self._by_type = {}    # class -> set of employee numbers
+        for employee in employees:
+            self.add(employee)
+
+    # ---- Adding and Removing ----
+
+    def add(self, employee):
+        """
+        Preconditions: employee is an Employee whose number is not registered
+        Postconditions: employee is indexed and its changes are tracked
+        """
+        if not isinstance(employee, Employee):
+            raise TypeError("Registry entries must be Employee objects.")
+        number = employee.employee_number
+        if number in self._by_number:
+            raise ValueError(f"Employee number {number!r} is already registered.")
+        self._by_number[number] = employee
+        insort(self._names, _name_entry(employee.name, number))
+        if hasattr(employee, "shift"):
+            self._by_shift.setdefault(employee.shift, set()).add(number)
+        self._by_type.setdefault(type(employee), set()).add(number)
+        employee.add_validator(self._check_change)
+        employee.add_listener(self._on_change)
+
+    def remove(self, employee_number):
+        """
+        Preconditions: employee_number is registered
+        Postconditions: Returns the employee after dropping it from every index
+        """
+        employee = self._by_number.pop(employee_number)
+        self._names.pop(self._name_position(employee.name, employee_number))
+        if hasattr(employee, "shift"):
+            self._by_shift[employee.shift].discard(employee_number)
+        self._by_type[type(employee)].discard(employee_number)
+        employee.remove_validator(self._check_change)
+        employee.remove_listener(self._on_change)
+        return employee
+
+    def _name_position(self, name, number):
+        return bisect_left(self._names, _name_entry(name, number))
+
+    # ---- Index Maintenance ----
+
+    def _check_change(self, employee, field, old, new):
+        """Validator: vetoes a colliding number before anything has changed."""
+        if field == "employee_number" and new in self._by_number:
+            raise ValueError(f"Employee number {new!r} is already registered.")
+
+    def _on_change(self, employee, field, old, new):
+        """Listener: moves the employee between index entries after a setter."""
+        if field == "employee_number":
+            del self._by_number[old]
+            self._by_number[new] = employee
+            self._names.pop(self._name_position(employee.name, old))
+            insort(self._names, _name_entry(employee.name, new))
+            if hasattr(employee, "shift"):
+                members = self._by_shift[employee.shift]
+                members.discard(old)
+                members.add(new)
+            members = self._by_type[type(employee)]
+            members.discard(old)
+            members.add(new)
+        elif field == "name":
+            number = employee.employee_number
+            self._names.pop(self._name_position(old, number))
+            insort(self._names, _name_entry(new, number))
+        elif field == "shift":
+            number = employee.employee_number
+            self._by_shift[old].discard(number)
+            self._by_shift.setdefault(new, set()).add(number)
+
+    # ---- Queries ----
+
+    def get(self, employee_number, default=None):
+        """Returns the employee with that number, or default."""
+        return self._by_number.get(employee_number, default)
+
+    def __getitem__(self, employee_number):
+        return self._by_number[employee_number]
+
+    def __contains__(self, employee_number):
+        return employee_number in self._by_number
+
+    def __len__(self):
+        return len(self._by_number)
+
+    def __iter__(self):
+        return iter(self._by_number.values())
+
+    def find_by_name(self, prefix):
+        """
+        Preconditions: prefix is a string
+        Postconditions: Returns employees whose name starts with prefix
+                        (case-insensitive), in name order
+        """
+        key = prefix.casefold()
+        names = self._names
+        found = []
+        for i in range(bisect_left(names, (key,)), len(names)):
+            name, _, number = names[i]
+            if not name.startswith(key):
+                break
+            found.append(self._by_number[number])
+        return found
+
+    def by_shift(self, shift):
+        """Returns the production workers and team leaders on that shift."""
+        return [self._by_number[n] for n in self._by_shift.get(shift, ())]
+
+    def of_type(self, cls, exact=False):
+        """
+        Preconditions: cls is Employee or one of its subclasses
+        Postconditions: Returns registered instances of cls (subclasses too
+                        unless exact is True)
+        """
+        if exact:
+            numbers = self._by_type.get(cls, ())
+        else:
+            numbers = [n for kind, members in self._by_type.items()
+                       if issubclass(kind, cls) for n in members]
+        return [self._by_number[n] for n in numbers]
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        counts = ", ".join(f"{kind.__name__}={len(members)}"
+                           for kind, members in self._by_type.items() if members)
+        return f"EmployeeRegistry({counts})"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import time
+
+    from production_worker import ProductionWorker
+    from shift_supervisor import ShiftSupervisor
+    from team_leader import TeamLeader
+
+    print("=" * 50)
+    print("EmployeeRegistry Class - Unit Tests")
+    print("=" * 50)
+
+    registry = EmployeeRegistry([
+        Employee("Alice Johnson", 1001, "03/15/2020"),
+        ProductionWorker("Carlos Diaz", 2001, "01/10/2021", 1, 18.50),
+        ProductionWorker("Diana Prince", 2002, "07/22/2022", 2, 22.75),
+        ShiftSupervisor("Emily Carter", 3001, "05/01/2018", 65000.00, 5000.00),
+        TeamLeader("Frank Miller", 4001, "03/15/2017", 1, 25.00, 500.00, 40, 35),
+    ])
+    print(f"\n{registry!r}")
+    print(f"registry[2002]: {registry[2002].name}")
+    print(f"Names starting 'd': {[e.name for e in registry.find_by_name('d')]}")
+    print(f"Night shift: {[e.name for e in registry.by_shift(2)]}")
+    print(f"Production workers (incl. team leaders): "
+          f"{sorted(e.name for e in registry.of_type(ProductionWorker))}")
+
+    # Setter changes keep the indexes current
+    carlos = registry[2001]
+    carlos.shift = 2
+    carlos.name = "Dario Diaz"
+    carlos.employee_number = 2101
+    print(f"\nAfter updates, night shift: {sorted(e.name for e in registry.by_shift(2))}")
+    print(f"Names starting 'da': {[e.name for e in registry.find_by_name('Da')]}")
+    print(f"2001 registered: {2001 in registry}, 2101: {registry[2101].name}")
+    heard = []
+    frank = registry[4001]
+    frank.add_listener(lambda *change: heard.append(change))  # listeners never see a vetoed change
+    try:
+        frank.employee_number = 3001
+    except ValueError as e:
+        print(f"Duplicate rejected: {e} (number stays {frank.employee_number}, "
+              f"listeners notified: {len(heard)})")
+
+    big = EmployeeRegistry(ProductionWorker(f"Worker {i:06d}", i, "01/01/2020",
+                                            1 + i % 2, 20.0) for i in range(200_000))
+    start = time.perf_counter()
+    for i in range(0, 200_000, 7):
+        big.get(i)
+    lookups = time.perf_counter() - start
+    start = time.perf_counter()
+    matches = big.find_by_name("Worker 1234")
+    prefix = time.perf_counter() - start
+    print(f"\n200,000 workers: {200_000 // 7 + 1:,} number lookups in {lookups * 1e3:.1f}ms, "
+          f"prefix search found {len(matches)} in {prefix * 1e3:.2f}ms, "
+          f"{len(big.by_shift(2)):,} on nights")
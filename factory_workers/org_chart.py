@@ -0,0 +1,307 @@
+"""
+OrgChart Class - Reporting structure for the Factory Workers hierarchy.
+Shift supervisors manage team leaders, who manage production workers.
+The tree is stored flat: node i has a parent index in an array('l') (-1
+for a root) and cached subtree totals in array('d') columns, so every
+rollup is an O(1) read. Reassigning an employee, or a setter changing
+pay or training hours, updates the cached totals along the ancestor path
+only: O(depth).
+
+Hourly cost uses HOURS_PER_YEAR to put salaried and hourly staff on the
+same footing: a supervisor costs (salary + bonus) / 2080 per hour and a
+team leader's monthly bonus adds bonus * 12 / 2080.
+"""
+
+from array import array
+
+from production_worker import ProductionWorker
+from shift_supervisor import ShiftSupervisor
+from team_leader import TeamLeader
+
+HOURS_PER_YEAR = 2080
+TOTALS = ("headcount", "hourly_cost", "required_hours", "attended_hours",
+          "leaders", "compliant_leaders")
+ROLLUP_FIELDS = {"hourly_pay_rate", "annual_salary", "annual_production_bonus",
+                   "monthly_bonus", "required_training_hours", "attended_training_hours"}
+
+
+def own_totals(employee):
+    """Returns one employee's contribution to each of TOTALS."""
+    if isinstance(employee, TeamLeader):
+        required = employee.required_training_hours
+        attended = employee.attended_training_hours
+        cost = employee.hourly_pay_rate + employee.monthly_bonus * 12 / HOURS_PER_YEAR
+        return (1, cost, required, attended, 1, 1 if attended >= required else 0)
+    if isinstance(employee, ProductionWorker):
+        return (1, employee.hourly_pay_rate, 0, 0, 0, 0)
+    if isinstance(employee, ShiftSupervisor):
+        cost = (employee.annual_salary + employee.annual_production_bonus) / HOURS_PER_YEAR
+        return (1, cost, 0, 0, 0, 0)
+    return (1, 0.0, 0, 0, 0, 0)
+
+
+def _allowed_manager(employee, manager):
+    """Production workers report to team leaders; team leaders to supervisors."""
+    if isinstance(employee, TeamLeader):
+        return isinstance(manager, ShiftSupervisor)
+    if isinstance(employee, ProductionWorker):
+        return isinstance(manager, TeamLeader)
+    return True
+
+
+class OrgChart:
+    """Flattened reporting tree with O(1) subtree rollups."""
+
+    def __init__(self):
+        """
+        Preconditions: None
+        Postconditions: Empty chart
+        """
+        self._parent = array("l")
+        self._employees = []        # node -> employee (None once removed)
+        self._own = []              # node -> own_totals tuple
+        self._totals = {name: array("d") for name in TOTALS}
+        self._node = {}             # employee_number -> node
+        self._children = []         # node -> list of child nodes
+
+    # ---- Building ----
+
+    def add(self, employee, manager_number=None):
+        """
+        Preconditions: employee's number is not in the chart; manager_number
+                       is None (a root) or the number of an allowed manager
+        Postconditions: employee is a leaf under its manager; totals updated
+        """
+        number = employee.employee_number
+        if number in self._node:
+            raise ValueError(f"Employee number {number!r} is already in the chart.")
+        parent = -1 if manager_number is None else self._node_of(manager_number)
+        if parent >= 0 and not _allowed_manager(employee, self._employees[parent]):
+            raise ValueError(f"{type(employee).__name__} cannot report to "
+                             f"{type(self._employees[parent]).__name__}.")
+        node = len(self._parent)
+        self._node[number] = node
+        self._parent.append(-1)
+        self._employees.append(employee)
+        own = own_totals(employee)
+        self._own.append(own)
+        for name, value in zip(TOTALS, own):
+            self._totals[name].append(value)
+        self._children.append([])
+        if parent >= 0:
+            self._attach(node, parent)
+        employee.add_validator(self._check_change)
+        employee.add_listener(self._on_change)
+        return node
+
+    def _node_of(self, employee_number):
+        node = self._node.get(employee_number)
+        if node is None:
+            raise KeyError(f"Employee number {employee_number!r} is not in the chart.")
+        return node
+
+    def _apply(self, node, delta, sign):
+        """Adds sign * delta to the totals of node and every ancestor."""
+        columns = [self._totals[name] for name in TOTALS]
+        parent = self._parent
+        while node >= 0:
+            for column, value in zip(columns, delta):
+                if value:
+                    column[node] += sign * value
+            node = parent[node]
+
+    def _subtree_totals(self, node):
+        return tuple(self._totals[name][node] for name in TOTALS)
+
+    def _attach(self, node, parent):
+        self._parent[node] = parent
+        self._children[parent].append(node)
+        self._apply(parent, self._subtree_totals(node), 1)
+
+    def _detach(self, node):
+        parent = self._parent[node]
+        if parent >= 0:
+            self._apply(parent, self._subtree_totals(node), -1)
+            self._children[parent].remove(node)
+            self._parent[node] = -1
+
+    # ---- Changes ----
+
+    def reassign(self, employee_number, manager_number):
+        """
+        Preconditions: both numbers are in the chart (manager_number may be
+                       None to make a root) and the move creates no cycle
+        Postconditions: Subtree moved; totals fixed along both ancestor paths
+        """
+        node = self._node_of(employee_number)
+        if manager_number is None:
+            self._detach(node)
+            return
+        parent = self._node_of(manager_number)
+        employee, manager = self._employees[node], self._employees[parent]
+        if not _allowed_manager(employee, manager):
+            raise ValueError(f"{type(employee).__name__} cannot report to "
+                             f"{type(manager).__name__}.")
+        ancestor = parent
+        while ancestor >= 0:
+            if ancestor == node:
+                raise ValueError("Reassignment would create a reporting cycle.")
+            ancestor = self._parent[ancestor]
+        self._detach(node)
+        self._attach(node, parent)
+
+    def remove(self, employee_number):
+        """Removes an employee; their direct reports move up to their manager."""
+        node = self._node_of(employee_number)
+        parent = self._parent[node]
+        for child in list(self._children[node]):
+            self._detach(child)
+            if parent >= 0:
+                self._attach(child, parent)
+        self._detach(node)
+        employee = self._employees[node]
+        employee.remove_validator(self._check_change)
+        employee.remove_listener(self._on_change)
+        del self._node[employee_number]
+        self._employees[node] = None
+        return employee
+
+    def _check_change(self, employee, field, old, new):
+        """Validator: vetoes a number already used by another employee in the chart."""
+        if field == "employee_number" and new in self._node:
+            raise ValueError(f"Employee number {new!r} is already in the chart.")
+
+    def _on_change(self, employee, field, old, new):
+        """Listener: keeps node keys and cached totals in step with setters."""
+        if field == "employee_number":
+            self._node[new] = self._node.pop(old)
+        elif field in ROLLUP_FIELDS:
+            node = self._node[employee.employee_number]
+            own = own_totals(employee)
+            delta = tuple(n - o for n, o in zip(own, self._own[node]))
+            self._own[node] = own
+            self._apply(node, delta, 1)
+
+    # ---- Queries ----
+
+    def rollup(self, employee_number):
+        """
+        Preconditions: employee_number is in the chart
+        Postconditions: Returns totals for the employee and everyone below:
+                        headcount, hourly_cost, annual_cost, training hours,
+                        leaders, compliant_leaders and compliance (fraction
+                        of team leaders meeting their requirement, or None)
+        """
+        node = self._node_of(employee_number)
+        totals = {name: self._totals[name][node] for name in TOTALS}
+        for name in ("headcount", "leaders", "compliant_leaders"):
+            totals[name] = int(totals[name])
+        totals["annual_cost"] = totals["hourly_cost"] * HOURS_PER_YEAR
+        totals["compliance"] = (totals["compliant_leaders"] / totals["leaders"]
+                                if totals["leaders"] else None)
+        return totals
+
+    def manager_of(self, employee_number):
+        """Returns the employee's manager, or None for a root."""
+        parent = self._parent[self._node_of(employee_number)]
+        return None if parent < 0 else self._employees[parent]
+
+    def reports(self, employee_number):
+        """Returns the employee's direct reports."""
+        return [self._employees[c] for c in self._children[self._node_of(employee_number)]]
+
+    def chain_of_command(self, employee_number):
+        """Returns the managers above an employee, nearest first."""
+        chain = []
+        node = self._parent[self._node_of(employee_number)]
+        while node >= 0:
+            chain.append(self._employees[node])
+            node = self._parent[node]
+        return chain
+
+    def roots(self):
+        """Returns every employee without a manager."""
+        return [e for node, e in enumerate(self._employees)
+                if e is not None and self._parent[node] < 0]
+
+    def __len__(self):
+        return len(self._node)
+
+    def __contains__(self, employee_number):
+        return employee_number in self._node
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"OrgChart({len(self)} employees, {len(self.roots())} roots)"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 50)
+    print("OrgChart Class - Unit Tests")
+    print("=" * 50)
+
+    chart = OrgChart()
+    chart.add(ShiftSupervisor("Emily Carter", 3001, "05/01/2018", 65000.00, 5000.00))
+    chart.add(TeamLeader("Frank Miller", 4001, "03/15/2017", 1, 25.00, 500.00, 40, 35), 3001)
+    chart.add(TeamLeader("Grace Hopper", 4002, "02/01/2016", 2, 27.00, 450.00, 30, 32), 3001)
+    chart.add(ProductionWorker("Carlos Diaz", 2001, "01/10/2021", 1, 18.50), 4001)
+    chart.add(ProductionWorker("Diana Prince", 2002, "07/22/2022", 2, 22.75), 4002)
+    print(f"\n{chart!r}")
+    top = chart.rollup(3001)
+    print(f"Emily's org: headcount={top['headcount']}, hourly=${top['hourly_cost']:.2f}, "
+          f"annual=${top['annual_cost']:,.0f}, compliance={top['compliance']:.0%}")
+
+    chart.reassign(2002, 4001)
+    print(f"After moving Diana to Frank: Frank headcount={chart.rollup(4001)['headcount']}, "
+          f"Grace headcount={chart.rollup(4002)['headcount']}")
+    frank = chart.reports(3001)[0]
+    frank.attended_training_hours = 40
+    print(f"Frank completes training: compliance={chart.rollup(3001)['compliance']:.0%}")
+    print(f"Chain of command for Diana: {[e.name for e in chart.chain_of_command(2002)]}")
+    try:
+        chart.reassign(4001, 2001)
+    except ValueError as e:
+        print(f"Rejected: {e}")
+    try:
+        frank.employee_number = 4002
+    except ValueError as e:
+        print(f"Rejected: {e} (Grace still found: {chart.rollup(4002)['headcount'] == 1})")
+
+    # Check the cached totals against a full recount
+    rng = random.Random(3)
+    big = OrgChart()
+    number = 0
+    supervisors, leaders = [], []
+    for _ in range(50):
+        number += 1
+        big.add(ShiftSupervisor("S", number, "01/01/2015", 70000.0, 5000.0))
+        supervisors.append(number)
+    for _ in range(2_000):
+        number += 1
+        big.add(TeamLeader("L", number, "01/01/2016", 1, 25.0, 400.0, 40,
+                           rng.randint(20, 45)), rng.choice(supervisors))
+        leaders.append(number)
+    for _ in range(100_000):
+        number += 1
+        big.add(ProductionWorker("W", number, "01/01/2020", 1, rng.uniform(15, 30)),
+                rng.choice(leaders))
+    start = time.perf_counter()
+    for _ in range(10_000):
+        big.reassign(rng.choice(leaders), rng.choice(supervisors))
+    elapsed = time.perf_counter() - start
+
+    def recount(node):
+        totals = list(big._own[node])
+        for child in big._children[node]:
+            for i, value in enumerate(recount(child)):
+                totals[i] += value
+        return totals
+
+    exact = all(abs(a - b) < 1e-6 for s in supervisors
+                for a, b in zip(recount(big._node[s]), big._subtree_totals(big._node[s])))
+    print(f"\n{big!r}: 10,000 reassignments in {elapsed * 1e3:.1f}ms, "
+          f"totals match recount: {exact}")
@@ -4,11 +4,14 @@ Adds shift (1=day, 2=night) and hourly pay rate.
 """
 
 from employee import Employee
+from validators import check_positive, check_shift
 
 
 class ProductionWorker(Employee):
     """Represents a production worker on the factory floor."""
 
+    __slots__ = ("_shift", "_hourly_pay_rate")
+
     def __init__(self, name, employee_number, hire_date, shift, hourly_pay_rate):
         """
         Preconditions: Valid Employee args; shift is 1 (day) or 2 (night);
@@ -28,10 +31,11 @@ class ProductionWorker(Employee):
     @shift.setter
     def shift(self, value):
         # Precondition: value must be 1 or 2
-        if value in (1, 2):
-            self._shift = value
-        else:
-            raise ValueError("Shift must be 1 (day) or 2 (night).")
+        check_shift(value)
+        old = self._shift
+        self._validate_change("shift", old, value)
+        self._shift = value
+        self._changed("shift", old, value)
 
     @property
     def hourly_pay_rate(self):
@@ -40,10 +44,11 @@ class ProductionWorker(Employee):
     @hourly_pay_rate.setter
     def hourly_pay_rate(self, value):
         # Precondition: value must be positive
-        if value > 0:
-            self._hourly_pay_rate = value
-        else:
-            raise ValueError("Hourly pay rate must be positive.")
+        check_positive(value, "Hourly pay rate")
+        old = self._hourly_pay_rate
+        self._validate_change("hourly_pay_rate", old, value)
+        self._hourly_pay_rate = value
+        self._changed("hourly_pay_rate", old, value)
 
     # ---- Display ----
 
@@ -59,12 +64,12 @@ class ProductionWorker(Employee):
         return (f"ProductionWorker({self._name!r}, {self._employee_number!r}, "
                 f"{self._hire_date!r}, {self._shift!r}, {self._hourly_pay_rate!r})")
 
-    def print_production_worker(self):
+    def print_production_worker(self, file=None):
         """
-        Preconditions: None
+        Preconditions: file is a writable text stream, or None for the console
         Postconditions: Displays employee info plus shift and pay rate
         """
-        print(self.__str__())
+        print(self.__str__(), file=file)
 
 
 # ---- Unit Tests ----
@@ -0,0 +1,247 @@
+"""
+ReportWriter Class - Buffered roster output for the Factory Workers hierarchy.
+Renders whole rosters to any text stream in one of four forms:
+
+    text  : the same blocks print_employee() and friends display
+    table : one fixed-width line per employee
+    csv   : a header row, then one row per employee (roster_file columns)
+    json  : a JSON array of objects with "kind" and the kind's fields
+
+Each employee type gets a precompiled template (a format string plus an
+attrgetter over its fields) the first time it is seen, so a row costs one
+attribute fetch and one format call instead of a chain of super().__str__()
+calls. Rendered rows collect in memory and reach the stream in one write
+per flush_every rows. Roster row views are accepted as well as objects.
+"""
+
+import csv
+import json
+import sys
+from operator import attrgetter
+
+from roster import FIELDS, VIEWS, kind_code
+from roster_file import CSV_COLUMNS, KIND_NAMES
+
+FORMATS = ("text", "table", "csv", "json")
+
+# Detail templates, matching each class's __str__ field for field
+_EMPLOYEE_TEXT = "  Name: {0}\n  Employee Number: {1}\n  Hire Date: {2}"
+_WORKER_TEXT = _EMPLOYEE_TEXT + "\n  Shift: {3}\n  Hourly Pay Rate: ${4:.2f}"
+TEXT_TEMPLATES = (
+    _EMPLOYEE_TEXT,
+    _WORKER_TEXT,
+    _EMPLOYEE_TEXT + "\n  Annual Salary: ${3:,.2f}\n  Annual Production Bonus: ${4:,.2f}",
+    _WORKER_TEXT + ("\n  Monthly Bonus: ${5:,.2f}\n  Required Training Hours: {6}"
+                    "\n  Attended Training Hours: {7}"),
+)
+
+# Table columns: (heading, width), in CSV_COLUMNS order
+TABLE_COLUMNS = (
+    ("Kind", 16), ("Name", 24), ("Number", 8), ("Hire Date", 14), ("Shift", 5),
+    ("Rate", 8), ("Salary", 12), ("Bonus", 10), ("Monthly", 9), ("Req", 5), ("Att", 5),
+)
+_TABLE_CELLS = {
+    "name": "{:<24.24}", "employee_number": "{!s:>8}", "hire_date": "{!s:<14.14}",
+    "shift": "{:>5}", "hourly_pay_rate": "{:>8.2f}", "annual_salary": "{:>12,.2f}",
+    "annual_production_bonus": "{:>10,.2f}", "monthly_bonus": "{:>9,.2f}",
+    "required_training_hours": "{:>5}", "attended_training_hours": "{:>5}",
+}
+_WIDTHS = dict(zip(CSV_COLUMNS[1:], (width for _, width in TABLE_COLUMNS[1:])))
+TABLE_HEADER = " ".join(f"{heading:<{width}}" for heading, width in TABLE_COLUMNS)
+
+
+def _table_template(kind):
+    """Builds one kind's row format: its own cells, blanks for the rest."""
+    cells = [f"{KIND_NAMES[kind]:<16}"]
+    position = 0
+    for column in CSV_COLUMNS[1:]:
+        if column in FIELDS[kind]:
+            cells.append(_TABLE_CELLS[column].replace("{", "{" + str(position), 1))
+            position += 1
+        else:
+            cells.append(" " * _WIDTHS[column])
+    return " ".join(cells)
+
+
+class _Template:
+    """One employee type's field getter plus its renderer for a format."""
+
+    __slots__ = ("kind", "values", "render")
+
+    def __init__(self, kind, form, view=False):
+        fields = FIELDS[kind]
+        self.kind = kind
+        # Objects are read straight from their slots; row views through properties
+        self.values = attrgetter(*(fields if view else ["_" + f for f in fields]))
+        if form == "text":
+            fmt = TEXT_TEMPLATES[kind].format
+            if "shift" in fields:
+                at = fields.index("shift")
+                self.render = lambda v: fmt(*v[:at], "Day" if v[at] == 1 else "Night",
+                                            *v[at + 1:])
+            else:
+                self.render = lambda v: fmt(*v)
+        elif form == "table":
+            fmt = _table_template(kind).format
+            self.render = lambda v: fmt(*v)
+        elif form == "csv":
+            slots = [fields.index(c) if c in fields else None for c in CSV_COLUMNS[1:]]
+            name = KIND_NAMES[kind]
+            self.render = lambda v: [name] + ["" if i is None else v[i] for i in slots]
+        else:
+            encode = json.JSONEncoder(ensure_ascii=False).encode
+            keys = ("kind",) + fields
+            name = KIND_NAMES[kind]
+            self.render = lambda v: encode(dict(zip(keys, (name,) + v)))
+
+
+class ReportWriter:
+    """Streams employees to a text stream as text blocks, a table, CSV or JSON."""
+
+    def __init__(self, file=None, form="text", flush_every=1000):
+        """
+        Preconditions: file is a writable text stream (default sys.stdout);
+                       form is one of FORMATS; flush_every is a positive int
+        Postconditions: Writer ready; headers are written with the first row
+        """
+        if form not in FORMATS:
+            raise ValueError(f"Format must be one of {', '.join(FORMATS)}.")
+        if flush_every <= 0:
+            raise ValueError("flush_every must be positive.")
+        self._file = sys.stdout if file is None else file
+        self._form = form
+        self._flush_every = flush_every
+        self._pending = []
+        self._templates = {}  # type -> _Template
+        self._csv = csv.writer(self) if form == "csv" else None
+        self.count = 0
+
+    def _template(self, employee):
+        cls = type(employee)
+        if cls in VIEWS:
+            template = _Template(VIEWS.index(cls), self._form, view=True)
+        else:
+            template = _Template(kind_code(employee), self._form)
+        self._templates[cls] = template
+        return template
+
+    def write(self, text):
+        """Queues raw text (also the sink for the csv module)."""
+        self._pending.append(text)
+
+    def _start(self):
+        if self._form == "table":
+            self.write(TABLE_HEADER + "\n" + "-" * len(TABLE_HEADER) + "\n")
+        elif self._form == "csv":
+            self._csv.writerow(CSV_COLUMNS)
+        elif self._form == "json":
+            self.write("[\n")
+
+    def write_employee(self, employee):
+        """
+        Preconditions: employee is an Employee-hierarchy object or Roster row view
+        Postconditions: One rendered record queued; flushed every flush_every rows
+        """
+        template = self._templates.get(type(employee)) or self._template(employee)
+        if self.count == 0:
+            self._start()
+        text = template.render(template.values(employee))
+        if self._csv is not None:
+            self._csv.writerow(text)
+        elif self._form == "json":
+            self.write(text if self.count == 0 else ",\n" + text)
+        else:
+            self.write(text + "\n")
+        self.count += 1
+        if self.count % self._flush_every == 0:
+            self.flush()
+
+    def write_all(self, employees):
+        """Writes every employee (a list, generator or Roster); returns the count."""
+        before = self.count
+        for employee in employees:
+            self.write_employee(employee)
+        return self.count - before
+
+    def flush(self):
+        """Writes queued output to the stream in one call."""
+        if self._pending:
+            self._file.write("".join(self._pending))
+            self._pending.clear()
+
+    def close(self):
+        """Finishes the document (JSON closing bracket) and flushes; keeps the stream open."""
+        if self._form == "json":
+            self.write("\n]\n" if self.count else "[]\n")
+        self.flush()
+        self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"ReportWriter(form={self._form!r}, {self.count} rows)"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import io
+    import os
+    import time
+
+    from employee import Employee
+    from production_worker import ProductionWorker
+    from roster import Roster
+    from shift_supervisor import ShiftSupervisor
+    from team_leader import TeamLeader
+
+    print("=" * 50)
+    print("ReportWriter Class - Unit Tests")
+    print("=" * 50)
+
+    staff = [
+        Employee("Alice Johnson", 1001, "03/15/2020"),
+        ProductionWorker("Carlos Diaz", 2001, "01/10/2021", 1, 18.50),
+        ShiftSupervisor("Emily Carter", 3001, "05/01/2018", 65000.00, 5000.00),
+        TeamLeader("Frank Miller", 4001, "03/15/2017", 2, 25.00, 500.00, 40, 35),
+    ]
+    for form in ("table", "csv", "json"):
+        print(f"\n--- {form} ---")
+        with ReportWriter(form=form) as writer:
+            writer.write_all(staff)
+
+    text = io.StringIO()
+    with ReportWriter(text) as writer:
+        writer.write_all(staff)
+    printed = io.StringIO()
+    for e in staff:
+        print(e, file=printed)
+    print(f"\ntext form matches print_*() output: {text.getvalue() == printed.getvalue()}")
+    staff[3].print_team_leader(file=printed)
+
+    # A 100k-employee directory, to /dev/null
+    n = 100_000
+    big = [TeamLeader(f"Leader {i}", i, "03/15/2017", 1 + i % 2, 25.0, 500.0, 40, 35)
+           if i % 10 == 0 else ProductionWorker(f"Worker {i}", i, "01/10/2021", 1 + i % 2, 18.5)
+           for i in range(n)]
+    # Line-buffered, as stdout is on a terminal: one write per printed line
+    with open(os.devnull, "w", buffering=1) as sink:
+        start = time.perf_counter()
+        for e in big:
+            e.print_production_worker(file=sink)
+        per_call = time.perf_counter() - start
+        print(f"\n{n:,} employees via print_*(file=...), line-buffered: {per_call:.2f}s")
+        for form in FORMATS:
+            start = time.perf_counter()
+            with ReportWriter(sink, form) as writer:
+                writer.write_all(big)
+            print(f"{n:,} employees as {form}: {time.perf_counter() - start:.2f}s")
+        roster = Roster.from_employees(big)
+        start = time.perf_counter()
+        with ReportWriter(sink, "table") as writer:
+            writer.write_all(roster)
+        print(f"{n:,} Roster rows as table: {time.perf_counter() - start:.2f}s")
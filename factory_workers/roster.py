@@ -0,0 +1,331 @@
+"""
+Roster Class - Columnar storage for a whole workforce.
+Keeps every field of the Employee hierarchy in typed columns
+(array('b'/'I'/'l'/'d')) instead of one object per employee. Names and
+hire dates are dictionary-encoded: each distinct value is stored once and
+rows hold a 4-byte code. Indexing a Roster returns a lightweight row view
+with the same properties (and setter validation) as the matching class.
+
+Numeric fields come back as floats (training hours included); fields that
+do not apply to a row's type are not present on its view.
+"""
+
+from array import array
+
+from employee import Employee
+from production_worker import ProductionWorker
+from shift_supervisor import ShiftSupervisor
+from team_leader import TeamLeader
+from validators import check_field, check_hire_date
+
+EMPLOYEE, PRODUCTION_WORKER, SHIFT_SUPERVISOR, TEAM_LEADER = 0, 1, 2, 3
+CLASSES = (Employee, ProductionWorker, ShiftSupervisor, TeamLeader)
+
+BASE_FIELDS = ("name", "employee_number", "hire_date")
+WORKER_FIELDS = BASE_FIELDS + ("shift", "hourly_pay_rate")
+# Constructor argument order for each kind code
+FIELDS = {
+    EMPLOYEE: BASE_FIELDS,
+    PRODUCTION_WORKER: WORKER_FIELDS,
+    SHIFT_SUPERVISOR: BASE_FIELDS + ("annual_salary", "annual_production_bonus"),
+    TEAM_LEADER: WORKER_FIELDS + ("monthly_bonus", "required_training_hours",
+                                  "attended_training_hours"),
+}
+
+# Numeric field -> column attribute (0 where the field does not apply)
+_NUMERIC = {
+    "shift": "_shift",
+    "hourly_pay_rate": "_hourly_pay_rate",
+    "annual_salary": "_annual_salary",
+    "annual_production_bonus": "_annual_production_bonus",
+    "monthly_bonus": "_monthly_bonus",
+    "required_training_hours": "_required_training_hours",
+    "attended_training_hours": "_attended_training_hours",
+}
+
+
+def kind_code(employee):
+    """Returns the kind code for an employee object (subclasses included)."""
+    if isinstance(employee, TeamLeader):  # before ProductionWorker
+        return TEAM_LEADER
+    if isinstance(employee, ProductionWorker):
+        return PRODUCTION_WORKER
+    if isinstance(employee, ShiftSupervisor):
+        return SHIFT_SUPERVISOR
+    if isinstance(employee, Employee):
+        return EMPLOYEE
+    raise TypeError(f"Not an employee: {type(employee).__name__}")
+
+
+# ---- Row Views ----
+
+class _Field:
+    """Descriptor: a view property backed by one Roster column."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view._roster.get(view._row, self.name)
+
+    def __set__(self, view, value):
+        view._roster.set(view._row, self.name, value)
+
+
+class EmployeeRow:
+    """Row view with the Employee property API."""
+
+    __slots__ = ("_roster", "_row")
+
+    name = _Field()
+    employee_number = _Field()
+    hire_date = _Field()
+
+    def __init__(self, roster, row):
+        self._roster = roster
+        self._row = row
+
+    @property
+    def hire_ordinal(self):
+        ordinal = self._roster._hire_ordinal[self._row]
+        return ordinal or None
+
+    @property
+    def row(self):
+        """Index of this view's row in the roster."""
+        return self._row
+
+    def to_employee(self):
+        """Returns a standalone object of the matching class."""
+        return self._roster.employee_at(self._row)
+
+    def __str__(self):
+        return str(self.to_employee())
+
+    def __repr__(self):
+        return f"{type(self).__name__}(row={self._row}, name={self.name!r})"
+
+
+class ProductionWorkerRow(EmployeeRow):
+    __slots__ = ()
+    shift = _Field()
+    hourly_pay_rate = _Field()
+
+
+class ShiftSupervisorRow(EmployeeRow):
+    __slots__ = ()
+    annual_salary = _Field()
+    annual_production_bonus = _Field()
+
+
+class TeamLeaderRow(ProductionWorkerRow):
+    __slots__ = ()
+    monthly_bonus = _Field()
+    required_training_hours = _Field()
+    attended_training_hours = _Field()
+
+
+VIEWS = (EmployeeRow, ProductionWorkerRow, ShiftSupervisorRow, TeamLeaderRow)
+
+
+# ---- Roster ----
+
+class Roster:
+    """Struct-of-arrays container for Employee-hierarchy data."""
+
+    def __init__(self):
+        """
+        Preconditions: None
+        Postconditions: Empty roster
+        """
+        self._kind = array("b")
+        self._name = array("I")           # codes into _values
+        self._employee_number = []        # int or str, as given
+        self._hire_date = array("I")      # codes into _values
+        self._hire_ordinal = array("l")   # 0 if the date did not parse
+        for column in _NUMERIC.values():
+            setattr(self, column, array("d"))
+        self._values = []                 # distinct names and hire dates
+        self._codes = {}                  # value -> index in _values
+        self._rows = None                 # employee_number -> row, built on demand
+
+    def _encode(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    # ---- Adding Rows ----
+
+    def append(self, employee):
+        """
+        Preconditions: employee is an Employee-hierarchy object
+        Postconditions: Its fields are copied into a new row
+        """
+        kind = kind_code(employee)
+        self._kind.append(kind)
+        self._name.append(self._encode(employee._name))
+        self._employee_number.append(employee._employee_number)
+        self._hire_date.append(self._encode(employee._hire_date))
+        self._hire_ordinal.append(employee._hire_ordinal or 0)
+        fields = FIELDS[kind]
+        for field, column in _NUMERIC.items():
+            value = getattr(employee, "_" + field) if field in fields else 0
+            getattr(self, column).append(value)
+        if self._rows is not None:
+            self._rows.setdefault(employee._employee_number, len(self._kind) - 1)
+
+    def extend(self, employees):
+        """Appends every employee from an iterable."""
+        for employee in employees:
+            self.append(employee)
+
+    @classmethod
+    def from_employees(cls, employees):
+        """Returns a new Roster holding the employees' data."""
+        roster = cls()
+        roster.extend(employees)
+        return roster
+
+    # ---- Field Access ----
+
+    def get(self, row, field):
+        """Returns one field of one row (decoded)."""
+        if field == "name":
+            return self._values[self._name[row]]
+        if field == "hire_date":
+            return self._values[self._hire_date[row]]
+        if field == "employee_number":
+            return self._employee_number[row]
+        if field not in FIELDS[self._kind[row]]:
+            raise AttributeError(f"Row {row} has no field {field!r}.")
+        value = getattr(self, _NUMERIC[field])[row]
+        return int(value) if field == "shift" else value
+
+    def set(self, row, field, value):
+        """
+        Preconditions: field applies to the row's employee type
+        Postconditions: Value stored after the same checks as the setter
+        """
+        if field not in FIELDS[self._kind[row]]:
+            raise AttributeError(f"Row {row} has no field {field!r}.")
+        check_field(field, value)
+        if field == "name":
+            self._name[row] = self._encode(value)
+        elif field == "hire_date":
+            self._hire_ordinal[row] = check_hire_date(value)
+            self._hire_date[row] = self._encode(value)
+        elif field == "employee_number":
+            self._employee_number[row] = value
+            self._rows = None
+        else:
+            getattr(self, _NUMERIC[field])[row] = value
+
+    def column(self, field):
+        """
+        Preconditions: field is "kind", "employee_number" or a numeric field
+        Postconditions: Returns the raw column, not a copy: kind codes,
+                        employee numbers as given, or the numeric values
+                        (0 where the field does not apply)
+        """
+        if field == "kind":
+            return self._kind
+        if field == "employee_number":
+            return self._employee_number
+        return getattr(self, _NUMERIC[field])
+
+    # ---- Rows ----
+
+    def __len__(self):
+        return len(self._kind)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self._kind)
+        if not 0 <= row < len(self._kind):
+            raise IndexError("Roster index out of range.")
+        return VIEWS[self._kind[row]](self, row)
+
+    def __iter__(self):
+        views = VIEWS
+        for row, kind in enumerate(self._kind):
+            yield views[kind](self, row)
+
+    def find(self, employee_number):
+        """Returns the view for an employee number (first match), or None."""
+        if self._rows is None:
+            self._rows = {}
+            for row, number in enumerate(self._employee_number):
+                self._rows.setdefault(number, row)
+        row = self._rows.get(employee_number)
+        return None if row is None else self[row]
+
+    def employee_at(self, row):
+        """Returns a standalone Employee-hierarchy object for a row."""
+        kind = self._kind[row]
+        return CLASSES[kind](*(self.get(row, field) for field in FIELDS[kind]))
+
+    def to_employees(self):
+        """Yields a standalone object for every row."""
+        for row in range(len(self._kind)):
+            yield self.employee_at(row)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        counts = [0] * len(CLASSES)
+        for kind in self._kind:
+            counts[kind] += 1
+        parts = ", ".join(f"{cls.__name__}={n}" for cls, n in zip(CLASSES, counts) if n)
+        return f"Roster({len(self)} rows: {parts})" if parts else "Roster(0 rows)"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import gc
+    import tracemalloc
+
+    print("=" * 50)
+    print("Roster Class - Unit Tests")
+    print("=" * 50)
+
+    staff = [
+        Employee("Alice Johnson", 1001, "03/15/2020"),
+        ProductionWorker("Carlos Diaz", 2001, "01/10/2021", 1, 18.50),
+        ShiftSupervisor("Emily Carter", 3001, "05/01/2018", 65000.00, 5000.00),
+        TeamLeader("Frank Miller", 4001, "03/15/2017", 1, 25.00, 500.00, 40, 35),
+    ]
+    roster = Roster.from_employees(staff)
+    print(f"\n{roster!r}")
+    for view in roster:
+        print(f"  {view!r}")
+    frank = roster.find(4001)
+    print(f"\nfind(4001).hourly_pay_rate = {frank.hourly_pay_rate}, shift = {frank.shift}")
+    frank.attended_training_hours = 40
+    frank.shift = 2
+    print(frank)
+    try:
+        frank.monthly_bonus = -5
+    except ValueError as e:
+        print(f"Setter rule applied: {e}")
+    print(f"Supervisor view has shift: {hasattr(roster[2], 'shift')}")
+
+    # Memory: objects vs columns for the same team leaders
+    def traced(build):
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return (after - before) / len(kept)
+
+    n = 100_000
+    make = lambda: [TeamLeader(f"Leader {i % 500}", i, f"0{1 + i % 9}/15/2019", 1 + i % 2,
+                               25.0, 500.0, 40, 35) for i in range(n)]
+    leaders = make()
+    per_object = traced(make)
+    per_row = traced(lambda: Roster.from_employees(leaders))
+    print(f"\n{n:,} team leaders: {per_object:.0f} bytes/object vs {per_row:.0f} bytes/row")
@@ -0,0 +1,510 @@
+"""
+Factory Workers - Roster File Formats (roster_file.py)
+Streams Employee-hierarchy records to and from three formats:
+
+CSV (.csv): a header row, then one row per employee; "kind" is the class
+name and fields that do not apply to that kind are left empty.
+
+JSON Lines (.jsonl): one object per line with "kind" and the kind's
+fields; tuple hire dates are written as [month, day, year].
+
+Binary (.emp): variable-length packed rows, each starting with a type tag,
+followed by an offsets footer so a memory-mapped reopen can seek straight
+to any row.
+
+    header  : magic b"EMPF", version (u16), reserved (u16), row count (u64)
+    row     : kind (u8), then
+              employee number : 0 (u8) + i64, or 1 (u8) + u16 length + UTF-8
+              name            : u16 length + UTF-8
+              hire date       : 0 (u8) + u16 length + UTF-8, or
+                                1 (u8) + month, day, year (3 x i32)
+              kind fields     : shift (u8) and f64s in constructor order
+    offsets : one u64 per row (byte offset of the row)
+    trailer : offsets position (u64), row count (u64), magic b"EMPE"
+
+Every reader validates rows with the setters' rules. Pass a list as
+`errors` to collect (line or row number, message) pairs and skip bad rows;
+without it the first bad row raises ValueError/TypeError. Memory stays
+bounded by one row (the binary writer also keeps 8 bytes per row for the
+offsets footer).
+"""
+
+import csv
+import json
+import mmap
+import struct
+from array import array
+
+from roster import CLASSES, FIELDS, Roster, kind_code
+from validators import check_field
+
+MAGIC = b"EMPF"
+TRAILER_MAGIC = b"EMPE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+TRAILER = struct.Struct("<QQ4s")
+TAG = struct.Struct("<B")
+LENGTH = struct.Struct("<H")
+INT_NUMBER = struct.Struct("<q")
+DATE_TUPLE = struct.Struct("<iii")
+SHIFT = struct.Struct("<B")
+
+KIND_NAMES = tuple(cls.__name__ for cls in CLASSES)
+KIND_BY_NAME = {name: code for code, name in enumerate(KIND_NAMES)}
+CSV_COLUMNS = ("kind", "name", "employee_number", "hire_date", "shift", "hourly_pay_rate",
+               "annual_salary", "annual_production_bonus", "monthly_bonus",
+               "required_training_hours", "attended_training_hours")
+INT_FIELDS = {"shift"}
+FLOAT_FIELDS = {"hourly_pay_rate", "annual_salary", "annual_production_bonus",
+                "monthly_bonus", "required_training_hours", "attended_training_hours"}
+
+
+def _iter_employees(employees):
+    return employees.to_employees() if isinstance(employees, Roster) else employees
+
+
+def to_record(employee):
+    """Returns {"kind": class name, field: value, ...} for an employee."""
+    kind = kind_code(employee)
+    record = {"kind": KIND_NAMES[kind]}
+    for field in FIELDS[kind]:
+        record[field] = getattr(employee, field)
+    return record
+
+
+def from_record(record):
+    """
+    Preconditions: record maps "kind" and that kind's fields to values
+    Postconditions: Returns the employee object; raises ValueError/TypeError
+                    with the setter's message for the first bad field
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"Record must be an object of fields, not {type(record).__name__}.")
+    kind = KIND_BY_NAME.get(record.get("kind"))
+    if kind is None:
+        raise ValueError(f"Unknown employee kind {record.get('kind')!r}.")
+    values = []
+    for field in FIELDS[kind]:
+        if field not in record:
+            raise ValueError(f"Missing field {field!r}.")
+        value = record[field]
+        check_field(field, value)
+        values.append(value)
+    return CLASSES[kind](*values)
+
+
+def _rows(records, errors, label="Line", build=from_record):
+    """Builds employees from (position, record) pairs, collecting errors."""
+    for position, record in records:
+        try:
+            yield build(record)
+        except (TypeError, ValueError) as e:
+            if errors is None:
+                raise type(e)(f"{label} {position}: {e}") from None
+            errors.append((position, str(e)))
+
+
+# ---- CSV ----
+
+def write_csv(path, employees):
+    """
+    Preconditions: employees is an iterable of employees or a Roster
+    Postconditions: Writes a header and one row per employee; returns the count
+    """
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for employee in _iter_employees(employees):
+            record = to_record(employee)
+            writer.writerow([record.get(column, "") for column in CSV_COLUMNS])
+            count += 1
+    return count
+
+
+def parse_employee_number(text):
+    """
+    Preconditions: text is an employee number as written in a file
+    Postconditions: Returns an int for canonical digits, else the string
+                    unchanged (so "007" stays a string)
+    """
+    try:
+        number = int(text)
+    except ValueError:
+        return text
+    return number if str(number) == text else text
+
+
+def _parse_csv_value(field, text):
+    """Converts one CSV cell to the type its setter expects."""
+    if field == "employee_number":
+        return parse_employee_number(text)
+    if field == "hire_date" and text.startswith("("):
+        try:
+            return tuple(int(part) for part in text.strip("()").split(","))
+        except ValueError:
+            return text  # the setter check reports it
+    if field in INT_FIELDS:
+        try:
+            return int(text)
+        except ValueError:
+            return text  # the setter check reports it
+    if field in FLOAT_FIELDS:
+        try:
+            value = float(text)
+        except ValueError:
+            raise ValueError(f"{field} is not a number: {text!r}") from None
+        return int(value) if value.is_integer() and "." not in text else value
+    return text
+
+
+def _from_csv_row(row):
+    """Converts a csv.DictReader row to a record, then to an employee."""
+    kind = KIND_BY_NAME.get(row.get("kind"))
+    record = {"kind": row.get("kind")}
+    for field in FIELDS[kind] if kind is not None else ():
+        if row.get(field) is not None:
+            record[field] = _parse_csv_value(field, row[field])
+    return from_record(record)
+
+
+def read_csv(path, errors=None):
+    """
+    Preconditions: path is a CSV file written by write_csv (or compatible)
+    Postconditions: Yields one employee per valid row, in file order
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = ((reader.line_num, row) for row in reader)
+        yield from _rows(rows, errors, build=_from_csv_row)
+
+
+# ---- JSON Lines ----
+
+def write_jsonl(path, employees):
+    """
+    Preconditions: employees is an iterable of employees or a Roster
+    Postconditions: Writes one JSON object per line; returns the count
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for employee in _iter_employees(employees):
+            f.write(json.dumps(to_record(employee)))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _iter_jsonl(path, errors):
+    with open(path, encoding="utf-8") as f:
+        for line, text in enumerate(f, 1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError as e:
+                if errors is None:
+                    raise ValueError(f"Line {line}: invalid JSON ({e})") from None
+                errors.append((line, f"invalid JSON ({e})"))
+                continue
+            if isinstance(record, dict) and isinstance(record.get("hire_date"), list):
+                record["hire_date"] = tuple(record["hire_date"])
+            yield line, record
+
+
+def read_jsonl(path, errors=None):
+    """
+    Preconditions: path is a JSON Lines roster file
+    Postconditions: Yields one employee per valid line, in file order
+    """
+    return _rows(_iter_jsonl(path, errors), errors)
+
+
+# ---- Binary ----
+
+def _pack_text(text):
+    data = text.encode("utf-8")
+    return LENGTH.pack(len(data)) + data
+
+
+def _pack_row(employee):
+    kind = kind_code(employee)
+    parts = [TAG.pack(kind)]
+    number = employee.employee_number
+    if isinstance(number, int):
+        parts += [TAG.pack(0), INT_NUMBER.pack(number)]
+    else:
+        parts += [TAG.pack(1), _pack_text(number)]
+    parts.append(_pack_text(employee.name))
+    hire_date = employee.hire_date
+    if isinstance(hire_date, tuple):
+        parts += [TAG.pack(1), DATE_TUPLE.pack(*hire_date)]
+    else:
+        parts += [TAG.pack(0), _pack_text(hire_date)]
+    numeric = FIELDS[kind][3:]
+    if numeric and numeric[0] == "shift":
+        parts.append(SHIFT.pack(employee.shift))
+        numeric = numeric[1:]
+    parts.append(struct.pack(f"<{len(numeric)}d", *(getattr(employee, f) for f in numeric)))
+    return b"".join(parts)
+
+
+class RosterFileWriter:
+    """Streams employees into the packed binary format."""
+
+    def __init__(self, path):
+        """
+        Preconditions: path is a writable file path
+        Postconditions: File created with a placeholder header
+        """
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        self._offsets = array("Q")
+
+    @property
+    def count(self):
+        return len(self._offsets)
+
+    def write(self, employee):
+        """
+        Preconditions: employee is an Employee-hierarchy object or Roster row view
+        Postconditions: One row appended; a field the format cannot hold
+                        raises ValueError and writes nothing
+        """
+        try:
+            row = _pack_row(employee)
+        except struct.error as e:
+            raise ValueError(f"Employee {employee.employee_number!r} cannot be packed: {e}") from None
+        self._offsets.append(self._file.tell())
+        self._file.write(row)
+
+    def write_all(self, employees):
+        """Appends every employee from an iterable or Roster."""
+        for employee in _iter_employees(employees):
+            self.write(employee)
+
+    def close(self):
+        """Writes the offsets footer and trailer and fixes up the header count."""
+        if self._file is None:
+            return
+        f = self._file
+        offsets_position = f.tell()
+        self._offsets.tofile(f)
+        f.write(TRAILER.pack(offsets_position, self.count, TRAILER_MAGIC))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, self.count))
+        f.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _unpack_text(buffer, position):
+    (length,) = LENGTH.unpack_from(buffer, position)
+    position += LENGTH.size
+    return bytes(buffer[position:position + length]).decode("utf-8"), position + length
+
+
+def _unpack_row(buffer, position):
+    """Returns (record dict, position after the row); ValueError if it is corrupt."""
+    try:
+        return _decode_row(buffer, position)
+    except struct.error:
+        raise ValueError("Row is truncated or corrupt.") from None
+
+
+def _decode_row(buffer, position):
+    (kind,) = TAG.unpack_from(buffer, position)
+    if kind >= len(CLASSES):
+        raise ValueError(f"Unknown employee kind code: {kind}")
+    record = {"kind": KIND_NAMES[kind]}
+    (number_tag,) = TAG.unpack_from(buffer, position + 1)
+    position += 2
+    if number_tag == 0:
+        (record["employee_number"],) = INT_NUMBER.unpack_from(buffer, position)
+        position += INT_NUMBER.size
+    else:
+        record["employee_number"], position = _unpack_text(buffer, position)
+    record["name"], position = _unpack_text(buffer, position)
+    (date_tag,) = TAG.unpack_from(buffer, position)
+    position += 1
+    if date_tag == 1:
+        record["hire_date"] = DATE_TUPLE.unpack_from(buffer, position)
+        position += DATE_TUPLE.size
+    else:
+        record["hire_date"], position = _unpack_text(buffer, position)
+    numeric = FIELDS[kind][3:]
+    if numeric and numeric[0] == "shift":
+        (record["shift"],) = SHIFT.unpack_from(buffer, position)
+        position += SHIFT.size
+        numeric = numeric[1:]
+    values = struct.unpack_from(f"<{len(numeric)}d", buffer, position)
+    record.update(zip(numeric, values))
+    return record, position + 8 * len(numeric)
+
+
+def _read_layout(buffer):
+    """Returns (row count, offsets position) after validating header and trailer."""
+    magic, version, _, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a roster file (bad header magic).")
+    if version != VERSION:
+        raise ValueError(f"Unsupported roster file version: {version}")
+    offsets_position, trailer_count, trailer_magic = TRAILER.unpack_from(
+        buffer, len(buffer) - TRAILER.size)
+    if trailer_magic != TRAILER_MAGIC or trailer_count != count:
+        raise ValueError("Roster file is truncated (bad trailer).")
+    return count, offsets_position
+
+
+class MappedRosterFile:
+    """Random access to a binary roster file through mmap."""
+
+    def __init__(self, path):
+        """
+        Preconditions: path is a binary roster file
+        Postconditions: File is memory-mapped; nothing is decoded up front
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count, offsets_position = _read_layout(self._map)
+        self._view = memoryview(self._map)
+        self._offsets = self._view[offsets_position:offsets_position + 8 * self._count].cast("Q")
+
+    def record(self, index):
+        """Returns the decoded record dict for a row."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("MappedRosterFile index out of range.")
+        return _unpack_row(self._map, self._offsets[index])[0]
+
+    def __getitem__(self, index):
+        return from_record(self.record(index))
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self):
+        self._offsets.release()
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"MappedRosterFile(rows={self._count})"
+
+
+def read_binary(path, errors=None):
+    """
+    Preconditions: path is a binary roster file
+    Postconditions: Yields one employee per valid row, in file order
+    """
+    with MappedRosterFile(path) as mapped:
+        # Rows are decoded inside _rows so a corrupt row is reported, not raised
+        indexes = ((index, index) for index in range(len(mapped)))
+        yield from _rows(indexes, errors, label="Row", build=mapped.__getitem__)
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    from employee import Employee
+    from production_worker import ProductionWorker
+    from shift_supervisor import ShiftSupervisor
+    from team_leader import TeamLeader
+
+    print("=" * 50)
+    print("Roster File Formats - Unit Tests")
+    print("=" * 50)
+
+    staff = [
+        Employee("Alice Johnson", 1001, "03/15/2020"),
+        ProductionWorker("Carlos Diaz", "PW-2001", (1, 10, 2021), 1, 18.50),
+        ShiftSupervisor("Emily Carter", 3001, "05/01/2018", 65000.00, 5000.00),
+        TeamLeader("Frank Miller", 4001, "03/15/2017", 2, 25.00, 500.00, 40, 35),
+    ]
+    expected = [to_record(e) for e in staff]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {fmt: os.path.join(tmp, f"staff.{fmt}") for fmt in ("csv", "jsonl", "emp")}
+        write_csv(paths["csv"], staff)
+        write_jsonl(paths["jsonl"], staff)
+        with RosterFileWriter(paths["emp"]) as writer:
+            writer.write_all(staff)
+
+        print()
+        for fmt, reader in (("csv", read_csv), ("jsonl", read_jsonl), ("emp", read_binary)):
+            loaded = [to_record(e) for e in reader(paths[fmt])]
+            print(f"{fmt:>5}: {os.path.getsize(paths[fmt])} bytes, round trip "
+                  f"{loaded == expected}")
+
+        with MappedRosterFile(paths["emp"]) as mapped:
+            print(f"{mapped!r}: [-1] = {mapped[-1]!r}")
+
+        # Bad rows are reported with the setter messages and skipped
+        with open(paths["csv"], "a", encoding="utf-8") as f:
+            f.write("ProductionWorker,Bad Shift,5001,01/01/2020,3,20.0,,,,,\n")
+            f.write("TeamLeader,,5002,01/01/2020,1,20.0,,,100,40,0\n")
+            f.write("ShiftSupervisor,Ann Lee,5003,13/01/2020,,,70000,5000,,,\n")
+            f.write("Robot,R2,5004,01/01/2020,,,,,,,\n")
+        errors = []
+        good = list(read_csv(paths["csv"], errors))
+        print(f"\nCSV with bad rows: {len(good)} loaded")
+        for line, message in errors:
+            print(f"  line {line}: {message}")
+
+        # A number too large for the format is rejected without a stray offset
+        overflow = os.path.join(tmp, "overflow.emp")
+        with RosterFileWriter(overflow) as writer:
+            for number in (1, 2 ** 63, 3):
+                try:
+                    writer.write(Employee(f"Worker {number}", number, "01/10/2021"))
+                except ValueError as e:
+                    print(f"Rejected: {e}")
+        print(f"Read back: {[e.name for e in read_binary(overflow)]}")
+
+        # Valid JSON that is not an object, and a binary row cut short
+        with open(paths["jsonl"], "a", encoding="utf-8") as f:
+            f.write("[1, 2]\n\"x\"\n")
+        errors = []
+        good = list(read_jsonl(paths["jsonl"], errors))
+        print(f"JSONL with non-object lines: {len(good)} loaded, errors {errors}")
+        with open(paths["emp"], "r+b") as f:
+            data = f.read()
+            offsets_position = TRAILER.unpack_from(data, len(data) - TRAILER.size)[0]
+            f.seek(offsets_position + 8 * 2)  # row 2 now runs off the end of the file
+            f.write(struct.pack("<Q", len(data) - 11))
+        errors = []
+        good = list(read_binary(paths["emp"], errors))
+        print(f"Binary with a corrupt row: {len(good)} loaded, errors {errors}")
+
+        big = [ProductionWorker(f"Worker {i}", i, "06/01/2019", 1 + i % 2, 20.0 + i % 10)
+               for i in range(200_000)]
+        for fmt, write, read in (("csv", write_csv, read_csv),
+                                 ("jsonl", write_jsonl, read_jsonl)):
+            start = time.perf_counter()
+            write(paths[fmt], big)
+            count = sum(1 for _ in read(paths[fmt]))
+            print(f"200,000 rows {fmt}: write + read {time.perf_counter() - start:.2f}s ({count})")
+        start = time.perf_counter()
+        with RosterFileWriter(paths["emp"]) as writer:
+            writer.write_all(big)
+        count = sum(1 for _ in read_binary(paths["emp"]))
+        print(f"200,000 rows emp: write + read {time.perf_counter() - start:.2f}s ({count})")
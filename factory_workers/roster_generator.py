@@ -0,0 +1,124 @@
+"""
+RosterGenerator Class - Builds synthetic workforces for benchmarking.
+Produces a reproducible mix of Employees, ProductionWorkers,
+ShiftSupervisors and TeamLeaders with distinct employee numbers, realistic
+names, hire dates in the three accepted string formats, and matching
+per-period timesheets.
+"""
+
+import random
+from datetime import date
+
+from employee import Employee
+from production_worker import ProductionWorker
+from shift_supervisor import ShiftSupervisor
+from team_leader import TeamLeader
+
+
+class RosterGenerator:
+    """Generates reproducible rosters of the Factory Workers hierarchy."""
+
+    CLASSES = (Employee, ProductionWorker, ShiftSupervisor, TeamLeader)
+    # Share of each class in CLASSES order
+    DEFAULT_MIX = (0.02, 0.84, 0.04, 0.10)
+
+    FIRST_NAMES = ["Alice", "Bob", "Carlos", "Diana", "Emily", "Frank", "Grace",
+                   "Hiro", "Ines", "Jamal", "Katya", "Luis", "Mei", "Nora", "Omar"]
+    LAST_NAMES = ["Johnson", "Smith", "Diaz", "Prince", "Carter", "Miller", "Hopper",
+                  "Tanaka", "Silva", "Okafor", "Ivanova", "Garcia", "Chen", "Nolan"]
+
+    def __init__(self, mix=DEFAULT_MIX, first_hire=date(1995, 1, 1),
+                 last_hire=date(2024, 12, 31), seed=None):
+        """
+        Preconditions: mix is four non-negative weights (not all 0) for
+                       CLASSES; first_hire <= last_hire are datetime.date
+        Postconditions: RosterGenerator initialized with its own RNG
+        """
+        if len(mix) != len(self.CLASSES) or min(mix) < 0 or not sum(mix) > 0:
+            raise ValueError("Mix must be four non-negative weights, not all 0.")
+        if first_hire > last_hire:
+            raise ValueError("First hire date must not be after the last.")
+        self.mix = tuple(mix)
+        self.first_hire = first_hire
+        self.last_hire = last_hire
+        self._rng = random.Random(seed)
+
+    def _hire_date(self):
+        rng = self._rng
+        day = date.fromordinal(rng.randint(self.first_hire.toordinal(),
+                                           self.last_hire.toordinal()))
+        style = rng.random()
+        if style < 0.8:
+            return f"{day.month:02d}/{day.day:02d}/{day.year}"
+        if style < 0.95:
+            return day.isoformat()
+        return day.strftime("%B %d, %Y").replace(" 0", " ")
+
+    def make_args(self, index):
+        """
+        Preconditions: index is a non-negative int (the employee number)
+        Postconditions: Returns (class, constructor args) for one employee
+        """
+        rng = self._rng
+        cls = rng.choices(self.CLASSES, self.mix)[0]
+        name = f"{rng.choice(self.FIRST_NAMES)} {rng.choice(self.LAST_NAMES)}"
+        args = (name, index, self._hire_date())
+        if cls is ShiftSupervisor:
+            return cls, args + (round(rng.uniform(55_000, 90_000), 2),
+                                round(rng.uniform(2_000, 10_000), 2))
+        if cls is Employee:
+            return cls, args
+        args += (rng.choice((1, 2)), round(rng.uniform(15, 35), 2))
+        if cls is TeamLeader:
+            required = rng.choice((20, 30, 40))
+            args += (round(rng.uniform(200, 800), 2), required,
+                     max(1, required + rng.randint(-15, 10)))
+        return cls, args
+
+    def generate_args(self, count):
+        """Returns count (class, args) pairs, numbered 1..count."""
+        return [self.make_args(i) for i in range(1, count + 1)]
+
+    def generate(self, count):
+        """
+        Preconditions: count is a non-negative int
+        Postconditions: Returns a list of count employees, numbered 1..count
+        """
+        return [cls(*args) for cls, args in self.generate_args(count)]
+
+    def iter_employees(self, count):
+        """Yields count employees lazily, for rosters too large to hold at once."""
+        for i in range(1, count + 1):
+            cls, args = self.make_args(i)
+            yield cls(*args)
+
+    def timesheet(self, employees, mean_hours=80.0):
+        """Returns {employee_number: hours} for one pay period."""
+        rng = self._rng
+        return {e.employee_number: max(0.0, round(rng.gauss(mean_hours, 8), 2))
+                for e in employees}
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"RosterGenerator({self.mix!r}, {self.first_hire!r}, {self.last_hire!r})"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    from collections import Counter
+
+    print("=" * 50)
+    print("RosterGenerator Class - Unit Tests")
+    print("=" * 50)
+
+    gen = RosterGenerator(seed=42)
+    roster = gen.generate(10_000)
+    counts = Counter(type(e).__name__ for e in roster)
+    print(f"\n{gen!r}")
+    print(f"10,000 employees: {dict(counts)}")
+    print(f"Unparsed hire dates: {sum(e.hire_ordinal is None for e in roster)}")
+    print(f"First: {roster[0]!r}")
+    hours = gen.timesheet(roster)
+    print(f"Mean hours: {sum(hours.values()) / len(hours):.1f}")
+    again = RosterGenerator(seed=42).generate(10_000)
+    print(f"Reproducible: {[repr(e) for e in again] == [repr(e) for e in roster]}")
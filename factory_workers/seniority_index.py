@@ -0,0 +1,216 @@
+"""
+SeniorityIndex Class - Sorted index of employees by hire date.
+Entries are (hire ordinal, employee number) pairs kept in a sorted list,
+so date-range, seniority-order and anniversary queries are a bisect plus
+the k matches: O(log n + k). The index listens to the employees' setters
+and re-files anyone whose hire date or number changes.
+"""
+
+import calendar
+from bisect import bisect_left, insort
+from datetime import date
+
+
+def _number_key(number):
+    """Keeps int and str employee numbers comparable inside the sort keys."""
+    return (type(number).__name__, number)
+
+
+def _years_before(day, years, roll_forward=False):
+    """
+    Returns the date `years` years before day. A Feb 29 day in a common
+    target year becomes Feb 28, or Mar 1 with roll_forward (for window
+    starts, so hires whose anniversary precedes the window stay out).
+    """
+    year = day.year - years
+    if (day.month, day.day) == (2, 29) and not calendar.isleap(year):
+        return date(year, 3, 1) if roll_forward else date(year, 2, 28)
+    return date(year, day.month, day.day)
+
+
+class SeniorityIndex:
+    """Answers hire-date range, seniority and anniversary queries."""
+
+    def __init__(self, employees=()):
+        """
+        Preconditions: employees is an iterable of Employee objects with
+                       distinct employee numbers
+        Postconditions: Every employee with a parseable hire date is indexed
+        """
+        self._entries = []    # sorted (hire ordinal, number key, employee number)
+        self._ordinals = {}   # employee number -> indexed hire ordinal
+        self._employees = {}  # employee number -> employee
+        for employee in employees:
+            self.add(employee)
+
+    # ---- Adding and Removing ----
+
+    def add(self, employee):
+        """
+        Preconditions: employee is an Employee not already in the index
+        Postconditions: employee is indexed (if its hire date parsed) and tracked
+        """
+        number = employee.employee_number
+        if number in self._employees:
+            raise ValueError(f"Employee number {number!r} is already indexed.")
+        self._employees[number] = employee
+        self._file(number, employee.hire_ordinal)
+        employee.add_validator(self._check_change)
+        employee.add_listener(self._on_change)
+
+    def remove(self, employee_number):
+        """Drops an employee from the index and returns it."""
+        employee = self._employees.pop(employee_number)
+        self._unfile(employee_number)
+        employee.remove_validator(self._check_change)
+        employee.remove_listener(self._on_change)
+        return employee
+
+    def _file(self, number, ordinal):
+        if ordinal is not None:
+            insort(self._entries, (ordinal, _number_key(number), number))
+            self._ordinals[number] = ordinal
+
+    def _unfile(self, number):
+        ordinal = self._ordinals.pop(number, None)
+        if ordinal is not None:
+            entry = (ordinal, _number_key(number), number)
+            del self._entries[bisect_left(self._entries, entry)]
+
+    def _check_change(self, employee, field, old, new):
+        """Validator: vetoes a number already used by another indexed employee."""
+        if field == "employee_number" and new in self._employees:
+            raise ValueError(f"Employee number {new!r} is already indexed.")
+
+    def _on_change(self, employee, field, old, new):
+        """Listener: re-files the employee after a hire date or number change."""
+        if field == "hire_date":
+            number = employee.employee_number
+            self._unfile(number)
+            self._file(number, employee.hire_ordinal)
+        elif field == "employee_number":
+            self._employees[new] = self._employees.pop(old)
+            self._unfile(old)
+            self._file(new, employee.hire_ordinal)
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---- Queries ----
+
+    def _between(self, first, last):
+        """Returns employees hired on ordinals first..last inclusive."""
+        lo = bisect_left(self._entries, (first,))
+        hi = bisect_left(self._entries, (last + 1,))
+        return [self._employees[entry[2]] for entry in self._entries[lo:hi]]
+
+    def hired_between(self, start, end):
+        """
+        Preconditions: start, end are datetime.date objects
+        Postconditions: Returns employees hired from start to end inclusive,
+                        earliest first
+        """
+        return self._between(start.toordinal(), end.toordinal())
+
+    def most_senior(self, count):
+        """Returns the count earliest-hired employees, earliest first."""
+        return [self._employees[entry[2]] for entry in self._entries[:count]]
+
+    def most_recent(self, count):
+        """Returns the count latest-hired employees, latest first."""
+        if count <= 0:
+            return []
+        return [self._employees[entry[2]] for entry in reversed(self._entries[-count:])]
+
+    def hired_before(self, day):
+        """Returns the number of employees hired strictly before day."""
+        return bisect_left(self._entries, (day.toordinal(),))
+
+    def anniversaries(self, years, start, end):
+        """
+        Preconditions: years is a positive int; start, end are datetime.date
+        Postconditions: Returns employees whose `years`-year anniversary falls
+                        from start to end inclusive (a Feb 29 hire's
+                        anniversary is Feb 28 in common years)
+        """
+        if years <= 0:
+            raise ValueError("Years must be positive.")
+        first = _years_before(start, years, roll_forward=True).toordinal()
+        last_day = _years_before(end, years)
+        last = last_day.toordinal()
+        # end = Feb 28 of a common year also covers hires on Feb 29
+        if (end.month, end.day) == (2, 28) and calendar.isleap(last_day.year) \
+                and not calendar.isleap(end.year):
+            last += 1
+        return self._between(first, last)
+
+    def anniversaries_in_month(self, years, year, month):
+        """Returns employees whose `years`-year anniversary falls in that month."""
+        last = calendar.monthrange(year, month)[1]
+        return self.anniversaries(years, date(year, month, 1), date(year, month, last))
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        if not self._entries:
+            return "SeniorityIndex(0 employees)"
+        first = date.fromordinal(self._entries[0][0])
+        last = date.fromordinal(self._entries[-1][0])
+        return f"SeniorityIndex({len(self._entries)} employees, hired {first} to {last})"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    from employee import Employee
+    from production_worker import ProductionWorker
+    from team_leader import TeamLeader
+
+    print("=" * 50)
+    print("SeniorityIndex Class - Unit Tests")
+    print("=" * 50)
+
+    staff = [
+        Employee("Alice Johnson", 1001, "03/15/2020"),
+        ProductionWorker("Carlos Diaz", 2001, "2021-01-10", 1, 18.50),
+        ProductionWorker("Diana Prince", 2002, "July 22, 2022", 2, 22.75),
+        TeamLeader("Frank Miller", 4001, (3, 15, 2017), 1, 25.00, 500.00, 40, 35),
+        Employee("Gina Leap", 5001, "02/29/2016"),
+    ]
+    index = SeniorityIndex(staff)
+    print(f"\n{index!r}")
+    print(f"Most senior 2: {[e.name for e in index.most_senior(2)]}")
+    print(f"Hired in 2020-2021: "
+          f"{[e.name for e in index.hired_between(date(2020, 1, 1), date(2021, 12, 31))]}")
+    print(f"5-year anniversaries in March 2022: "
+          f"{[e.name for e in index.anniversaries_in_month(5, 2022, 3)]}")
+    print(f"5-year anniversary on Feb 28, 2021: "
+          f"{[e.name for e in index.anniversaries(5, date(2021, 2, 28), date(2021, 2, 28))]}")
+    print(f"Gina's years of service on Feb 28, 2021: "
+          f"{staff[4].years_of_service(date(2021, 2, 28))} (Feb 27: "
+          f"{staff[4].years_of_service(date(2021, 2, 27))})")
+    print(f"Frank's years of service on 2024-03-14: "
+          f"{staff[3].years_of_service(date(2024, 3, 14))}")
+
+    late_feb = SeniorityIndex([Employee("Hal Feb", 6001, "2019-02-28"),
+                               Employee("Ida Mar", 6002, "2019-03-01")])
+    print(f"5-year anniversaries from Feb 29 to Mar 31, 2024 (Feb 28 hire excluded): "
+          f"{[e.name for e in late_feb.anniversaries(5, date(2024, 2, 29), date(2024, 3, 31))]}")
+    try:
+        staff[1].employee_number = 1001
+    except ValueError as e:
+        print(f"Duplicate rejected: {e} (index size {len(index)})")
+
+    staff[0].hire_date = "March 1, 2010"
+    print(f"After Alice's hire date changes, most senior: {index.most_senior(1)[0].name}")
+
+    rng = random.Random(11)
+    start_ordinal = date(1990, 1, 1).toordinal()
+    big = SeniorityIndex(Employee(f"E{i}", i, date.fromordinal(
+        start_ordinal + rng.randrange(12_000)).isoformat()) for i in range(200_000))
+    begin = time.perf_counter()
+    due = big.anniversaries_in_month(5, 2024, 7)
+    elapsed = time.perf_counter() - begin
+    print(f"\n200,000 employees: {len(due)} five-year anniversaries in July 2024 "
+          f"found in {elapsed * 1e3:.2f}ms")
@@ -4,11 +4,14 @@ Adds annual salary and annual production bonus.
 """
 
 from employee import Employee
+from validators import check_positive
 
 
 class ShiftSupervisor(Employee):
     """Represents a shift supervisor who oversees production workers."""
 
+    __slots__ = ("_annual_salary", "_annual_production_bonus")
+
     def __init__(self, name, employee_number, hire_date, annual_salary, annual_production_bonus):
         """
         Preconditions: Valid Employee args; annual_salary and annual_production_bonus
@@ -28,10 +31,11 @@ class ShiftSupervisor(Employee):
     @annual_salary.setter
     def annual_salary(self, value):
         # Precondition: value must be positive
-        if value > 0:
-            self._annual_salary = value
-        else:
-            raise ValueError("Annual salary must be positive.")
+        check_positive(value, "Annual salary")
+        old = self._annual_salary
+        self._validate_change("annual_salary", old, value)
+        self._annual_salary = value
+        self._changed("annual_salary", old, value)
 
     @property
     def annual_production_bonus(self):
@@ -40,10 +44,11 @@ class ShiftSupervisor(Employee):
     @annual_production_bonus.setter
     def annual_production_bonus(self, value):
         # Precondition: value must be positive
-        if value > 0:
-            self._annual_production_bonus = value
-        else:
-            raise ValueError("Annual production bonus must be positive.")
+        check_positive(value, "Annual production bonus")
+        old = self._annual_production_bonus
+        self._validate_change("annual_production_bonus", old, value)
+        self._annual_production_bonus = value
+        self._changed("annual_production_bonus", old, value)
 
     # ---- Display ----
 
@@ -58,12 +63,12 @@ class ShiftSupervisor(Employee):
         return (f"ShiftSupervisor({self._name!r}, {self._employee_number!r}, "
                 f"{self._hire_date!r}, {self._annual_salary!r}, {self._annual_production_bonus!r})")
 
-    def print_shift_supervisor(self):
+    def print_shift_supervisor(self, file=None):
         """
-        Preconditions: None
+        Preconditions: file is a writable text stream, or None for the console
         Postconditions: Displays employee info plus salary and bonus
         """
-        print(self.__str__())
+        print(self.__str__(), file=file)
 
 
 # ---- Unit Tests ----
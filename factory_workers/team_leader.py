@@ -4,11 +4,14 @@ Adds monthly bonus, required training hours, and attended training hours.
 """
 
 from production_worker import ProductionWorker
+from validators import check_positive
 
 
 class TeamLeader(ProductionWorker):
     """Represents a team leader who supervises a group of production workers."""
 
+    __slots__ = ("_monthly_bonus", "_required_training_hours", "_attended_training_hours")
+
     def __init__(self, name, employee_number, hire_date, shift, hourly_pay_rate,
                  monthly_bonus, required_training_hours, attended_training_hours):
         """
@@ -30,10 +33,11 @@ class TeamLeader(ProductionWorker):
     @monthly_bonus.setter
     def monthly_bonus(self, value):
         # Precondition: value must be positive
-        if value > 0:
-            self._monthly_bonus = value
-        else:
-            raise ValueError("Monthly bonus must be positive.")
+        check_positive(value, "Monthly bonus")
+        old = self._monthly_bonus
+        self._validate_change("monthly_bonus", old, value)
+        self._monthly_bonus = value
+        self._changed("monthly_bonus", old, value)
 
     @property
     def required_training_hours(self):
@@ -42,10 +46,11 @@ class TeamLeader(ProductionWorker):
     @required_training_hours.setter
     def required_training_hours(self, value):
         # Precondition: value must be positive
-        if value > 0:
-            self._required_training_hours = value
-        else:
-            raise ValueError("Required training hours must be positive.")
+        check_positive(value, "Required training hours")
+        old = self._required_training_hours
+        self._validate_change("required_training_hours", old, value)
+        self._required_training_hours = value
+        self._changed("required_training_hours", old, value)
 
     @property
     def attended_training_hours(self):
@@ -54,10 +59,11 @@ class TeamLeader(ProductionWorker):
     @attended_training_hours.setter
     def attended_training_hours(self, value):
         # Precondition: value must be positive
-        if value > 0:
-            self._attended_training_hours = value
-        else:
-            raise ValueError("Attended training hours must be positive.")
+        check_positive(value, "Attended training hours")
+        old = self._attended_training_hours
+        self._validate_change("attended_training_hours", old, value)
+        self._attended_training_hours = value
+        self._changed("attended_training_hours", old, value)
 
     # ---- Display ----
 
@@ -75,12 +81,12 @@ class TeamLeader(ProductionWorker):
                 f"{self._monthly_bonus!r}, {self._required_training_hours!r}, "
                 f"{self._attended_training_hours!r})")
 
-    def print_team_leader(self):
+    def print_team_leader(self, file=None):
         """
-        Preconditions: None
+        Preconditions: file is a writable text stream, or None for the console
         Postconditions: Displays production worker info plus team leader data
         """
-        print(self.__str__())
+        print(self.__str__(), file=file)
 
 
 # ---- Unit Tests ----
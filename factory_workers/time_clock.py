@@ -0,0 +1,319 @@
+"""
+Factory Workers - Time Clock (time_clock.py)
+Pairs clock-in/clock-out punches into worked intervals per employee number
+and keeps running worked, overtime and night hours as punches arrive.
+
+Punch files are CSV with a header row: employee_number, time (ISO 8601,
+plant local time) and direction (IN or OUT). Punches can be replayed from
+a file in batches (TimeClock.ingest) or fed through an asyncio.Queue
+(TimeClock.consume), which stands in for a socket connection to the
+clocks.
+
+Memory is bounded by the number of employees, not punches: the clock keeps
+each employee's open clock-in, the day being worked and the day's worked
+seconds, plus their running totals. An interval counts toward the day it
+starts on, so a night shift that crosses midnight is one working day.
+Overtime is time beyond overtime_after hours in a working day; night hours
+are the part of an interval between night_start and night_end o'clock.
+"""
+
+import asyncio
+import csv
+from collections import deque, namedtuple
+from datetime import datetime
+from itertools import islice
+
+from roster_file import parse_employee_number
+
+DAY = 86400
+Punch = namedtuple("Punch", "employee_number time direction")
+Interval = namedtuple("Interval", "employee_number start end worked overtime night")
+
+
+def clock_seconds(value):
+    """
+    Preconditions: value is a naive datetime or ISO 8601 string in plant
+                   local time
+    Postconditions: Returns whole seconds since 0001-01-01 (day ordinal * 86400);
+                    a value with a UTC offset raises ValueError
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        raise ValueError(f"Punch time must be plant local time without a UTC offset: {value}")
+    return value.toordinal() * DAY + value.hour * 3600 + value.minute * 60 + value.second
+
+
+def night_seconds(start, end, night_start=22 * 3600, night_end=6 * 3600):
+    """Returns the seconds of [start, end) that fall in the nightly window."""
+    total = 0
+    length = (night_end - night_start) % DAY or DAY
+    day = start // DAY - 1  # the window that began the evening before
+    while day * DAY + night_start < end:
+        window_start = day * DAY + night_start
+        window_end = window_start + length
+        total += max(0, min(end, window_end) - max(start, window_start))
+        day += 1
+    return total
+
+
+# ---- Punch Sources ----
+
+def _parse_punch(row):
+    number = row.get("employee_number")
+    time = row.get("time")
+    direction = (row.get("direction") or "").strip().upper()
+    if not number or not time:
+        raise ValueError("Punch needs employee_number and time.")
+    if direction not in ("IN", "OUT"):
+        raise ValueError(f"Direction must be IN or OUT, not {row.get('direction')!r}.")
+    return Punch(parse_employee_number(number), clock_seconds(time), direction)
+
+
+def read_punches(path, errors=None):
+    """
+    Preconditions: path is a punch CSV file
+    Postconditions: Yields one Punch per valid row, in file order; bad rows
+                    raise ValueError, or are skipped and recorded as
+                    (line, message) pairs if errors is a list
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                yield _parse_punch(row)
+            except ValueError as e:
+                if errors is None:
+                    raise ValueError(f"Line {reader.line_num}: {e}") from None
+                errors.append((reader.line_num, str(e)))
+
+
+def write_punches(path, punches):
+    """Writes punches (with datetime or ISO times) in the read_punches format."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(Punch._fields)
+        for number, time, direction in punches:
+            writer.writerow((number, time if isinstance(time, str) else time.isoformat(),
+                             direction))
+
+
+async def feed(queue, punches, burst=1000):
+    """Socket stand-in: puts punches on queue in bursts, then None."""
+    for count, punch in enumerate(punches, 1):
+        await queue.put(punch)
+        if count % burst == 0:
+            await asyncio.sleep(0)
+    await queue.put(None)
+
+
+# ---- Time Clock ----
+
+class TimeClock:
+    """Streams punches into per-employee worked, overtime and night hours."""
+
+    def __init__(self, overtime_after=8.0, night_start=22, night_end=6,
+                 max_shift_hours=16, keep_anomalies=1000):
+        """
+        Preconditions: overtime_after and max_shift_hours are positive hours;
+                       night_start and night_end are hours of the day (0-23)
+        Postconditions: Clock with no punches
+        """
+        if overtime_after <= 0 or max_shift_hours <= 0:
+            raise ValueError("Overtime and shift limits must be positive.")
+        if not (0 <= night_start < 24 and 0 <= night_end < 24):
+            raise ValueError("Night hours must be between 0 and 23.")
+        self._overtime_after = int(overtime_after * 3600)
+        self._night = (night_start * 3600, night_end * 3600)
+        self._max_shift = int(max_shift_hours * 3600)
+        self._open = {}       # employee number -> clock-in seconds
+        self._day = {}        # employee number -> [working day, seconds worked that day]
+        self._totals = {}     # employee number -> [worked, overtime, night] seconds
+        self.punches = 0
+        self.anomalies = deque(maxlen=keep_anomalies)  # latest (punch, message) pairs
+        self.anomaly_count = 0
+
+    def _anomaly(self, punch, message):
+        self.anomaly_count += 1
+        self.anomalies.append((punch, message))
+
+    def process(self, punch):
+        """
+        Preconditions: punch is a Punch with time in clock_seconds
+        Postconditions: Returns the Interval closed by an OUT punch, else
+                        None; unpaired punches are recorded as anomalies
+        """
+        self.punches += 1
+        number, time, direction = punch
+        if direction == "IN":
+            if number in self._open:
+                self._anomaly(punch, "Clock-in without clock-out; earlier clock-in dropped.")
+            self._open[number] = time
+            return None
+        start = self._open.pop(number, None)
+        if start is None:
+            self._anomaly(punch, "Clock-out without clock-in.")
+            return None
+        if not 0 <= time - start <= self._max_shift:
+            self._anomaly(punch, "Clock-out is before clock-in or past the shift limit.")
+            return None
+        return self._close(number, start, time)
+
+    def _close(self, number, start, end):
+        worked = end - start
+        day = start // DAY
+        current = self._day.get(number)
+        if current is None or current[0] != day:
+            current = self._day[number] = [day, 0]
+        limit = self._overtime_after
+        before = current[1]
+        current[1] = before + worked
+        overtime = max(0, current[1] - limit) - max(0, before - limit)
+        night = night_seconds(start, end, *self._night)
+        totals = self._totals.get(number)
+        if totals is None:
+            totals = self._totals[number] = [0, 0, 0]
+        totals[0] += worked
+        totals[1] += overtime
+        totals[2] += night
+        return Interval(number, start, end, worked, overtime, night)
+
+    def process_batch(self, punches):
+        """Processes punches in order; returns the intervals they closed."""
+        process = self.process
+        return [interval for interval in map(process, punches) if interval is not None]
+
+    def ingest(self, punches, batch_size=10_000, on_batch=None):
+        """
+        Preconditions: punches is an iterable of Punch (e.g. read_punches)
+        Postconditions: Punches processed batch_size at a time; on_batch, if
+                        given, receives each batch's closed intervals
+        """
+        punches = iter(punches)
+        while True:
+            batch = list(islice(punches, batch_size))
+            if not batch:
+                return
+            intervals = self.process_batch(batch)
+            if on_batch is not None:
+                on_batch(intervals)
+
+    async def consume(self, queue, batch_size=1000, on_batch=None):
+        """
+        Preconditions: queue is an asyncio.Queue of Punch, ended by None
+        Postconditions: Punches processed as they arrive, draining whatever
+                        is already queued (up to batch_size) per wake-up
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            done = batch[-1] is None
+            if done:
+                batch.pop()
+            intervals = self.process_batch(batch)
+            if on_batch is not None:
+                on_batch(intervals)
+            if done:
+                return
+
+    # ---- Queries ----
+
+    def hours(self, employee_number):
+        """Returns {"worked", "overtime", "night"} hours for one employee."""
+        worked, overtime, night = self._totals.get(employee_number, (0, 0, 0))
+        return {"worked": worked / 3600, "overtime": overtime / 3600, "night": night / 3600}
+
+    def totals(self):
+        """Returns {employee_number: hours(...)} for everyone with closed intervals."""
+        return {number: self.hours(number) for number in self._totals}
+
+    def clocked_in(self):
+        """Returns the employee numbers currently clocked in."""
+        return list(self._open)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"TimeClock({self.punches} punches, {len(self._totals)} employees, "
+                f"{len(self._open)} clocked in, {self.anomaly_count} anomalies)")
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+    import tracemalloc
+    from datetime import timedelta
+
+    print("=" * 50)
+    print("TimeClock - Unit Tests")
+    print("=" * 50)
+
+    clock = TimeClock()
+    sample = [
+        (2001, "2024-03-04T06:55:00", "IN"),
+        (4001, "2024-03-04T21:50:00", "IN"),
+        (2001, "2024-03-04T17:10:00", "OUT"),
+        (4001, "2024-03-05T06:20:00", "OUT"),
+        (2002, "2024-03-05T08:00:00", "OUT"),
+    ]
+    for number, stamp, direction in sample:
+        interval = clock.process(Punch(number, clock_seconds(stamp), direction))
+        if interval:
+            print(f"  {number}: {interval.worked / 3600:.2f}h worked, "
+                  f"{interval.overtime / 3600:.2f}h overtime, {interval.night / 3600:.2f}h night")
+    print(f"{clock!r}")
+    print(f"Anomaly: {clock.anomalies[0][1]}")
+    try:
+        clock_seconds("2024-03-04T06:55:00+01:00")
+    except ValueError as e:
+        print(f"Rejected: {e}")
+
+    # Shift change burst: 20,000 workers over 5 days, replayed from a file
+    rng = random.Random(8)
+    first_day = datetime(2024, 3, 4)
+
+    def generate(workers, days):
+        for day in range(days):
+            for shift_start in (6, 14, 22):
+                base = first_day + timedelta(days=day, hours=shift_start)
+                crew = range(shift_start % 3, workers, 3)
+                for number in crew:
+                    yield (number, base + timedelta(minutes=rng.randint(-10, 5)), "IN")
+                for number in crew:
+                    out = base + timedelta(hours=8, minutes=rng.randint(-5, 90))
+                    yield (number, out, "OUT")
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "punches.csv")
+    write_punches(path, generate(10_000, 5))
+    clock = TimeClock()
+    start = time.perf_counter()
+    clock.ingest(read_punches(path))
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    TimeClock().ingest(read_punches(path))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    overtime = sum(h["overtime"] for h in clock.totals().values())
+    night = sum(h["night"] for h in clock.totals().values())
+    print(f"\nFile replay: {clock!r}")
+    print(f"  {clock.punches / elapsed:,.0f} punches/s, peak memory {peak / 1e6:.1f} MB; "
+          f"{overtime:,.0f}h overtime, {night:,.0f}h night")
+
+    async def live(punches):
+        queue = asyncio.Queue(maxsize=10_000)
+        clock = TimeClock()
+        await asyncio.gather(feed(queue, punches), clock.consume(queue))
+        return clock
+
+    punches = list(read_punches(path))
+    start = time.perf_counter()
+    live_clock = asyncio.run(live(punches))
+    elapsed = time.perf_counter() - start
+    print(f"asyncio feed: {live_clock.punches / elapsed:,.0f} punches/s, "
+          f"same totals: {live_clock.totals() == clock.totals()}")
+    os.remove(path)
+    os.rmdir(directory)
@@ -0,0 +1,226 @@
+"""
+TrainingComplianceTracker Class - Running training compliance for TeamLeaders.
+Keeps the total shortfall (required - attended hours, for leaders behind),
+per-shift compliant counts and a max-heap of deficits. The tracker listens
+to each leader's setters, so every total is adjusted in O(1) (plus an
+O(log n) heap push) when hours or shifts change, and queries never scan
+the leaders.
+
+The heap uses lazy deletion: a change pushes a fresh entry and bumps the
+leader's sequence number, and stale entries are skipped when they reach
+the top. The heap is rebuilt when stale entries outnumber live ones.
+"""
+
+from heapq import heapify, heappop, heappush
+
+from team_leader import TeamLeader
+
+
+def _deficit(leader):
+    """Hours a leader is short of their requirement (0 if compliant)."""
+    return max(leader.required_training_hours - leader.attended_training_hours, 0)
+
+
+class TrainingComplianceTracker:
+    """Answers 'who is most behind on training' and '% compliant by shift'."""
+
+    def __init__(self, leaders=()):
+        """
+        Preconditions: leaders is an iterable of TeamLeader objects with
+                       distinct employee numbers
+        Postconditions: Every leader is tracked
+        """
+        self._leaders = {}       # employee number -> leader
+        self._deficits = {}      # employee number -> shortfall (> 0 only)
+        self._shifts = {}        # employee number -> tracked shift
+        self._by_shift = {}      # shift -> [leaders, compliant]
+        self._shortfall = 0
+        self._heap = []          # (-deficit, sequence, employee number)
+        self._sequence = {}      # employee number -> sequence of its live entry
+        self._next = 0
+        for leader in leaders:
+            self.add(leader)
+
+    # ---- Adding and Removing ----
+
+    def add(self, leader):
+        """
+        Preconditions: leader is a TeamLeader whose number is not tracked
+        Postconditions: leader counted in every total and its changes tracked
+        """
+        if not isinstance(leader, TeamLeader):
+            raise TypeError("Compliance is only tracked for TeamLeader objects.")
+        number = leader.employee_number
+        if number in self._leaders:
+            raise ValueError(f"Employee number {number!r} is already tracked.")
+        self._leaders[number] = leader
+        self._count(number, leader.shift, _deficit(leader), 1)
+        leader.add_validator(self._check_change)
+        leader.add_listener(self._on_change)
+
+    def remove(self, employee_number):
+        """Stops tracking a leader and returns it."""
+        leader = self._leaders.pop(employee_number)
+        self._count(employee_number, self._shifts[employee_number],
+                    self._deficits.get(employee_number, 0), -1)
+        leader.remove_validator(self._check_change)
+        leader.remove_listener(self._on_change)
+        return leader
+
+    def _count(self, number, shift, deficit, sign):
+        """Adds (sign=1) or removes (sign=-1) one leader from the totals."""
+        counts = self._by_shift.setdefault(shift, [0, 0])
+        counts[0] += sign
+        if deficit > 0:
+            self._shortfall += sign * deficit
+        else:
+            counts[1] += sign
+        if sign > 0:
+            self._shifts[number] = shift
+            if deficit > 0:
+                self._deficits[number] = deficit
+                self._push(number, deficit)
+        else:
+            del self._shifts[number]
+            self._deficits.pop(number, None)
+            self._sequence.pop(number, None)
+
+    def _push(self, number, deficit):
+        self._next += 1
+        self._sequence[number] = self._next
+        heappush(self._heap, (-deficit, self._next, number))
+        if len(self._heap) > 2 * len(self._deficits) + 64:
+            self._compact()
+
+    def _compact(self):
+        """Drops stale heap entries."""
+        live = self._sequence
+        self._heap = [entry for entry in self._heap if live.get(entry[2]) == entry[1]]
+        heapify(self._heap)
+
+    def _check_change(self, leader, field, old, new):
+        """Validator: vetoes a number already used by another tracked leader."""
+        if field == "employee_number" and new in self._leaders:
+            raise ValueError(f"Employee number {new!r} is already tracked.")
+
+    def _on_change(self, leader, field, old, new):
+        """Listener: re-counts the leader after an hours, shift or number change."""
+        if field == "employee_number":
+            self._leaders[new] = self._leaders.pop(old)
+            shift = self._shifts[old]
+            self._count(old, shift, self._deficits.get(old, 0), -1)
+            self._count(new, shift, _deficit(leader), 1)
+        elif field in ("required_training_hours", "attended_training_hours", "shift"):
+            number = leader.employee_number
+            self._count(number, self._shifts[number], self._deficits.get(number, 0), -1)
+            self._count(number, leader.shift, _deficit(leader), 1)
+
+    # ---- Queries ----
+
+    def __len__(self):
+        return len(self._leaders)
+
+    @property
+    def total_shortfall(self):
+        """Training hours still owed across every leader who is behind."""
+        return self._shortfall
+
+    @property
+    def non_compliant_count(self):
+        return len(self._deficits)
+
+    def deficit(self, employee_number):
+        """Returns one leader's shortfall in hours (0 if compliant)."""
+        if employee_number not in self._leaders:
+            raise KeyError(f"Employee number {employee_number!r} is not tracked.")
+        return self._deficits.get(employee_number, 0)
+
+    def most_behind(self, count):
+        """
+        Preconditions: count is a non-negative int
+        Postconditions: Returns up to count (leader, deficit) pairs, largest
+                        deficit first; O(count log n)
+        """
+        heap, live = self._heap, self._sequence
+        found = []
+        while heap and len(found) < count:
+            entry = heappop(heap)
+            if live.get(entry[2]) == entry[1]:
+                found.append(entry)
+        for entry in found:
+            heappush(heap, entry)
+        return [(self._leaders[number], -negative) for negative, _, number in found]
+
+    def percent_compliant(self, shift=None):
+        """
+        Preconditions: None
+        Postconditions: Returns the % of leaders (on shift, or overall) whose
+                        attended hours meet the requirement; None if none
+        """
+        if shift is None:
+            total = len(self._leaders)
+            compliant = total - len(self._deficits)
+        else:
+            total, compliant = self._by_shift.get(shift, (0, 0))
+        return 100.0 * compliant / total if total else None
+
+    def compliance_by_shift(self):
+        """Returns {shift: % compliant} for every shift with leaders."""
+        return {shift: 100.0 * compliant / total
+                for shift, (total, compliant) in sorted(self._by_shift.items()) if total}
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"TrainingComplianceTracker({len(self)} leaders, "
+                f"{self.non_compliant_count} behind by {self._shortfall} hours)")
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 50)
+    print("TrainingComplianceTracker Class - Unit Tests")
+    print("=" * 50)
+
+    leaders = [
+        TeamLeader("Frank Miller", 4001, "03/15/2017", 1, 25.00, 500.00, 40, 35),
+        TeamLeader("Grace Hopper", 4002, "02/01/2016", 2, 27.00, 450.00, 30, 32),
+        TeamLeader("Henry Ford", 4003, "06/30/2019", 2, 24.00, 400.00, 40, 12),
+    ]
+    tracker = TrainingComplianceTracker(leaders)
+    print(f"\n{tracker!r}")
+    print(f"Most behind: {[(l.name, d) for l, d in tracker.most_behind(2)]}")
+    print(f"Compliance by shift: {tracker.compliance_by_shift()}")
+    leaders[2].attended_training_hours = 40
+    leaders[0].shift = 2
+    print(f"After Henry trains and Frank moves to nights: {tracker!r}")
+    print(f"Compliance by shift: {tracker.compliance_by_shift()}")
+    try:
+        tracker.add(leaders[0])
+    except ValueError as e:
+        print(f"Rejected: {e}")
+    try:
+        leaders[0].employee_number = 4002
+    except ValueError as e:
+        print(f"Rejected: {e} (still {len(tracker)} leaders)")
+
+    rng = random.Random(5)
+    big = [TeamLeader(f"L{i}", i, "01/01/2016", rng.choice((1, 2)), 25.0, 400.0, 40,
+                      rng.randint(1, 60)) for i in range(50_000)]
+    tracker = TrainingComplianceTracker(big)
+    start = time.perf_counter()
+    for _ in range(100_000):
+        rng.choice(big).attended_training_hours = rng.randint(1, 60)
+    updates = time.perf_counter() - start
+    start = time.perf_counter()
+    top = tracker.most_behind(100)
+    by_shift = tracker.compliance_by_shift()
+    queries = time.perf_counter() - start
+    exact = (tracker.total_shortfall == sum(map(_deficit, big))
+             and [d for _, d in top] == sorted(map(_deficit, big), reverse=True)[:100])
+    print(f"\n50,000 leaders: 100,000 hour updates in {updates * 1e3:.0f}ms; "
+          f"top 100 + by-shift in {queries * 1e3:.2f}ms; matches full scan: {exact}")
+    print(f"Compliance by shift: "
+          + ", ".join(f"{s}: {p:.1f}%" for s, p in by_shift.items()))
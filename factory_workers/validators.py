@@ -0,0 +1,95 @@
+"""
+Factory Workers - Field Validators (validators.py)
+The rules behind every setter in the Employee hierarchy, as plain
+functions, so the setters, Roster row views and file importers all apply
+the same checks and raise the same messages.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+HIRE_DATE_FORMATS = "MM/DD/YYYY, YYYY-MM-DD, 'Month D, YYYY' or (month, day, year)"
+
+# Numeric fields that must be > 0, with the label used in their messages
+POSITIVE_FIELDS = {
+    "hourly_pay_rate": "Hourly pay rate",
+    "annual_salary": "Annual salary",
+    "annual_production_bonus": "Annual production bonus",
+    "monthly_bonus": "Monthly bonus",
+    "required_training_hours": "Required training hours",
+    "attended_training_hours": "Attended training hours",
+}
+
+
+@lru_cache(maxsize=4096)
+def hire_date_ordinal(value):
+    """
+    Preconditions: value is a string in one of HIRE_DATE_FORMATS or a
+                   (month, day, year) tuple
+    Postconditions: Returns the date's ordinal (date.toordinal());
+                    raises ValueError if it is not a valid date
+    """
+    try:
+        if isinstance(value, tuple):
+            month, day, year = value
+            return date(year, month, day).toordinal()
+        text = value.strip()
+        if "/" in text:
+            month, day, year = map(int, text.split("/"))
+            return date(year, month, day).toordinal()
+        if "-" in text:
+            return date.fromisoformat(text).toordinal()
+        for pattern in ("%B %d, %Y", "%b %d, %Y"):
+            try:
+                return datetime.strptime(text, pattern).toordinal()
+            except ValueError:
+                pass
+    except (TypeError, ValueError):
+        pass
+    raise ValueError(f"Hire date {value!r} is not a valid date ({HIRE_DATE_FORMATS}).")
+
+
+def check_name(value):
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("Name must be a non-empty string.")
+
+
+def check_employee_number(value):
+    if not isinstance(value, (int, str)):
+        raise TypeError("Employee number must be an int or string.")
+
+
+def check_hire_date(value):
+    """Validates a hire date and returns its ordinal."""
+    if not isinstance(value, (str, tuple)):
+        raise TypeError("Hire date must be a string or tuple.")
+    return hire_date_ordinal(value)
+
+
+def check_shift(value):
+    if value not in (1, 2):
+        raise ValueError("Shift must be 1 (day) or 2 (night).")
+
+
+def check_positive(value, label):
+    if not value > 0:
+        raise ValueError(f"{label} must be positive.")
+
+
+def check_field(field, value):
+    """
+    Preconditions: field is a property name from the Employee hierarchy
+    Postconditions: Raises what that property's setter would raise for value
+    """
+    if field in POSITIVE_FIELDS:
+        check_positive(value, POSITIVE_FIELDS[field])
+    elif field == "name":
+        check_name(value)
+    elif field == "employee_number":
+        check_employee_number(value)
+    elif field == "hire_date":
+        check_hire_date(value)
+    elif field == "shift":
+        check_shift(value)
+    else:
+        raise AttributeError(f"Unknown employee field: {field!r}")
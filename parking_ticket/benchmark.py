@@ -0,0 +1,143 @@
+"""
+Parking Ticket Simulation - Benchmark Runner (benchmark.py)
+Measures how inspection, ticket creation, fine calculation and ticket
+rendering scale with lot size. Results are printed or written as JSON so
+they can be compared across releases.
+
+Usage: python benchmark.py --sizes 1000 10000 100000 --output results.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from parked_car import ParkedCar
+from parking_ticket import ParkingTicket
+from police_officer import PoliceOfficer
+from workload_generator import WorkloadGenerator
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    """
+    Preconditions: samples is a non-empty list of numbers
+    Postconditions: Returns a dict of nearest-rank percentiles plus max
+    """
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    result = {f"p{p}": ordered[min(last, int(len(ordered) * p / 100))] for p in points}
+    result["max"] = ordered[-1]
+    return result
+
+
+def bench_inspection(officer, lot):
+    """Times inspect_car over the whole lot, recording per-call latency in ns."""
+    clock = time.perf_counter_ns
+    latencies = []
+    tickets = []
+    start = clock()
+    for car, meter in lot:
+        t0 = clock()
+        ticket = officer.inspect_car(car, meter)
+        latencies.append(clock() - t0)
+        if ticket is not None:
+            tickets.append(ticket)
+    elapsed = (clock() - start) / 1e9
+    return elapsed, latencies, tickets
+
+
+def bench_rendering(tickets):
+    """Times str() on every ticket; returns elapsed seconds."""
+    start = time.perf_counter()
+    for ticket in tickets:
+        str(ticket)
+    return time.perf_counter() - start
+
+
+def bench_fine(tickets):
+    """Times calculate_fine on every ticket; returns elapsed seconds."""
+    start = time.perf_counter()
+    for ticket in tickets:
+        ticket.calculate_fine()
+    return time.perf_counter() - start
+
+
+def memory_per_ticket(officer, count=10000):
+    """Measures traced bytes per ParkingTicket (the car is shared, not counted)."""
+    car = ParkedCar("Honda", "Accord", "Blue", "MEM0001", 70)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tickets = [ParkingTicket(car, officer, 10 + i % 500) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # subtract the list that holds the tickets
+    return (after - before - sys.getsizeof(tickets)) / count
+
+
+def run_size(lot_size, generator):
+    """Runs every benchmark for one lot size and returns a result dict."""
+    lot = generator.generate(lot_size)
+    officer = PoliceOfficer("Bench Officer", "0000")
+    elapsed, latencies, tickets = bench_inspection(officer, lot)
+    render = bench_rendering(tickets)
+    fine = bench_fine(tickets)
+    n_tickets = len(tickets)
+    return {
+        "lot_size": lot_size,
+        "tickets": n_tickets,
+        "inspect_seconds": elapsed,
+        "cars_per_second": lot_size / elapsed if elapsed else None,
+        "tickets_per_second": n_tickets / elapsed if elapsed else None,
+        "inspect_latency_ns": percentiles(latencies) if latencies else None,
+        "render_tickets_per_second": n_tickets / render if render else None,
+        "fine_calcs_per_second": n_tickets / fine if fine else None,
+        "total_fines": sum(t.fine for t in tickets),
+    }
+
+
+def run(sizes, violation_rate, distribution, mean_overstay, seed):
+    """Runs the benchmark over every lot size; returns the JSON-ready report."""
+    results = []
+    for size in sizes:
+        generator = WorkloadGenerator(violation_rate, distribution, mean_overstay, seed=seed)
+        results.append(run_size(size, generator))
+    return {
+        "benchmark": "parking_ticket",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "violation_rate": violation_rate,
+            "overstay_distribution": distribution,
+            "mean_overstay": mean_overstay,
+            "seed": seed,
+        },
+        "bytes_per_ticket": memory_per_ticket(PoliceOfficer("Bench Officer", "0000")),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the parking ticket pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--violation-rate", type=float, default=0.3)
+    parser.add_argument("--distribution", choices=WorkloadGenerator.DISTRIBUTIONS,
+                        default="exponential")
+    parser.add_argument("--mean-overstay", type=int, default=45)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="write JSON to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.violation_rate, args.distribution,
+                 args.mean_overstay, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
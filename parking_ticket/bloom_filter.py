@@ -0,0 +1,73 @@
+"""
+BloomFilter Class - Compact probabilistic set membership.
+Answers "definitely not present" or "possibly present" for hashable keys,
+used as a prefilter in front of the IssuanceLedger.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Bloom filter sized from an expected item count and false-positive rate."""
+
+    def __init__(self, expected_items=1_000_000, false_positive_rate=0.01):
+        """
+        Preconditions: expected_items is a positive int;
+                       false_positive_rate is a float in (0, 1)
+        Postconditions: Empty filter with optimal slot and hash counts
+        """
+        if expected_items <= 0:
+            raise ValueError("Expected items must be greater than 0.")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1.")
+        self.size = max(8, int(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+        # One byte per slot: every write is a single store, so concurrent
+        # add() calls from different threads can never clear each other's bits.
+        self._slots = bytearray(self.size)
+
+    def _positions(self, key):
+        """Yields hash_count slot indexes using double hashing."""
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % size
+
+    def add(self, key):
+        """
+        Preconditions: key has a stable repr()
+        Postconditions: might_contain(key) is True from now on
+        """
+        slots = self._slots
+        for pos in self._positions(key):
+            slots[pos] = 1
+
+    def might_contain(self, key):
+        """Returns False if key was definitely never added."""
+        slots = self._slots
+        return all(slots[pos] for pos in self._positions(key))
+
+    def __contains__(self, key):
+        return self.might_contain(key)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"BloomFilter(size={self.size!r}, hash_count={self.hash_count!r})"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    print("=" * 50)
+    print("BloomFilter Class - Unit Tests")
+    print("=" * 50)
+
+    bloom = BloomFilter(10000, 0.01)
+    print(f"\n{bloom!r}")
+    for i in range(10000):
+        bloom.add(("PLATE", i))
+    print(f"All added keys found: {all(('PLATE', i) in bloom for i in range(10000))}")
+    false_hits = sum(1 for i in range(10000, 20000) if ("PLATE", i) in bloom)
+    print(f"False positive rate on 10,000 new keys: {false_hits / 10000:.4f}")
@@ -0,0 +1,128 @@
+"""
+EnforcementView Class - Keeps the set of violators and the total outstanding
+fines up to date as cars and meters change.
+
+Each watched (ParkedCar, ParkingMeter) pair registers a listener on both
+objects, so a minutes_parked or minutes_purchased change re-evaluates only
+that pair: O(1) per update instead of re-inspecting the whole lot.
+"""
+
+from parking_ticket import ParkingTicket
+
+
+class EnforcementView:
+    """Incrementally maintained view of the current parking violations."""
+
+    def __init__(self):
+        """
+        Preconditions: None
+        Postconditions: Empty view with no watched pairs and no fines
+        """
+        self._pairs = {}       # car -> (meter, listener)
+        self._fines = {}       # car -> current fine, violators only
+        self._total_fines = 0.0
+
+    def watch(self, parked_car, parking_meter):
+        """
+        Preconditions: parked_car is a ParkedCar object not already watched,
+                       parking_meter is the ParkingMeter it is parked at
+        Postconditions: Pair is evaluated now and again on every change
+        """
+        if parked_car in self._pairs:
+            raise ValueError("Car is already watched.")
+
+        def listener(_source, _old, _new):
+            self._refresh(parked_car, parking_meter)
+
+        self._pairs[parked_car] = (parking_meter, listener)
+        parked_car.add_listener(listener)
+        parking_meter.add_listener(listener)
+        self._refresh(parked_car, parking_meter)
+
+    def unwatch(self, parked_car):
+        """
+        Preconditions: parked_car is watched
+        Postconditions: Pair's listeners are removed and its fine dropped
+        """
+        parking_meter, listener = self._pairs.pop(parked_car)
+        parked_car.remove_listener(listener)
+        parking_meter.remove_listener(listener)
+        self._total_fines -= self._fines.pop(parked_car, 0.0)
+
+    def _refresh(self, parked_car, parking_meter):
+        """Re-evaluates a single pair and adjusts the running totals."""
+        self._total_fines -= self._fines.pop(parked_car, 0.0)
+        illegal_minutes = parked_car.minutes_parked - parking_meter.minutes_purchased
+        if illegal_minutes > 0:
+            fine = ParkingTicket.fine_for(illegal_minutes)
+            self._fines[parked_car] = fine
+            self._total_fines += fine
+
+    # ---- Queries ----
+
+    @property
+    def violators(self):
+        """Returns the cars currently parked illegally (a new set)."""
+        return set(self._fines)
+
+    @property
+    def violation_count(self):
+        return len(self._fines)
+
+    @property
+    def total_fines(self):
+        """Sum of the fines every current violator would receive."""
+        return self._total_fines
+
+    def fine_for(self, parked_car):
+        """Returns the current fine for a watched car (0.0 if legal)."""
+        return self._fines.get(parked_car, 0.0)
+
+    def issue_tickets(self, officer):
+        """
+        Preconditions: officer is a PoliceOfficer object
+        Postconditions: Returns a ParkingTicket for every current violator
+        """
+        return [officer.inspect_car(car, self._pairs[car][0]) for car in self._fines]
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"EnforcementView(watched={len(self._pairs)}, "
+                f"violators={len(self._fines)}, total_fines={self._total_fines!r})")
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    from parked_car import ParkedCar
+    from parking_meter import ParkingMeter
+    from police_officer import PoliceOfficer
+
+    print("=" * 50)
+    print("EnforcementView Class - Unit Tests")
+    print("=" * 50)
+
+    view = EnforcementView()
+    car1 = ParkedCar("Toyota", "Camry", "Red", "XYZ123", 30)
+    meter1 = ParkingMeter(40)
+    car2 = ParkedCar("Honda", "Accord", "Blue", "ABC987", 70)
+    meter2 = ParkingMeter(60)
+    view.watch(car1, meter1)
+    view.watch(car2, meter2)
+    print(f"\nInitial: {view!r}")
+
+    car1.minutes_parked = 200
+    print(f"Car 1 overstays to 200 min: {view!r}")
+
+    meter2.minutes_purchased = 120
+    print(f"Meter 2 topped up to 120 min: {view!r}")
+    print(f"  Dirty flags: car1={car1.dirty}, meter2={meter2.dirty}, car2={car2.dirty}")
+
+    tickets = view.issue_tickets(PoliceOfficer("Jane Smith", "1234"))
+    print(f"\nTickets for current violators: {len(tickets)}")
+    print(tickets[0])
+
+    view.unwatch(car1)
+    print(f"\nAfter unwatching car 1: {view!r}")
@@ -0,0 +1,235 @@
+"""
+Instrumentation Class - Optional counters, timers and sampled tracing for
+enforcement runs.
+
+PoliceOfficer.inspect_car and ParkingTicket.__init__ check the module-level
+`active` attribute; while it is None (the default) they do nothing else, so
+a disabled run pays for one attribute lookup per call. Metrics can be read
+as a dict, JSON or Prometheus text, or served over a local HTTP endpoint.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The currently enabled Instrumentation, or None when disabled
+active = None
+
+
+def enable(instrumentation=None):
+    """
+    Preconditions: instrumentation is an Instrumentation object or None
+    Postconditions: The given (or a new) Instrumentation is active and returned
+    """
+    global active
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    active = instrumentation
+    return instrumentation
+
+
+def disable():
+    """
+    Preconditions: None
+    Postconditions: Instrumentation is switched off; returns the one that was active
+    """
+    global active
+    previous, active = active, None
+    return previous
+
+
+class Instrumentation:
+    """Collects enforcement metrics and forwards sampled traces to callbacks."""
+
+    def __init__(self, sample_every=100):
+        """
+        Preconditions: sample_every is a positive int (trace 1 in N inspections)
+                       or 0 to disable tracing
+        Postconditions: Instrumentation initialized with all metrics at zero
+        """
+        if sample_every < 0:
+            raise ValueError("Sample interval cannot be negative.")
+        self.sample_every = sample_every
+        self.clock = time.perf_counter_ns
+        self._lock = threading.Lock()
+        self._tracers = []
+        self.reset()
+
+    def reset(self):
+        """Sets every counter and timer back to zero."""
+        with self._lock:
+            self.inspections = 0
+            self.violations = 0
+            self.tickets_issued = 0
+            self.fines_total = 0.0
+            self.inspect_ns_total = 0
+            self.inspect_ns_max = 0
+            self._started = time.monotonic()
+
+    # ---- Tracing ----
+
+    def add_tracer(self, callback):
+        """
+        Preconditions: callback accepts one dict argument (the trace event)
+        Postconditions: callback receives every sampled inspection
+        """
+        self._tracers.append(callback)
+
+    def remove_tracer(self, callback):
+        """Stops sending trace events to callback."""
+        self._tracers.remove(callback)
+
+    # ---- Recording (called from the hot path while enabled) ----
+
+    def record_inspection(self, officer, parked_car, parking_meter, ticket, start_ns):
+        """Records one finished inspect_car call that started at start_ns."""
+        elapsed = self.clock() - start_ns
+        with self._lock:
+            self.inspections += 1
+            count = self.inspections
+            if ticket is not None:
+                self.violations += 1
+            self.inspect_ns_total += elapsed
+            if elapsed > self.inspect_ns_max:
+                self.inspect_ns_max = elapsed
+        if self._tracers and self.sample_every and count % self.sample_every == 0:
+            event = {
+                "event": "inspection",
+                "officer": officer.badge_number,
+                "license": parked_car.license_number,
+                "minutes_parked": parked_car.minutes_parked,
+                "minutes_purchased": parking_meter.minutes_purchased,
+                "fine": ticket.fine if ticket is not None else 0.0,
+                "elapsed_ns": elapsed,
+            }
+            for tracer in self._tracers:
+                tracer(event)
+
+    def record_ticket(self, ticket):
+        """Records one ParkingTicket creation."""
+        with self._lock:
+            self.tickets_issued += 1
+            self.fines_total += ticket.fine
+
+    # ---- Export ----
+
+    def snapshot(self):
+        """
+        Preconditions: None
+        Postconditions: Returns a dict copy of every metric
+        """
+        with self._lock:
+            uptime = time.monotonic() - self._started
+            return {
+                "uptime_seconds": uptime,
+                "inspections_total": self.inspections,
+                "violations_total": self.violations,
+                "tickets_issued_total": self.tickets_issued,
+                "fines_total": self.fines_total,
+                "inspect_seconds_sum": self.inspect_ns_total / 1e9,
+                "inspect_seconds_max": self.inspect_ns_max / 1e9,
+                "inspections_per_second": self.inspections / uptime if uptime else 0.0,
+            }
+
+    def to_json(self):
+        """Returns the snapshot as a JSON string."""
+        return json.dumps(self.snapshot())
+
+    def to_prometheus(self):
+        """Returns the snapshot in the Prometheus text exposition format."""
+        s = self.snapshot()
+        lines = [
+            "# HELP parking_inspections_total Cars inspected.",
+            "# TYPE parking_inspections_total counter",
+            f"parking_inspections_total {s['inspections_total']}",
+            "# HELP parking_violations_total Inspections that found a violation.",
+            "# TYPE parking_violations_total counter",
+            f"parking_violations_total {s['violations_total']}",
+            "# HELP parking_tickets_issued_total Parking tickets created.",
+            "# TYPE parking_tickets_issued_total counter",
+            f"parking_tickets_issued_total {s['tickets_issued_total']}",
+            "# HELP parking_fines_dollars_total Sum of fines on created tickets.",
+            "# TYPE parking_fines_dollars_total counter",
+            f"parking_fines_dollars_total {s['fines_total']:.2f}",
+            "# HELP parking_inspect_seconds Time spent in inspect_car.",
+            "# TYPE parking_inspect_seconds summary",
+            f"parking_inspect_seconds_sum {s['inspect_seconds_sum']:.9f}",
+            f"parking_inspect_seconds_count {s['inspections_total']}",
+            "# HELP parking_inspect_seconds_max Slowest inspect_car call.",
+            "# TYPE parking_inspect_seconds_max gauge",
+            f"parking_inspect_seconds_max {s['inspect_seconds_max']:.9f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host="127.0.0.1", port=9108):
+        """
+        Preconditions: host/port are free on this machine
+        Postconditions: Starts a daemon HTTP server exposing /metrics (Prometheus)
+                        and /metrics.json; returns the server (call shutdown() to stop)
+        """
+        instrumentation = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, ctype = instrumentation.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, ctype = instrumentation.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # keep scrapes out of the console
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"Instrumentation(sample_every={self.sample_every!r})"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    from urllib.request import urlopen
+
+    # Run against the imported module, which is the one police_officer sees
+    import instrumentation
+    from parked_car import ParkedCar
+    from parking_meter import ParkingMeter
+    from police_officer import PoliceOfficer
+
+    print("=" * 50)
+    print("Instrumentation Class - Unit Tests")
+    print("=" * 50)
+
+    officer = PoliceOfficer("Jane Smith", "1234")
+    traces = []
+    inst = instrumentation.enable(instrumentation.Instrumentation(sample_every=2))
+    inst.add_tracer(traces.append)
+
+    officer.inspect_car(ParkedCar("Toyota", "Camry", "Red", "XYZ123", 30), ParkingMeter(40))
+    officer.inspect_car(ParkedCar("Honda", "Accord", "Blue", "ABC987", 70), ParkingMeter(60))
+    officer.inspect_car(ParkedCar("Ford", "Mustang", "Black", "LMN456", 190), ParkingMeter(60))
+
+    print(f"\nSnapshot: {inst.snapshot()}")
+    print(f"Sampled traces: {len(traces)} -> {traces[0]['license']}")
+
+    server = inst.serve(port=0)
+    url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+    print("\nPrometheus endpoint:")
+    print(urlopen(url).read().decode())
+    server.shutdown()
+
+    instrumentation.disable()
+    officer.inspect_car(ParkedCar("BMW", "X5", "Black", "BMW999", 500), ParkingMeter(60))
+    print(f"After disable, inspections still {inst.inspections}")
@@ -0,0 +1,198 @@
+"""
+IssuanceLedger Class - Idempotent ticket issuance across overlapping sweeps.
+
+A violation is keyed by (license number, meter, paid-until minutes): every
+inspection of the same overstay maps to the same key, while topping up the
+meter starts a new violation window. The first sweep to claim a key issues
+the ticket; later claims return None.
+
+Keys live in a bounded, time-expiring set split across lock-striped shards,
+so concurrent sweeps only contend when they hash to the same shard. An
+optional BloomFilter lets seen() answer "never issued" without taking a
+lock; claim() consults and updates it only while holding the key's shard
+lock.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class IssuanceLedger:
+    """Remembers issued violations so each one is billed exactly once."""
+
+    def __init__(self, capacity=1_000_000, ttl_seconds=24 * 60 * 60, shards=64,
+                 bloom_filter=None, clock=time.monotonic):
+        """
+        Preconditions: capacity, ttl_seconds and shards are positive numbers;
+                       bloom_filter is a BloomFilter object or None;
+                       clock returns monotonically increasing seconds
+        Postconditions: Empty ledger ready to claim violation keys
+        """
+        if capacity <= 0 or ttl_seconds <= 0 or shards <= 0:
+            raise ValueError("Capacity, TTL and shard count must be greater than 0.")
+        self.ttl_seconds = ttl_seconds
+        self.bloom_filter = bloom_filter
+        self._clock = clock
+        self._shard_capacity = max(1, capacity // shards)
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._entries = [OrderedDict() for _ in range(shards)]  # key -> claim time
+
+    @staticmethod
+    def violation_key(parked_car, parking_meter):
+        """
+        Preconditions: parked_car is a ParkedCar, parking_meter a ParkingMeter
+                       with a meter_id
+        Postconditions: Returns the key identifying the current violation window
+        """
+        meter = parking_meter.meter_id
+        if meter is None:
+            # id() values are reused after garbage collection, so they cannot
+            # identify a meter across sweeps
+            raise ValueError("Parking meter needs a meter_id for ledger issuance.")
+        return (parked_car.license_number, meter, parking_meter.minutes_purchased)
+
+    def _evict(self, entries, now):
+        """Drops expired entries, then the oldest ones above shard capacity."""
+        deadline = now - self.ttl_seconds
+        while entries:
+            key, claimed_at = next(iter(entries.items()))
+            if claimed_at > deadline and len(entries) <= self._shard_capacity:
+                break
+            entries.popitem(last=False)
+
+    def claim(self, key):
+        """
+        Preconditions: key is hashable with a stable repr()
+        Postconditions: Returns True if this call recorded key (issue the ticket),
+                        False if an unexpired claim already exists
+        """
+        shard = hash(key) % len(self._locks)
+        entries = self._entries[shard]
+        bloom = self.bloom_filter
+        # A key always maps to the same shard, so checking and adding it to
+        # the Bloom filter under the shard lock makes the negative answer
+        # (skip the dict probe) safe against a concurrent claim of that key.
+        with self._locks[shard]:
+            now = self._clock()
+            if bloom is None or bloom.might_contain(key):
+                claimed_at = entries.get(key)
+                if claimed_at is not None and now - claimed_at < self.ttl_seconds:
+                    return False
+            entries[key] = now
+            entries.move_to_end(key)
+            self._evict(entries, now)
+            if bloom is not None:
+                bloom.add(key)
+        return True
+
+    def release(self, key):
+        """Forgets a claim (e.g. the ticket could not be issued after all)."""
+        shard = hash(key) % len(self._locks)
+        with self._locks[shard]:
+            self._entries[shard].pop(key, None)
+
+    def seen(self, key):
+        """Returns True if key has an unexpired claim."""
+        bloom = self.bloom_filter
+        if bloom is not None and not bloom.might_contain(key):
+            return False
+        shard = hash(key) % len(self._locks)
+        with self._locks[shard]:
+            claimed_at = self._entries[shard].get(key)
+            return claimed_at is not None and self._clock() - claimed_at < self.ttl_seconds
+
+    def issue(self, officer, parked_car, parking_meter):
+        """
+        Preconditions: officer is a PoliceOfficer, parked_car a ParkedCar,
+                       parking_meter a ParkingMeter
+        Postconditions: Returns a ParkingTicket for a violation not yet billed,
+                        or None if the car is legal or already ticketed
+        """
+        if parked_car.minutes_parked <= parking_meter.minutes_purchased:
+            return None
+        key = self.violation_key(parked_car, parking_meter)
+        if not self.claim(key):
+            return None
+        ticket = officer.inspect_car(parked_car, parking_meter)
+        if ticket is None:
+            # the car became legal between the check and the inspection
+            self.release(key)
+        return ticket
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"IssuanceLedger(entries={len(self)}, ttl_seconds={self.ttl_seconds!r}, "
+                f"shards={len(self._locks)})")
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bloom_filter import BloomFilter
+    from parked_car import ParkedCar
+    from parking_meter import ParkingMeter
+    from police_officer import PoliceOfficer
+
+    print("=" * 50)
+    print("IssuanceLedger Class - Unit Tests")
+    print("=" * 50)
+
+    ledger = IssuanceLedger(bloom_filter=BloomFilter(10000))
+    car = ParkedCar("Honda", "Accord", "Blue", "ABC987", 70)
+    meter = ParkingMeter(60, "M-17")
+    first = ledger.issue(PoliceOfficer("Jane Smith", "1234"), car, meter)
+    second = ledger.issue(PoliceOfficer("John Doe", "5678"), car, meter)
+    print(f"\nFirst sweep ticket: {first is not None}, second sweep ticket: {second is not None}")
+
+    meter.minutes_purchased = 65  # topped up: new violation window
+    third = ledger.issue(PoliceOfficer("John Doe", "5678"), car, meter)
+    print(f"After top-up, new ticket: {third is not None}")
+
+    # Concurrent overlapping sweeps over the same lot
+    lot = [(ParkedCar("Ford", "Mustang", "Black", f"LOT{i:04d}", 190), ParkingMeter(60, i))
+           for i in range(1000)]
+    officers = [PoliceOfficer(f"Officer {n}", str(n)) for n in range(4)]
+
+    def sweep(officer):
+        return sum(1 for c, m in lot if ledger.issue(officer, c, m) is not None)
+
+    with ThreadPoolExecutor(4) as pool:
+        issued = sum(pool.map(sweep, officers))
+    print(f"4 concurrent sweeps over 1000 violators issued {issued} tickets")
+
+    # Same violators claimed from many threads at once: each key wins once
+    import threading
+
+    duplicates = 0
+    for run in range(20):
+        stress = IssuanceLedger(bloom_filter=BloomFilter(100_000))
+        keys = [("CAR%04d" % i, i, 60) for i in range(2000)]
+        wins = [[] for _ in range(8)]
+        barrier = threading.Barrier(8)
+
+        def claim_all(won):
+            barrier.wait()
+            won.extend(key for key in keys if stress.claim(key))
+
+        threads = [threading.Thread(target=claim_all, args=(won,)) for won in wins]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        duplicates += sum(map(len, wins)) - len(keys)
+    print(f"8 threads x 2000 keys x 20 runs: {duplicates} duplicate claims")
+    try:
+        IssuanceLedger.violation_key(car, ParkingMeter(60))
+    except ValueError as e:
+        print(f"Rejected: {e}")
+
+    clock_now = [0.0]
+    short = IssuanceLedger(capacity=10, ttl_seconds=60, shards=1, clock=lambda: clock_now[0])
+    short.claim("A")
+    clock_now[0] = 61.0
+    print(f"Claim after TTL expiry succeeds: {short.claim('A')}")
@@ -18,6 +18,8 @@ class ParkedCar:
         self.color = color
         self.license_number = license_number
         self._minutes_parked = minutes_parked  # private attribute
+        self._listeners = []
+        self._dirty = False
 
     @property
     def minutes_parked(self):
@@ -29,12 +31,39 @@ class ParkedCar:
         """
         Setter for minutes_parked.
         Preconditions: value must be a positive integer (> 0)
-        Postconditions: _minutes_parked is updated
+        Postconditions: _minutes_parked is updated; listeners notified if it changed
         Raises ValueError if value <= 0
         """
         if value <= 0:
             raise ValueError("Minutes parked must be greater than 0.")
+        old = self._minutes_parked
         self._minutes_parked = value
+        if value != old:
+            self._dirty = True
+            for listener in self._listeners:
+                listener(self, old, value)
+
+    # ---- Change Notification ----
+
+    def add_listener(self, callback):
+        """
+        Preconditions: callback accepts (source, old_value, new_value)
+        Postconditions: callback is called whenever minutes_parked changes
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stops notifying callback about changes."""
+        self._listeners.remove(callback)
+
+    @property
+    def dirty(self):
+        """True if minutes_parked changed since the last mark_clean()."""
+        return self._dirty
+
+    def mark_clean(self):
+        """Clears the dirty flag (call after re-inspecting this object)."""
+        self._dirty = False
 
     def __str__(self):
         """Returns a string representation of the parked car."""
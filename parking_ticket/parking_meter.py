@@ -7,12 +7,16 @@ Stores the amount of time purchased.
 class ParkingMeter:
     """Represents a parking meter with purchased time."""
 
-    def __init__(self, minutes_purchased=60):
+    def __init__(self, minutes_purchased=60, meter_id=None):
         """
-        Preconditions: minutes_purchased is a positive integer
+        Preconditions: minutes_purchased is a positive integer;
+                       meter_id is an optional str/int identifying the meter
         Postconditions: ParkingMeter object initialized
         """
         self._minutes_purchased = minutes_purchased
+        self.meter_id = meter_id
+        self._listeners = []
+        self._dirty = False
 
     @property
     def minutes_purchased(self):
@@ -24,12 +28,39 @@ class ParkingMeter:
         """
         Setter for minutes_purchased.
         Preconditions: value must be a positive integer (> 0)
-        Postconditions: _minutes_purchased is updated
+        Postconditions: _minutes_purchased is updated; listeners notified if it changed
         Raises ValueError if value <= 0
         """
         if value <= 0:
             raise ValueError("Minutes purchased must be greater than 0.")
+        old = self._minutes_purchased
         self._minutes_purchased = value
+        if value != old:
+            self._dirty = True
+            for listener in self._listeners:
+                listener(self, old, value)
+
+    # ---- Change Notification ----
+
+    def add_listener(self, callback):
+        """
+        Preconditions: callback accepts (source, old_value, new_value)
+        Postconditions: callback is called whenever minutes_purchased changes
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stops notifying callback about changes."""
+        self._listeners.remove(callback)
+
+    @property
+    def dirty(self):
+        """True if minutes_purchased changed since the last mark_clean()."""
+        return self._dirty
+
+    def mark_clean(self):
+        """Clears the dirty flag (call after re-inspecting this object)."""
+        self._dirty = False
 
     def __str__(self):
         """Returns a string representation of the parking meter."""
@@ -37,7 +68,9 @@ class ParkingMeter:
 
     def __repr__(self):
         """Returns a developer-friendly string representation."""
-        return f"ParkingMeter({self._minutes_purchased!r})"
+        if self.meter_id is None:
+            return f"ParkingMeter({self._minutes_purchased!r})"
+        return f"ParkingMeter({self._minutes_purchased!r}, {self.meter_id!r})"
 
 
 # ---- Unit Tests ----
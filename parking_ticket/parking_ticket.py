@@ -5,6 +5,8 @@ Calculates fines and reports details about the violation.
 
 import math
 
+import instrumentation
+
 
 class ParkingTicket:
     """Represents a parking ticket issued for illegal parking."""
@@ -20,6 +22,9 @@ class ParkingTicket:
         self.badge_number = officer.badge_number
         self.illegal_minutes = illegal_minutes
         self.fine = self.calculate_fine()
+        hooks = instrumentation.active
+        if hooks is not None:
+            hooks.record_ticket(self)
 
     def calculate_fine(self):
         """
@@ -29,7 +34,16 @@ class ParkingTicket:
         Preconditions: illegal_minutes > 0
         Postconditions: Returns the total fine as a float
         """
-        total_hours = math.ceil(self.illegal_minutes / 60)
+        return self.fine_for(self.illegal_minutes)
+
+    @staticmethod
+    def fine_for(illegal_minutes):
+        """
+        Preconditions: illegal_minutes > 0
+        Postconditions: Returns the fine for that many illegal minutes
+                        without creating a ticket
+        """
+        total_hours = math.ceil(illegal_minutes / 60)
         fine = 25.00  # first hour or part
         if total_hours > 1:
             fine += (total_hours - 1) * 10.00  # each additional hour or part
@@ -3,6 +3,7 @@ PoliceOfficer Class - Simulates a police officer inspecting parked cars.
 Examines a ParkedCar and ParkingMeter to determine if a ticket should be issued.
 """
 
+import instrumentation
 from parking_ticket import ParkingTicket
 
 
@@ -51,10 +52,16 @@ class PoliceOfficer:
         Postconditions: Returns a ParkingTicket if illegally parked,
                         or None if legally parked
         """
+        hooks = instrumentation.active
+        if hooks is not None:
+            start = hooks.clock()
+        ticket = None
         if parked_car.minutes_parked > parking_meter.minutes_purchased:
             illegal_minutes = parked_car.minutes_parked - parking_meter.minutes_purchased
-            return ParkingTicket(parked_car, self, illegal_minutes)
-        return None
+            ticket = ParkingTicket(parked_car, self, illegal_minutes)
+        if hooks is not None:
+            hooks.record_inspection(self, parked_car, parking_meter, ticket, start)
+        return ticket
 
     def __str__(self):
         """Returns a string representation of the officer."""
@@ -0,0 +1,106 @@
+"""
+WorkloadGenerator Class - Builds synthetic parking lots for benchmarking.
+Produces (ParkedCar, ParkingMeter) pairs with a configurable lot size,
+violation rate and overstay distribution.
+"""
+
+import random
+
+from parked_car import ParkedCar
+from parking_meter import ParkingMeter
+
+
+class WorkloadGenerator:
+    """Generates reproducible parking lot workloads."""
+
+    DISTRIBUTIONS = ("uniform", "exponential", "lognormal")
+
+    MAKES = [
+        ("Toyota", "Camry"), ("Honda", "Accord"), ("Ford", "Mustang"),
+        ("Nissan", "Altima"), ("Chevy", "Malibu"), ("BMW", "X5"),
+        ("Mazda", "3"),
+    ]
+    COLORS = ["Red", "Blue", "Black", "White", "Silver"]
+
+    def __init__(self, violation_rate=0.3, overstay_distribution="exponential",
+                 mean_overstay=45, min_purchase=15, max_purchase=240, seed=None):
+        """
+        Preconditions: violation_rate is a float in [0, 1];
+                       overstay_distribution is one of DISTRIBUTIONS;
+                       mean_overstay, min_purchase, max_purchase are positive ints
+        Postconditions: WorkloadGenerator initialized with its own RNG
+        """
+        if not 0 <= violation_rate <= 1:
+            raise ValueError("Violation rate must be between 0 and 1.")
+        if overstay_distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Overstay distribution must be one of {self.DISTRIBUTIONS}.")
+        if mean_overstay <= 0:
+            raise ValueError("Mean overstay must be greater than 0.")
+        if not 0 < min_purchase <= max_purchase:
+            raise ValueError("Purchase range must be positive and ordered.")
+        self.violation_rate = violation_rate
+        self.overstay_distribution = overstay_distribution
+        self.mean_overstay = mean_overstay
+        self.min_purchase = min_purchase
+        self.max_purchase = max_purchase
+        self._rng = random.Random(seed)
+
+    def _overstay(self):
+        """Returns a positive number of minutes over the purchased time."""
+        rng = self._rng
+        if self.overstay_distribution == "uniform":
+            minutes = rng.uniform(1, 2 * self.mean_overstay)
+        elif self.overstay_distribution == "exponential":
+            minutes = rng.expovariate(1 / self.mean_overstay)
+        else:
+            # sigma of 1 gives a long right tail; mu chosen so the mean matches
+            minutes = rng.lognormvariate(0, 1) * self.mean_overstay / 1.6487
+        return max(1, int(round(minutes)))
+
+    def make_pair(self, index):
+        """
+        Preconditions: index is a non-negative int (used for the plate number)
+        Postconditions: Returns one (ParkedCar, ParkingMeter) pair
+        """
+        rng = self._rng
+        purchased = rng.randint(self.min_purchase, self.max_purchase)
+        if rng.random() < self.violation_rate:
+            parked = purchased + self._overstay()
+        else:
+            parked = rng.randint(1, purchased)
+        make, model = rng.choice(self.MAKES)
+        car = ParkedCar(make, model, rng.choice(self.COLORS), f"BEN{index:07d}", parked)
+        return car, ParkingMeter(purchased)
+
+    def generate(self, lot_size):
+        """
+        Preconditions: lot_size is a non-negative int
+        Postconditions: Returns a list of lot_size (ParkedCar, ParkingMeter) pairs
+        """
+        return [self.make_pair(i) for i in range(lot_size)]
+
+    def iter_pairs(self, lot_size):
+        """Yields lot_size pairs lazily, for lots too large to hold at once."""
+        for i in range(lot_size):
+            yield self.make_pair(i)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"WorkloadGenerator({self.violation_rate!r}, {self.overstay_distribution!r}, "
+                f"{self.mean_overstay!r}, {self.min_purchase!r}, {self.max_purchase!r})")
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    print("=" * 50)
+    print("WorkloadGenerator Class - Unit Tests")
+    print("=" * 50)
+
+    for dist in WorkloadGenerator.DISTRIBUTIONS:
+        gen = WorkloadGenerator(violation_rate=0.5, overstay_distribution=dist, seed=42)
+        lot = gen.generate(1000)
+        violators = sum(1 for car, meter in lot
+                        if car.minutes_parked > meter.minutes_purchased)
+        print(f"\n{dist}: {len(lot)} cars, {violators} violators")
+        car, meter = lot[0]
+        print(f"  First car: {car!r}, {meter!r}")
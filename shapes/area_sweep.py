@@ -0,0 +1,163 @@
+"""
+Shapes Hierarchy - Sweep-Line Area Computation (area_sweep.py)
+Computes the area covered by a set of positioned rectangles and squares
+(union), the area covered by two or more of them (overlap) and the area
+common to all of them (intersection) without pairwise checks.
+
+The union/overlap sweep walks the rectangles' left and right edges in x
+order while a segment tree over the distinct y edges tracks how much of
+the current vertical line is covered once and at least twice:
+O(n log n) for n rectangles.
+"""
+
+from rectangle import Rectangle
+
+
+class _CoverageTree:
+    """Segment tree over sorted y edges tracking single and double coverage."""
+
+    def __init__(self, ys):
+        self.ys = ys
+        size = 4 * max(1, len(ys))
+        self.count = [0] * size   # intervals covering this node entirely
+        self.once = [0.0] * size  # length covered at least once
+        self.twice = [0.0] * size  # length covered at least twice
+
+    def add(self, lo, hi, delta, node=1, node_lo=0, node_hi=None):
+        """Adds delta to the cover count of ys[lo]..ys[hi]."""
+        if node_hi is None:
+            node_hi = len(self.ys) - 1
+        if hi <= node_lo or node_hi <= lo:
+            return
+        if lo <= node_lo and node_hi <= hi:
+            self.count[node] += delta
+        else:
+            mid = (node_lo + node_hi) // 2
+            self.add(lo, hi, delta, 2 * node, node_lo, mid)
+            self.add(lo, hi, delta, 2 * node + 1, mid, node_hi)
+        self._pull(node, node_lo, node_hi)
+
+    def _pull(self, node, node_lo, node_hi):
+        full = self.ys[node_hi] - self.ys[node_lo]
+        count = self.count[node]
+        leaf = node_hi - node_lo == 1
+        if count >= 2:
+            self.once[node] = self.twice[node] = full
+        elif count == 1:
+            self.once[node] = full
+            self.twice[node] = 0.0 if leaf else self.once[2 * node] + self.once[2 * node + 1]
+        elif leaf:
+            self.once[node] = self.twice[node] = 0.0
+        else:
+            self.once[node] = self.once[2 * node] + self.once[2 * node + 1]
+            self.twice[node] = self.twice[2 * node] + self.twice[2 * node + 1]
+
+
+def _boxes(shapes):
+    """Returns the bounding boxes of shapes, which must all be rectangles."""
+    boxes = []
+    for shape in shapes:
+        if not isinstance(shape, Rectangle):
+            raise TypeError(f"Sweep-line areas need rectangles or squares, "
+                            f"not {type(shape).__name__}.")
+        boxes.append(shape.bounding_box())
+    return boxes
+
+
+def _sweep(boxes):
+    """Returns (union area, area covered at least twice) for the boxes."""
+    if not boxes:
+        return 0.0, 0.0
+    ys = sorted({y for box in boxes for y in (box[1], box[3])})
+    y_index = {y: i for i, y in enumerate(ys)}
+    events = []
+    for xmin, ymin, xmax, ymax in boxes:
+        events.append((xmin, 1, y_index[ymin], y_index[ymax]))
+        events.append((xmax, -1, y_index[ymin], y_index[ymax]))
+    events.sort()
+
+    tree = _CoverageTree(ys)
+    union = overlap = 0.0
+    last_x = events[0][0]
+    for x, delta, lo, hi in events:
+        width = x - last_x
+        if width:
+            union += tree.once[1] * width
+            overlap += tree.twice[1] * width
+            last_x = x
+        tree.add(lo, hi, delta)
+    return union, overlap
+
+
+def union_area(shapes):
+    """
+    Preconditions: shapes is an iterable of Rectangle/Square objects
+    Postconditions: Returns the total area covered by at least one shape
+    """
+    return _sweep(_boxes(shapes))[0]
+
+
+def overlap_area(shapes):
+    """
+    Preconditions: shapes is an iterable of Rectangle/Square objects
+    Postconditions: Returns the area covered by two or more shapes
+    """
+    return _sweep(_boxes(shapes))[1]
+
+
+def intersection_area(shapes):
+    """
+    Preconditions: shapes is an iterable of Rectangle/Square objects
+    Postconditions: Returns the area common to every shape (0.0 if none)
+    """
+    boxes = _boxes(shapes)
+    if not boxes:
+        return 0.0
+    xmin = max(b[0] for b in boxes)
+    ymin = max(b[1] for b in boxes)
+    xmax = min(b[2] for b in boxes)
+    ymax = min(b[3] for b in boxes)
+    if xmax <= xmin or ymax <= ymin:
+        return 0.0
+    return (xmax - xmin) * (ymax - ymin)
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    from square import Square
+
+    print("=" * 50)
+    print("Sweep-Line Area - Unit Tests")
+    print("=" * 50)
+
+    plan = [
+        Rectangle(10, 5, "Hall", 0, 0),
+        Rectangle(4, 10, "Stair", 8, 0),
+        Square(3, "Closet", 20, 20),
+    ]
+    print(f"\nShape areas: {sum(s.area for s in plan)}")
+    print(f"Union area: {union_area(plan)}")            # 50 + 40 + 9 - 10
+    print(f"Overlap area: {overlap_area(plan)}")        # Hall/Stair share 2 x 5
+    print(f"Intersection of Hall and Stair: {intersection_area(plan[:2])}")
+
+    # Cross-check the union on a coarse integer grid
+    rng = random.Random(3)
+    rects = [Rectangle(rng.randint(1, 10), rng.randint(1, 10), "R",
+                       rng.randint(0, 30), rng.randint(0, 30)) for _ in range(60)]
+    counts = {}
+    for r in rects:
+        for gx in range(r.x, r.x + r.length):
+            for gy in range(r.y, r.y + r.width):
+                counts[(gx, gy)] = counts.get((gx, gy), 0) + 1
+    print(f"\nUnion matches grid count: {union_area(rects) == len(counts)}")
+    print(f"Overlap matches grid count: "
+          f"{overlap_area(rects) == sum(1 for c in counts.values() if c >= 2)}")
+
+    big = [Rectangle(rng.uniform(1, 20), rng.uniform(1, 20), "Room",
+                     rng.uniform(0, 5000), rng.uniform(0, 5000)) for _ in range(100_000)]
+    start = time.perf_counter()
+    total = union_area(big)
+    print(f"\n100,000 rooms: union {total:,.0f} computed in {time.perf_counter() - start:.2f}s")
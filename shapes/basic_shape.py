@@ -1,25 +1,45 @@
 """
 BasicShape Class - Abstract base class for the Shapes hierarchy.
 Uses abc.ABC and @abstractmethod to define a formal interface.
+Area is computed lazily: setters only mark it dirty, and calc_area runs
+on the first read of `area` after a change. Listeners registered with
+add_listener are told about every geometry change (once per batch_update).
 """
 
+import sys
 from abc import ABC, abstractmethod
+from array import array
+from contextlib import contextmanager
+
+_NUMBER_TYPES = {int, float}
 
 
 class BasicShape(ABC):
     """Abstract base class for all shapes."""
 
+    # No per-instance __dict__: every field lives in a fixed slot
+    __slots__ = ("_area", "_name", "_area_dirty", "_batch_depth", "_batch_pending",
+                 "_listeners")
+
     def __init__(self):
         """
         Preconditions: None
-        Postconditions: Protected attributes _area and _name initialized
+        Postconditions: Protected attributes _area and _name initialized;
+                        area is dirty until first read
         """
         self._area = 0.0
         self._name = ""
+        self._area_dirty = True
+        self._batch_depth = 0
+        self._batch_pending = False
+        self._listeners = None  # list created by the first add_listener
 
     @property
     def area(self):
-        """Getter for _area."""
+        """Getter for _area. Recalculates first if the geometry changed."""
+        if self._area_dirty:
+            self.calc_area()
+            self._area_dirty = False
         return self._area
 
     @area.setter
@@ -30,6 +50,7 @@ class BasicShape(ABC):
         if value < 0:
             raise ValueError("Area cannot be negative.")
         self._area = value
+        self._area_dirty = False
 
     @property
     def name(self):
@@ -41,20 +62,161 @@ class BasicShape(ABC):
         """Setter for _name. Validates that name is a string."""
         if not isinstance(value, str):
             raise TypeError("Name must be a string.")
-        self._name = value
+        self._name = sys.intern(value)
+
+    @staticmethod
+    def _intern_name(name):
+        """Interns string names so equal names share one object."""
+        return sys.intern(name) if type(name) is str else name
+
+    # ---- Change Notification ----
+
+    def add_listener(self, callback):
+        """
+        Preconditions: callback accepts one argument (this shape)
+        Postconditions: callback is called after every geometry change
+        """
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stops notifying callback about changes."""
+        self._listeners.remove(callback)
+        if not self._listeners:
+            self._listeners = None
+
+    def _notify_listeners(self):
+        for callback in tuple(self._listeners):
+            callback(self)
+
+    def _moved(self):
+        """Called by position setters; the area is unaffected."""
+        if self._batch_depth:
+            self._batch_pending = True
+        elif self._listeners is not None:
+            self._notify_listeners()
+
+    # ---- Lazy Area ----
+
+    def _invalidate_area(self):
+        """Called by geometry setters; defers to the end of a batch_update."""
+        if self._batch_depth:
+            self._batch_pending = True
+        else:
+            self._area_dirty = True
+            if self._listeners is not None:
+                self._notify_listeners()
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Preconditions: None
+        Postconditions: Setters inside the block do not invalidate area (reads
+                        see the value from before the block); area is marked
+                        dirty and listeners notified once on exit if anything
+                        changed
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                self._invalidate_area()
+
+    # ---- Bulk Construction ----
+    # Used by the subclasses' from_arrays: each column is checked once with
+    # the setter rules, and errors name the first offending row.
+
+    @staticmethod
+    def _columns(*columns):
+        """Returns the columns as sequences; raises ValueError on length mismatch."""
+        columns = [c if isinstance(c, (list, tuple, array)) else list(c) for c in columns]
+        if len({len(c) for c in columns}) > 1:
+            raise ValueError("Arrays must all have the same length.")
+        return columns
+
+    @staticmethod
+    def _check_column(values, label, positive=False):
+        """
+        Preconditions: values is a list, tuple or array; label is the field
+                       name used in the setter's error messages
+        Postconditions: Raises TypeError/ValueError like the setter, prefixed
+                        with the first offending row index
+        """
+        # Whole-column checks first; only a failure pays for a row scan.
+        # A numeric array needs no type check at all.
+        typed = isinstance(values, array) and values.typecode != "u"
+        if not typed and not set(map(type, values)) <= _NUMBER_TYPES:
+            for i, value in enumerate(values):
+                if not isinstance(value, (int, float)):
+                    raise TypeError(f"Row {i}: {label} must be a number.")
+        if positive and values and not min(values) > 0:
+            for i, value in enumerate(values):
+                if value <= 0:
+                    raise ValueError(f"Row {i}: {label} must be positive.")
+
+    @staticmethod
+    def _name_column(names, count, default):
+        """Returns count interned names from None, one string or a sequence."""
+        if names is None:
+            names = default
+        if isinstance(names, str):
+            return [sys.intern(names)] * count
+        names = list(names)
+        if len(names) != count:
+            raise ValueError("Arrays must all have the same length.")
+        if set(map(type, names)) <= {str}:
+            return list(map(sys.intern, names))
+        for i, name in enumerate(names):
+            if not isinstance(name, str):
+                raise TypeError(f"Row {i}: Name must be a string.")
+        return [sys.intern(name) if type(name) is str else name for name in names]
 
     def __str__(self):
         """Returns a user-friendly string representation."""
-        return f"{self._name}: Area = {self._area:.5f}"
+        return f"{self._name}: Area = {self.area:.5f}"
 
     def __repr__(self):
         """Returns a developer-friendly string representation."""
-        return f"BasicShape(name={self._name!r}, area={self._area!r})"
+        return f"BasicShape(name={self._name!r}, area={self.area!r})"
 
     @abstractmethod
     def calc_area(self):
         """
         Abstract method - must be overridden in all subclasses.
-        Calculates and stores the area in _area.
+        Calculates and stores the area in _area. Called lazily by the
+        area getter, so subclasses should not call it from setters.
         """
         pass
+
+    @abstractmethod
+    def bounding_box(self):
+        """
+        Abstract method - must be overridden in all subclasses.
+        Returns the axis-aligned bounding box as (xmin, ymin, xmax, ymax).
+        """
+        pass
+
+    @abstractmethod
+    def calc_perimeter(self):
+        """
+        Abstract method - must be overridden in all subclasses.
+        Returns the length of the shape's boundary.
+        """
+        pass
+
+    @abstractmethod
+    def centroid(self):
+        """
+        Abstract method - must be overridden in all subclasses.
+        Returns the centre of mass as (x, y).
+        """
+        pass
+
+    @property
+    def perimeter(self):
+        """Perimeter of the shape (computed on read; it is cheap)."""
+        return self.calc_perimeter()
@@ -0,0 +1,172 @@
+"""
+Shapes Hierarchy - Benchmark Suite (benchmark.py)
+Measures the per-object costs of the shape classes at increasing scale:
+construction, validated setters, setter-triggered area recalculation,
+polymorphic area access over a mixed list and __str__ formatting. Also
+reports bytes per object and the share of setter time spent in the
+isinstance/sign validation. Results are printed or written as JSON so they
+can be compared across releases.
+
+Usage: python benchmark.py --sizes 1000 10000 100000 1000000 10000000
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+
+from circle import Circle
+from memory_benchmark import BUILDERS, measure
+from rectangle import Rectangle
+from square import Square
+
+KINDS = ("Circle", "Rectangle", "Square")
+
+
+def make_values(n, seed):
+    """Returns n positive floats in [0.5, 10.5) from a seeded generator."""
+    rng = random.Random(seed)
+    return [rng.random() * 10 + 0.5 for _ in range(n)]
+
+
+def build(kind, values):
+    """Returns a list of shapes of one kind, one per value."""
+    if kind == "Circle":
+        return [Circle(v, v, v) for v in values]
+    if kind == "Rectangle":
+        return [Rectangle(v, v + 1, "Rectangle", v, v) for v in values]
+    return [Square(v, "Square", v, v) for v in values]
+
+
+def rate(count, seconds):
+    """Returns operations per second (None if the timer did not advance)."""
+    return count / seconds if seconds else None
+
+
+def timed(fn, *args):
+    """Returns (result, elapsed seconds) for fn(*args) with the GC paused."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+# ---- Individual Benchmarks ----
+
+def _radius_unchecked(self, value):
+    """Circle.radius's setter body without its isinstance and sign checks."""
+    self._radius = value
+    self._invalidate_area()
+
+
+def _call_setter(setter, circles, values):
+    # Both setters are called as plain functions so only their bodies differ
+    for c, v in zip(circles, values):
+        setter(c, v)
+
+
+def _set_and_read_area(circles, values):
+    for c, v in zip(circles, values):
+        c.radius = v
+        c.area
+
+
+def _read_areas(shapes):
+    total = 0.0
+    for s in shapes:
+        total += s.area
+    return total
+
+
+def _invalidate_all(shapes):
+    for s in shapes:
+        s._area_dirty = True
+
+
+def _format_all(shapes):
+    for s in shapes:
+        str(s)
+
+
+def run_size(n, seed):
+    """Runs every benchmark for n shapes per kind and returns a result dict."""
+    values = make_values(n, seed)
+    shifted = [v + 1 for v in values]
+
+    construct = {}
+    shapes = {}
+    for kind in KINDS:
+        shapes[kind], elapsed = timed(build, kind, values)
+        construct[kind] = rate(n, elapsed)
+
+    circles = shapes["Circle"]
+    _, checked = timed(_call_setter, Circle.radius.fset, circles, shifted)
+    _, unchecked = timed(_call_setter, _radius_unchecked, circles, values)
+    _, recalc = timed(_set_and_read_area, circles, shifted)
+
+    # Interleave kinds so every access dispatches on a different class
+    mixed = [s for row in zip(*(shapes[kind] for kind in KINDS)) for s in row]
+    _invalidate_all(mixed)
+    _, first_read = timed(_read_areas, mixed)
+    _, cached_read = timed(_read_areas, mixed)
+    _, formatting = timed(_format_all, mixed)
+
+    return {
+        "size": n,
+        "construct_per_second": construct,
+        "setter_per_second": rate(n, checked),
+        "setter_unchecked_per_second": rate(n, unchecked),
+        "isinstance_share": (checked - unchecked) / checked if checked else None,
+        "setter_recalc_per_second": rate(n, recalc),
+        "area_recalc_per_second": rate(len(mixed), first_read),
+        "area_cached_per_second": rate(len(mixed), cached_read),
+        "str_per_second": rate(len(mixed), formatting),
+    }
+
+
+def run(sizes, seed, memory_count):
+    """Runs the benchmark at every size; returns the JSON-ready report."""
+    results = []
+    for n in sizes:
+        results.append(run_size(n, seed))
+        print(f"size {n:,}: done", file=sys.stderr)
+    return {
+        "benchmark": "shapes",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"seed": seed, "memory_count": memory_count},
+        "bytes_per_object": {kind: measure(BUILDERS[kind], memory_count) for kind in KINDS},
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the shape classes.")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--memory-count", type=int, default=100_000,
+                        help="shapes per kind traced for bytes/object")
+    parser.add_argument("--output", help="write JSON to this file instead of stdout")
+    args = parser.parse_args(argv)
+    if any(n <= 0 for n in args.sizes) or args.memory_count <= 0:
+        parser.error("Sizes and memory count must be greater than 0.")
+
+    report = run(args.sizes, args.seed, args.memory_count)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
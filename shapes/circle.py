@@ -1,7 +1,7 @@
 """
 Circle Class - Inherits from BasicShape.
 Represents a circle with center coordinates and radius.
-Area is automatically recalculated when radius changes.
+Area is recalculated lazily after the radius changes.
 """
 
 import math
@@ -11,19 +11,53 @@ from basic_shape import BasicShape
 class Circle(BasicShape):
     """Represents a circle shape."""
 
+    __slots__ = ("_x_center", "_y_center", "_radius")
+
     def __init__(self, x_center, y_center, radius, name="Circle"):
         """
         Preconditions: x_center, y_center are floats (center coordinates),
                        radius is a positive float,
                        name is a string (shape name)
-        Postconditions: Circle object initialized with area calculated
+        Postconditions: Circle object initialized; area calculated on first read
         """
         super().__init__()
         self._x_center = x_center
         self._y_center = y_center
         self._radius = radius
-        self._name = name
-        self.calc_area()
+        self._name = self._intern_name(name)
+
+    @classmethod
+    def from_arrays(cls, x_center, y_center, radius, names=None, as_collection=False):
+        """
+        Preconditions: x_center, y_center, radius are equal-length lists,
+                       tuples or arrays of numbers (radii positive); names is
+                       None, one string or a sequence of strings
+        Postconditions: Returns a list of Circles built without per-field
+                        setter calls, or a ShapeCollection if as_collection;
+                        a bad row raises the setter's error with its index
+        """
+        if as_collection:
+            from shape_collection import ShapeCollection  # it imports this module
+            collection = ShapeCollection()
+            collection.extend_circles(x_center, y_center, radius, names)
+            return collection
+        x_center, y_center, radius = cls._columns(x_center, y_center, radius)
+        cls._check_column(x_center, "x_center")
+        cls._check_column(y_center, "y_center")
+        cls._check_column(radius, "Radius", positive=True)
+        names = cls._name_column(names, len(radius), "Circle")
+
+        new, init = cls.__new__, BasicShape.__init__
+        circles = []
+        for x, y, r, name in zip(x_center, y_center, radius, names):
+            circle = new(cls)
+            init(circle)
+            circle._x_center = x
+            circle._y_center = y
+            circle._radius = r
+            circle._name = name
+            circles.append(circle)
+        return circles
 
     def calc_area(self):
         """
@@ -32,9 +66,28 @@ class Circle(BasicShape):
         """
         self._area = math.pi * self._radius ** 2
 
+    def bounding_box(self):
+        """Returns (xmin, ymin, xmax, ymax) of the square enclosing the circle."""
+        r = self._radius
+        return (self._x_center - r, self._y_center - r,
+                self._x_center + r, self._y_center + r)
+
+    def calc_perimeter(self):
+        """Returns the circumference of the circle (2 * pi * r)."""
+        return 2 * math.pi * self._radius
+
+    @property
+    def circumference(self):
+        """Circumference of the circle (same as perimeter)."""
+        return 2 * math.pi * self._radius
+
+    def centroid(self):
+        """Returns the centre of the circle as (x, y)."""
+        return (self._x_center, self._y_center)
+
     def __str__(self):
         """Returns a user-friendly string representation."""
-        return f"{self._name}: Center=({self._x_center}, {self._y_center}), Radius={self._radius}, Area={self._area:.5f}"
+        return f"{self._name}: Center=({self._x_center}, {self._y_center}), Radius={self._radius}, Area={self.area:.5f}"
 
     def __repr__(self):
         """Returns a developer-friendly string representation."""
@@ -47,10 +100,11 @@ class Circle(BasicShape):
 
     @x_center.setter
     def x_center(self, value):
-        """Setter for _x_center. Validates that value is a number."""
+        """Setter for _x_center. Validates that value is a number and notifies listeners."""
         if not isinstance(value, (int, float)):
             raise TypeError("x_center must be a number.")
         self._x_center = value
+        self._moved()
 
     @property
     def y_center(self):
@@ -59,10 +113,11 @@ class Circle(BasicShape):
 
     @y_center.setter
     def y_center(self, value):
-        """Setter for _y_center. Validates that value is a number."""
+        """Setter for _y_center. Validates that value is a number and notifies listeners."""
         if not isinstance(value, (int, float)):
             raise TypeError("y_center must be a number.")
         self._y_center = value
+        self._moved()
 
     @property
     def radius(self):
@@ -73,14 +128,14 @@ class Circle(BasicShape):
     def radius(self, value):
         """
         Setter for _radius. Validates positive value and
-        automatically recalculates area.
+        marks the area for recalculation.
         """
         if not isinstance(value, (int, float)):
             raise TypeError("Radius must be a number.")
         if value <= 0:
             raise ValueError("Radius must be positive.")
         self._radius = value
-        self.calc_area()
+        self._invalidate_area()
 
 
 # ---- Unit Tests ----
@@ -94,3 +149,13 @@ if __name__ == "__main__":
 
     c.radius = 8
     print(f"After doubling radius: radius={c.radius}, area={c.area:.5f}")
+
+    # Bulk construction from trusted columns
+    from array import array
+    circles = Circle.from_arrays(array("d", [0, 1, 2]), [0, 1, 2], [1, 2, 3])
+    print(f"\nfrom_arrays: {circles}")
+    try:
+        Circle.from_arrays([0, 1, 2], [0, 1, 2], [1, -2, 3])
+    except ValueError as e:
+        print(f"Bad row rejected: {e}")
+    print(f"As a collection: {Circle.from_arrays([0], [0], [4], as_collection=True)!r}")
@@ -0,0 +1,151 @@
+"""
+Shapes Hierarchy - Memory Benchmark (memory_benchmark.py)
+Uses tracemalloc to measure bytes per shape for the slotted Circle,
+Rectangle and Square classes, for standalone copies of the pre-__slots__
+classes (every field in a per-instance __dict__, names not interned), and
+for ShapeCollection columns. Results are printed as JSON.
+
+Usage: python memory_benchmark.py --count 10000000
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import tracemalloc
+
+from circle import Circle
+from rectangle import Rectangle
+from shape_collection import ShapeCollection
+from square import Square
+
+
+# ---- Baseline Classes ----
+# Independent copies of the pre-__slots__ classes, reduced to what affects
+# an instance's memory: the same attributes, set the same way, in a
+# __dict__. They do not inherit from the slotted classes, whose slots would
+# otherwise hold the fields and hide the cost being measured.
+
+class DictShape:
+    """Pre-__slots__ BasicShape: lazy area, batch flags and name in a __dict__."""
+
+    def __init__(self):
+        self._area = 0.0
+        self._name = ""
+        self._area_dirty = True
+        self._batch_depth = 0
+        self._batch_pending = False
+
+    @property
+    def area(self):
+        if self._area_dirty:
+            self.calc_area()
+            self._area_dirty = False
+        return self._area
+
+
+class DictCircle(DictShape):
+    """Pre-__slots__ Circle."""
+
+    def __init__(self, x_center, y_center, radius, name="Circle"):
+        super().__init__()
+        self._x_center = x_center
+        self._y_center = y_center
+        self._radius = radius
+        self._name = name
+
+    def calc_area(self):
+        self._area = math.pi * self._radius ** 2
+
+
+class DictRectangle(DictShape):
+    """Pre-__slots__ Rectangle."""
+
+    def __init__(self, length, width, name="Rectangle"):
+        super().__init__()
+        self._length = length
+        self._width = width
+        self._name = name
+
+    def calc_area(self):
+        self._area = self._length * self._width
+
+
+class DictSquare(DictRectangle):
+    """Pre-__slots__ Square, which also kept its own _side."""
+
+    def __init__(self, side, name="Square"):
+        self._side = side
+        super().__init__(side, side, name)
+
+
+BUILDERS = {
+    "Circle": lambda i: Circle(i, i, 1.5, f"Circle_{i % 100}"),
+    "Rectangle": lambda i: Rectangle(2.0, 3.0, f"Rectangle_{i % 100}"),
+    "Square": lambda i: Square(2.0, f"Square_{i % 100}"),
+    "DictCircle": lambda i: DictCircle(i, i, 1.5, f"Circle_{i % 100}"),
+    "DictRectangle": lambda i: DictRectangle(2.0, 3.0, f"Rectangle_{i % 100}"),
+    "DictSquare": lambda i: DictSquare(2.0, f"Square_{i % 100}"),
+}
+
+
+def measure(build, count):
+    """
+    Preconditions: build(i) returns one shape; count is a positive int
+    Postconditions: Returns traced bytes per shape, excluding the holding list
+    """
+    gc.collect()
+    tracemalloc.start()
+    shapes = [None] * count
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        shape = build(i)
+        shape.area  # materialise the lazily computed area
+        shapes[i] = shape
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del shapes
+    return (after - before) / count
+
+
+def measure_collection(count):
+    """Returns traced bytes per circle stored in a ShapeCollection."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    collection = ShapeCollection()
+    for i in range(count):
+        collection.add_circle(i, i, 1.5)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del collection
+    return (after - before) / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure bytes per shape.")
+    parser.add_argument("--count", type=int, default=10_000_000)
+    parser.add_argument("--kinds", nargs="+", choices=list(BUILDERS) + ["ShapeCollection"],
+                        default=list(BUILDERS) + ["ShapeCollection"])
+    args = parser.parse_args(argv)
+
+    results = {}
+    for kind in args.kinds:
+        if kind == "ShapeCollection":
+            results[kind] = measure_collection(args.count)
+        else:
+            results[kind] = measure(BUILDERS[kind], args.count)
+        print(f"{kind}: {results[kind]:.1f} bytes/shape", file=sys.stderr)
+
+    print(json.dumps({
+        "benchmark": "shapes_memory",
+        "python": platform.python_version(),
+        "count": args.count,
+        "bytes_per_shape": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+ParallelPipeline Class - Chunked map/reduce over a ShapeCollection on a
+process pool.
+
+The collection's columns are copied once into a single shared-memory
+block. Workers attach to it by name and read their chunk's column slices
+in place, so tasks carry only (block name, kind, offsets, row range) and
+no shape objects are ever pickled. Chunks are reduced inside the worker
+and only the partial results travel back.
+"""
+
+import math
+import multiprocessing
+import os
+from array import array
+from functools import reduce
+from multiprocessing import shared_memory
+
+from shape_collection import (circle_areas, circle_perimeters, rectangle_areas,
+                              rectangle_perimeters, square_areas, square_perimeters)
+
+# Column layout per kind; map functions receive the fields in this order
+KIND_COLUMNS = {
+    "circle": ("circle_x", "circle_y", "circle_radius"),
+    "rectangle": ("rect_x", "rect_y", "rect_length", "rect_width"),
+    "square": ("square_x", "square_y", "square_side"),
+}
+
+# Built-in per-kind kernels: (fields) -> array('d'), fields minus x/y
+BUILTIN_KERNELS = {
+    "area": {"circle": circle_areas, "rectangle": rectangle_areas, "square": square_areas},
+    "perimeter": {"circle": circle_perimeters, "rectangle": rectangle_perimeters,
+                  "square": square_perimeters},
+}
+
+
+def _run_chunk(task):
+    """Worker entry point: reduces one chunk read straight from shared memory."""
+    block_name, kind, offsets, start, stop, job = task
+    block = shared_memory.SharedMemory(name=block_name)
+    view = block.buf.cast("d")
+    columns = [view[offset + start:offset + stop] for offset in offsets]
+    try:
+        if job[0] == "builtin":
+            # x/y are not needed by the built-in metrics
+            return math.fsum(BUILTIN_KERNELS[job[1]][kind](*columns[2:]))
+        _, map_fn, reduce_fn, initial = job
+        mapped = map(map_fn, [kind] * (stop - start), *columns)
+        return reduce(reduce_fn, mapped, initial)
+    finally:
+        for column in columns:
+            column.release()
+        view.release()
+        block.close()
+
+
+class ParallelPipeline:
+    """Runs area, perimeter and user map/reduce jobs across worker processes."""
+
+    def __init__(self, collection, workers=None, chunk_size=250_000):
+        """
+        Preconditions: collection is a ShapeCollection; workers is a positive
+                       int (defaults to the CPU count); chunk_size is a
+                       positive int (rows per task)
+        Postconditions: Columns are published to shared memory; the pool is
+                        started on first use. Call close() (or use `with`).
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0 or chunk_size <= 0:
+            raise ValueError("Workers and chunk size must be greater than 0.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._counts = {}
+        self._offsets = {}
+        total = sum(len(getattr(collection, name))
+                    for names in KIND_COLUMNS.values() for name in names)
+        self._block = shared_memory.SharedMemory(create=True, size=max(8, total * 8))
+        view = self._block.buf.cast("d")
+        position = 0
+        for kind, names in KIND_COLUMNS.items():
+            self._counts[kind] = len(getattr(collection, names[-1]))
+            offsets = []
+            for name in names:
+                column = getattr(collection, name)
+                view[position:position + len(column)] = column
+                offsets.append(position)
+                position += len(column)
+            self._offsets[kind] = tuple(offsets)
+        view.release()
+
+    def _tasks(self, job):
+        for kind, count in self._counts.items():
+            for start in range(0, count, self.chunk_size):
+                stop = min(count, start + self.chunk_size)
+                yield (self._block.name, kind, self._offsets[kind], start, stop, job)
+
+    def _run(self, job):
+        tasks = list(self._tasks(job))
+        if self.workers == 1:
+            return [_run_chunk(task) for task in tasks]
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers)
+        return self._pool.map(_run_chunk, tasks, chunksize=1)
+
+    # ---- Jobs ----
+
+    def total_area(self):
+        """Returns the sum of every shape's area."""
+        return math.fsum(self._run(("builtin", "area")))
+
+    def total_perimeter(self):
+        """Returns the sum of every shape's perimeter."""
+        return math.fsum(self._run(("builtin", "perimeter")))
+
+    def map_reduce(self, map_fn, reduce_fn, initial):
+        """
+        Preconditions: map_fn(kind, x, y, *dimensions) and reduce_fn(acc, value)
+                       are module-level (picklable) functions; kind is
+                       "circle", "rectangle" or "square" and the fields follow
+                       KIND_COLUMNS; initial is reduce_fn's identity value
+        Postconditions: Returns reduce_fn folded over every mapped row
+                        (chunks are folded in parallel, then combined)
+        """
+        return reduce(reduce_fn, self._run(("map", map_fn, reduce_fn, initial)), initial)
+
+    # ---- Lifetime ----
+
+    def close(self):
+        """Stops the pool and frees the shared-memory block."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"ParallelPipeline(rows={sum(self._counts.values())}, "
+                f"workers={self.workers!r}, chunk_size={self.chunk_size!r})")
+
+
+# ---- Unit Tests ----
+def _count_large(kind, x, y, *dims):
+    """Example map function: 1 if the shape's first dimension exceeds 2."""
+    return 1 if dims[0] > 2 else 0
+
+
+def _add(a, b):
+    return a + b
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from shape_collection import ShapeCollection
+
+    print("=" * 50)
+    print("ParallelPipeline Class - Unit Tests")
+    print("=" * 50)
+
+    rng = random.Random(5)
+    coll = ShapeCollection()
+    for _ in range(400_000):
+        coll.add_circle(rng.random(), rng.random(), rng.uniform(0.5, 3))
+        coll.add_rectangle(rng.uniform(0.5, 3), rng.uniform(0.5, 3))
+        coll.add_square(rng.uniform(0.5, 3))
+    print(f"\n{coll!r}")
+
+    start = time.perf_counter()
+    serial = coll.total_area()
+    serial_time = time.perf_counter() - start
+    print(f"Serial total area: {serial:,.3f} in {serial_time:.2f}s")
+
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        with ParallelPipeline(coll, workers=workers) as pipe:
+            start = time.perf_counter()
+            area = pipe.total_area()
+            elapsed = time.perf_counter() - start
+            perimeter = pipe.total_perimeter()
+            large = pipe.map_reduce(_count_large, _add, 0)
+        print(f"{workers} worker(s): area matches={math.isclose(area, serial)}, "
+              f"{elapsed:.2f}s, perimeter={perimeter:,.1f}, large={large}")
@@ -1,26 +1,80 @@
 """
 Rectangle Class - Inherits from BasicShape.
-Represents a rectangle with length and width.
-Area is automatically recalculated when dimensions change.
+Represents a rectangle with length (along x) and width (along y),
+positioned by its lower-left corner (x, y).
+Area is recalculated lazily after the dimensions change.
 """
 
+import math
+
 from basic_shape import BasicShape
 
 
 class Rectangle(BasicShape):
     """Represents a rectangle shape."""
 
-    def __init__(self, length, width, name="Rectangle"):
+    __slots__ = ("_length", "_width", "_x", "_y")
+
+    def __init__(self, length, width, name="Rectangle", x=0, y=0):
         """
         Preconditions: length, width are positive floats,
-                       name is a string (shape name)
-        Postconditions: Rectangle object initialized with area calculated
+                       name is a string (shape name),
+                       x, y are floats (lower-left corner, default origin)
+        Postconditions: Rectangle object initialized; area calculated on first read
         """
         super().__init__()
         self._length = length
         self._width = width
-        self._name = name
-        self.calc_area()
+        self._name = self._intern_name(name)
+        self._x = x
+        self._y = y
+
+    @classmethod
+    def _origin_columns(cls, x, y, count):
+        """Returns checked x and y columns for from_arrays (None means 0)."""
+        x = [0] * count if x is None else x
+        y = [0] * count if y is None else y
+        x, y = cls._columns(x, y)
+        if len(x) != count:
+            raise ValueError("Arrays must all have the same length.")
+        cls._check_column(x, "x")
+        cls._check_column(y, "y")
+        return x, y
+
+    @classmethod
+    def from_arrays(cls, length, width, names=None, x=None, y=None, as_collection=False):
+        """
+        Preconditions: length, width are equal-length lists, tuples or arrays
+                       of positive numbers; names is None, one string or a
+                       sequence of strings; x, y are None (origin) or number
+                       sequences of the same length
+        Postconditions: Returns a list of Rectangles built without per-field
+                        setter calls, or a ShapeCollection if as_collection;
+                        a bad row raises the setter's error with its index
+        """
+        if as_collection:
+            from shape_collection import ShapeCollection  # it imports this module
+            collection = ShapeCollection()
+            collection.extend_rectangles(length, width, names, x, y)
+            return collection
+        length, width = cls._columns(length, width)
+        cls._check_column(length, "Length", positive=True)
+        cls._check_column(width, "Width", positive=True)
+        names = cls._name_column(names, len(length), "Rectangle")
+        x, y = cls._origin_columns(x, y, len(length))
+
+        new, init = cls.__new__, BasicShape.__init__
+        rects = []
+        for l, w, name, left, bottom in zip(length, width, names, x, y):
+            rect = new(cls)
+            init(rect)
+            rect._length = l
+            rect._width = w
+            rect._name = name
+            rect._x = left
+            rect._y = bottom
+            rects.append(rect)
+        return rects
 
     def calc_area(self):
         """
@@ -29,14 +83,60 @@ class Rectangle(BasicShape):
         """
         self._area = self._length * self._width
 
+    def bounding_box(self):
+        """Returns (xmin, ymin, xmax, ymax); the rectangle is its own box."""
+        return (self._x, self._y, self._x + self._length, self._y + self._width)
+
+    def calc_perimeter(self):
+        """Returns the perimeter of the rectangle (2 * (length + width))."""
+        return 2 * (self._length + self._width)
+
+    @property
+    def diagonal(self):
+        """Length of the rectangle's diagonal."""
+        return math.hypot(self._length, self._width)
+
+    def centroid(self):
+        """Returns the centre of the rectangle as (x, y)."""
+        return (self._x + self._length / 2, self._y + self._width / 2)
+
     def __str__(self):
         """Returns a user-friendly string representation."""
-        return f"{self._name}: Length={self._length}, Width={self._width}, Area={self._area:.5f}"
+        return f"{self._name}: Length={self._length}, Width={self._width}, Area={self.area:.5f}"
 
     def __repr__(self):
         """Returns a developer-friendly string representation."""
+        if self._x or self._y:
+            return (f"Rectangle({self._length!r}, {self._width!r}, {self._name!r}, "
+                    f"x={self._x!r}, y={self._y!r})")
         return f"Rectangle({self._length!r}, {self._width!r}, {self._name!r})"
 
+    @property
+    def x(self):
+        """Getter for _x (left edge)."""
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        """Setter for _x. Validates that value is a number and notifies listeners."""
+        if not isinstance(value, (int, float)):
+            raise TypeError("x must be a number.")
+        self._x = value
+        self._moved()
+
+    @property
+    def y(self):
+        """Getter for _y (bottom edge)."""
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        """Setter for _y. Validates that value is a number and notifies listeners."""
+        if not isinstance(value, (int, float)):
+            raise TypeError("y must be a number.")
+        self._y = value
+        self._moved()
+
     @property
     def length(self):
         """Getter for _length."""
@@ -46,14 +146,14 @@ class Rectangle(BasicShape):
     def length(self, value):
         """
         Setter for _length. Validates positive value and
-        automatically recalculates area.
+        marks the area for recalculation.
         """
         if not isinstance(value, (int, float)):
             raise TypeError("Length must be a number.")
         if value <= 0:
             raise ValueError("Length must be positive.")
         self._length = value
-        self.calc_area()
+        self._invalidate_area()
 
     @property
     def width(self):
@@ -64,14 +164,14 @@ class Rectangle(BasicShape):
     def width(self, value):
         """
         Setter for _width. Validates positive value and
-        automatically recalculates area.
+        marks the area for recalculation.
         """
         if not isinstance(value, (int, float)):
             raise TypeError("Width must be a number.")
         if value <= 0:
             raise ValueError("Width must be positive.")
         self._width = value
-        self.calc_area()
+        self._invalidate_area()
 
 
 # ---- Unit Tests ----
@@ -86,3 +186,9 @@ if __name__ == "__main__":
     r.length = 20
     r.width = 40
     print(f"After doubling: length={r.length}, width={r.width}, area={r.area}")
+
+    with r.batch_update():
+        r.length = 5
+        r.width = 6
+        print(f"Inside batch_update: area={r.area} (deferred)")
+    print(f"After batch_update: length={r.length}, width={r.width}, area={r.area}")
@@ -0,0 +1,394 @@
+"""
+ShapeCollection Class - Struct-of-arrays storage for large shape sets.
+Keeps each shape kind in contiguous typed columns (array('d')) instead of
+one Python object per shape, and computes areas one column at a time.
+
+Shapes are indexed in kind order: all circles, then rectangles, then squares.
+"""
+
+import math
+from array import array
+
+from circle import Circle
+from rectangle import Rectangle
+from square import Square
+
+
+# ---- Column Kernels ----
+# Module-level so they also run on shared-memory column slices in workers.
+
+def circle_areas(radius):
+    """Returns pi * r^2 for every radius as array('d')."""
+    pi = math.pi
+    return array("d", [pi * r * r for r in radius])
+
+
+def rectangle_areas(length, width):
+    """Returns length * width for every row as array('d')."""
+    return array("d", [l * w for l, w in zip(length, width)])
+
+
+def square_areas(side):
+    """Returns side^2 for every side as array('d')."""
+    return array("d", [s * s for s in side])
+
+
+def circle_perimeters(radius):
+    """Returns 2 * pi * r for every radius as array('d')."""
+    tau = 2 * math.pi
+    return array("d", [tau * r for r in radius])
+
+
+def rectangle_perimeters(length, width):
+    """Returns 2 * (length + width) for every row as array('d')."""
+    return array("d", [2 * (l + w) for l, w in zip(length, width)])
+
+
+def square_perimeters(side):
+    """Returns 4 * side for every side as array('d')."""
+    return array("d", [4 * s for s in side])
+
+
+def circle_extents(radius):
+    """Returns the diameter 2 * r for every radius as array('d')."""
+    return array("d", [2 * r for r in radius])
+
+
+def rectangle_diagonals(length, width):
+    """Returns the diagonal for every row as array('d')."""
+    hypot = math.hypot
+    return array("d", [hypot(l, w) for l, w in zip(length, width)])
+
+
+def square_diagonals(side):
+    """Returns side * sqrt(2) for every side as array('d')."""
+    root2 = math.sqrt(2)
+    return array("d", [s * root2 for s in side])
+
+
+def offset_midpoints(origin, size):
+    """Returns origin + size / 2 for every row: one centroid coordinate."""
+    return array("d", [o + d / 2 for o, d in zip(origin, size)])
+
+
+def _extend(column, values):
+    """Appends a checked number sequence to an array('d') column."""
+    if isinstance(values, array) and values.typecode != "d":
+        values = array("d", values)
+    column.extend(values)
+
+
+class ShapeCollection:
+    """Columnar container for Circle, Rectangle and Square data."""
+
+    def __init__(self):
+        """
+        Preconditions: None
+        Postconditions: Empty collection with one set of columns per shape kind
+        """
+        self.circle_x = array("d")
+        self.circle_y = array("d")
+        self.circle_radius = array("d")
+        self.circle_names = []
+        self.rect_x = array("d")
+        self.rect_y = array("d")
+        self.rect_length = array("d")
+        self.rect_width = array("d")
+        self.rect_names = []
+        self.square_x = array("d")
+        self.square_y = array("d")
+        self.square_side = array("d")
+        self.square_names = []
+
+    # ---- Adding Shapes ----
+
+    @staticmethod
+    def _check_positive(value, label):
+        """Applies the same checks as the shape setters."""
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"{label} must be a number.")
+        if value <= 0:
+            raise ValueError(f"{label} must be positive.")
+
+    def add_circle(self, x_center, y_center, radius, name="Circle"):
+        """
+        Preconditions: x_center, y_center are numbers, radius is positive
+        Postconditions: Circle appended to the circle columns
+        """
+        if not isinstance(x_center, (int, float)):
+            raise TypeError("x_center must be a number.")
+        if not isinstance(y_center, (int, float)):
+            raise TypeError("y_center must be a number.")
+        self._check_positive(radius, "Radius")
+        self.circle_x.append(x_center)
+        self.circle_y.append(y_center)
+        self.circle_radius.append(radius)
+        self.circle_names.append(name)
+
+    @staticmethod
+    def _check_origin(x, y):
+        if not isinstance(x, (int, float)):
+            raise TypeError("x must be a number.")
+        if not isinstance(y, (int, float)):
+            raise TypeError("y must be a number.")
+
+    def add_rectangle(self, length, width, name="Rectangle", x=0, y=0):
+        """
+        Preconditions: length, width are positive numbers; x, y are numbers
+        Postconditions: Rectangle appended to the rectangle columns
+        """
+        self._check_positive(length, "Length")
+        self._check_positive(width, "Width")
+        self._check_origin(x, y)
+        self.rect_x.append(x)
+        self.rect_y.append(y)
+        self.rect_length.append(length)
+        self.rect_width.append(width)
+        self.rect_names.append(name)
+
+    def add_square(self, side, name="Square", x=0, y=0):
+        """
+        Preconditions: side is a positive number; x, y are numbers
+        Postconditions: Square appended to the square columns
+        """
+        self._check_positive(side, "Side")
+        self._check_origin(x, y)
+        self.square_x.append(x)
+        self.square_y.append(y)
+        self.square_side.append(side)
+        self.square_names.append(name)
+
+    # ---- Bulk Loading ----
+    # Whole columns are checked once with the setter rules (see
+    # Circle.from_arrays); nothing is appended unless every row is valid.
+
+    def extend_circles(self, x_center, y_center, radius, names=None):
+        """
+        Preconditions: equal-length number sequences, radii positive; names
+                       is None, one string or a sequence of strings
+        Postconditions: Every row appended to the circle columns, or a
+                        TypeError/ValueError naming the first bad row
+        """
+        x_center, y_center, radius = Circle._columns(x_center, y_center, radius)
+        Circle._check_column(x_center, "x_center")
+        Circle._check_column(y_center, "y_center")
+        Circle._check_column(radius, "Radius", positive=True)
+        names = Circle._name_column(names, len(radius), "Circle")
+        _extend(self.circle_x, x_center)
+        _extend(self.circle_y, y_center)
+        _extend(self.circle_radius, radius)
+        self.circle_names.extend(names)
+
+    def extend_rectangles(self, length, width, names=None, x=None, y=None):
+        """
+        Preconditions: equal-length positive number sequences; names as in
+                       extend_circles; x, y are None (origin) or sequences
+        Postconditions: Every row appended to the rectangle columns, or a
+                        TypeError/ValueError naming the first bad row
+        """
+        length, width = Rectangle._columns(length, width)
+        Rectangle._check_column(length, "Length", positive=True)
+        Rectangle._check_column(width, "Width", positive=True)
+        names = Rectangle._name_column(names, len(length), "Rectangle")
+        x, y = Rectangle._origin_columns(x, y, len(length))
+        _extend(self.rect_x, x)
+        _extend(self.rect_y, y)
+        _extend(self.rect_length, length)
+        _extend(self.rect_width, width)
+        self.rect_names.extend(names)
+
+    def extend_squares(self, side, names=None, x=None, y=None):
+        """
+        Preconditions: side is a positive number sequence; names as in
+                       extend_circles; x, y are None (origin) or sequences
+        Postconditions: Every row appended to the square columns, or a
+                        TypeError/ValueError naming the first bad row
+        """
+        (side,) = Square._columns(side)
+        Square._check_column(side, "Side", positive=True)
+        names = Square._name_column(names, len(side), "Square")
+        x, y = Square._origin_columns(x, y, len(side))
+        _extend(self.square_x, x)
+        _extend(self.square_y, y)
+        _extend(self.square_side, side)
+        self.square_names.extend(names)
+
+    def add(self, shape):
+        """
+        Preconditions: shape is a Circle, Rectangle or Square object
+        Postconditions: Shape's data is copied into the matching columns
+        """
+        if isinstance(shape, Circle):
+            self.add_circle(shape.x_center, shape.y_center, shape.radius, shape.name)
+        elif isinstance(shape, Square):  # before Rectangle: Square is a Rectangle
+            self.add_square(shape.side, shape.name, shape.x, shape.y)
+        elif isinstance(shape, Rectangle):
+            self.add_rectangle(shape.length, shape.width, shape.name, shape.x, shape.y)
+        else:
+            raise TypeError(f"Unsupported shape type: {type(shape).__name__}")
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        """
+        Preconditions: shapes is an iterable of Circle/Rectangle/Square objects
+        Postconditions: Returns a new ShapeCollection holding their data
+        """
+        collection = cls()
+        for shape in shapes:
+            collection.add(shape)
+        return collection
+
+    # ---- Converting Back ----
+
+    def shape_at(self, index):
+        """
+        Preconditions: 0 <= index < len(self)
+        Postconditions: Returns a new Circle, Rectangle or Square for that row
+        """
+        if index < 0:
+            index += len(self)
+        n_circles = len(self.circle_radius)
+        if 0 <= index < n_circles:
+            return Circle(self.circle_x[index], self.circle_y[index],
+                          self.circle_radius[index], self.circle_names[index])
+        index -= n_circles
+        n_rects = len(self.rect_length)
+        if 0 <= index < n_rects:
+            return Rectangle(self.rect_length[index], self.rect_width[index],
+                             self.rect_names[index], self.rect_x[index], self.rect_y[index])
+        index -= n_rects
+        if 0 <= index < len(self.square_side):
+            return Square(self.square_side[index], self.square_names[index],
+                          self.square_x[index], self.square_y[index])
+        raise IndexError("ShapeCollection index out of range.")
+
+    def to_shapes(self):
+        """Yields a new shape object for every row, in kind order."""
+        for x, y, r, name in zip(self.circle_x, self.circle_y,
+                                 self.circle_radius, self.circle_names):
+            yield Circle(x, y, r, name)
+        for length, width, name, x, y in zip(self.rect_length, self.rect_width,
+                                             self.rect_names, self.rect_x, self.rect_y):
+            yield Rectangle(length, width, name, x, y)
+        for side, name, x, y in zip(self.square_side, self.square_names,
+                                    self.square_x, self.square_y):
+            yield Square(side, name, x, y)
+
+    def __len__(self):
+        return len(self.circle_radius) + len(self.rect_length) + len(self.square_side)
+
+    # ---- Area Kernels ----
+
+    def circle_areas(self):
+        """Returns pi * r^2 for every circle as array('d')."""
+        return circle_areas(self.circle_radius)
+
+    def rectangle_areas(self):
+        """Returns length * width for every rectangle as array('d')."""
+        return rectangle_areas(self.rect_length, self.rect_width)
+
+    def square_areas(self):
+        """Returns side^2 for every square as array('d')."""
+        return square_areas(self.square_side)
+
+    def areas(self):
+        """
+        Preconditions: None
+        Postconditions: Returns every area as array('d'), in kind order
+        """
+        result = self.circle_areas()
+        result.extend(self.rectangle_areas())
+        result.extend(self.square_areas())
+        return result
+
+    def metrics(self):
+        """
+        Preconditions: None
+        Postconditions: Returns a dict of array('d') columns in kind order:
+                        area, perimeter, extent (circle diameter or
+                        rectangle/square diagonal), centroid_x, centroid_y
+        """
+        extent = circle_extents(self.circle_radius)
+        extent.extend(rectangle_diagonals(self.rect_length, self.rect_width))
+        extent.extend(square_diagonals(self.square_side))
+        centroid_x = array("d", self.circle_x)
+        centroid_x.extend(offset_midpoints(self.rect_x, self.rect_length))
+        centroid_x.extend(offset_midpoints(self.square_x, self.square_side))
+        centroid_y = array("d", self.circle_y)
+        centroid_y.extend(offset_midpoints(self.rect_y, self.rect_width))
+        centroid_y.extend(offset_midpoints(self.square_y, self.square_side))
+        return {
+            "area": self.areas(),
+            "perimeter": self.perimeters(),
+            "extent": extent,
+            "centroid_x": centroid_x,
+            "centroid_y": centroid_y,
+        }
+
+    def perimeters(self):
+        """
+        Preconditions: None
+        Postconditions: Returns every perimeter as array('d'), in kind order
+        """
+        result = circle_perimeters(self.circle_radius)
+        result.extend(rectangle_perimeters(self.rect_length, self.rect_width))
+        result.extend(square_perimeters(self.square_side))
+        return result
+
+    def total_area(self):
+        """Returns the sum of all areas (compensated summation)."""
+        return math.fsum(self.areas())
+
+    def min_area(self):
+        """Returns the smallest area; raises ValueError if empty."""
+        return min(self.areas())
+
+    def max_area(self):
+        """Returns the largest area; raises ValueError if empty."""
+        return max(self.areas())
+
+    def sorted_by_area(self, reverse=False):
+        """
+        Preconditions: None
+        Postconditions: Returns row indexes ordered by area (pass to shape_at)
+        """
+        areas = self.areas()
+        return sorted(range(len(areas)), key=areas.__getitem__, reverse=reverse)
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return (f"ShapeCollection(circles={len(self.circle_radius)}, "
+                f"rectangles={len(self.rect_length)}, squares={len(self.square_side)})")
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 50)
+    print("ShapeCollection Class - Unit Tests")
+    print("=" * 50)
+
+    shapes = [
+        Circle(0, 0, 4, "Circle_1"),
+        Circle(1, 1, 9, "Circle_2"),
+        Rectangle(10, 20, "Rectangle_1"),
+        Rectangle(20, 30, "Rectangle_2"),
+        Square(10, "Square"),
+    ]
+    coll = ShapeCollection.from_shapes(shapes)
+    print(f"\n{coll!r}")
+    print(f"Areas match objects: {list(coll.areas()) == [s.area for s in shapes]}")
+    print(f"Total={coll.total_area():.5f}  Min={coll.min_area():.5f}  Max={coll.max_area():.5f}")
+    print("Sorted by area:")
+    for i in coll.sorted_by_area():
+        print(f"  {coll.shape_at(i)}")
+
+    rng = random.Random(1)
+    big = ShapeCollection()
+    for _ in range(1_000_000):
+        big.add_circle(rng.random(), rng.random(), rng.random() + 0.1)
+    start = time.perf_counter()
+    total = big.total_area()
+    print(f"\n1,000,000 circle areas summed in {time.perf_counter() - start:.3f}s (total={total:.1f})")
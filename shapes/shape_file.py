@@ -0,0 +1,429 @@
+"""
+Shapes Hierarchy - Shape File Formats (shape_file.py)
+Persists Circle, Rectangle and Square records in two formats:
+
+Binary (.shp): a 16-byte header, fixed 40-byte records, a name table and a
+16-byte trailer. Fixed-size records allow memory-mapped random access;
+names are dictionary-encoded so repeated names cost 4 bytes per record.
+
+    header  : magic b"SHPF", version (u16), reserved (u16), record count (u64)
+    record  : kind (u8), 3 pad bytes, name index (u32), four f64 fields
+              circle (x, y, radius, 0), rectangle (x, y, length, width),
+              square (x, y, side, 0)
+    names   : per name, byte length (u16) + UTF-8 bytes
+    trailer : name table offset (u64), name count (u32), magic b"SHPE"
+
+JSON Lines (.jsonl): one object per line with "kind", "name", "x", "y" and
+the kind's dimensions.
+
+All readers stream: memory stays bounded by the batch size and the number
+of distinct names, not by the number of shapes in the file.
+
+Name table limits: a name may be at most 65535 UTF-8 bytes (its u16
+length), and the writer and every binary reader hold the whole table in
+memory, so a file whose names are mostly unique (e.g. "Circle_1",
+"Circle_2", ...) costs memory per shape. ShapeFileWriter(max_names=...)
+caps the table when that matters.
+"""
+
+import json
+import mmap
+import struct
+
+from circle import Circle
+from rectangle import Rectangle
+from shape_collection import ShapeCollection
+from square import Square
+
+MAGIC = b"SHPF"
+TRAILER_MAGIC = b"SHPE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+RECORD = struct.Struct("<BxxxIdddd")
+TRAILER = struct.Struct("<QI4s")
+NAME_LENGTH = struct.Struct("<H")
+MAX_NAME_BYTES = 2 ** (8 * NAME_LENGTH.size) - 1
+
+CIRCLE, RECTANGLE, SQUARE = 0, 1, 2
+KIND_NAMES = {CIRCLE: "circle", RECTANGLE: "rectangle", SQUARE: "square"}
+
+
+def _fields(shape):
+    """Returns (kind code, (f0, f1, f2, f3)) for a shape."""
+    if isinstance(shape, Circle):
+        return CIRCLE, (shape.x_center, shape.y_center, shape.radius, 0.0)
+    if isinstance(shape, Square):  # before Rectangle: Square is a Rectangle
+        return SQUARE, (shape.x, shape.y, shape.side, 0.0)
+    if isinstance(shape, Rectangle):
+        return RECTANGLE, (shape.x, shape.y, shape.length, shape.width)
+    raise TypeError(f"Unsupported shape type: {type(shape).__name__}")
+
+
+def _build(kind, name, f0, f1, f2, f3):
+    """Returns a shape object for one decoded record."""
+    if kind == CIRCLE:
+        return Circle(f0, f1, f2, name)
+    if kind == RECTANGLE:
+        return Rectangle(f2, f3, name, f0, f1)
+    if kind == SQUARE:
+        return Square(f2, name, f0, f1)
+    raise ValueError(f"Unknown shape kind code: {kind}")
+
+
+def _add_to_batch(batch, kind, name, f0, f1, f2, f3):
+    """Appends one decoded record to a ShapeCollection."""
+    if kind == CIRCLE:
+        batch.add_circle(f0, f1, f2, name)
+    elif kind == RECTANGLE:
+        batch.add_rectangle(f2, f3, name, f0, f1)
+    elif kind == SQUARE:
+        batch.add_square(f2, name, f0, f1)
+    else:
+        raise ValueError(f"Unknown shape kind code: {kind}")
+
+
+# ---- Binary Format ----
+
+class ShapeFileWriter:
+    """Streams shapes into the binary format."""
+
+    def __init__(self, path, max_names=None):
+        """
+        Preconditions: path is a writable file path; max_names is None (no
+                       limit) or a positive int bounding the distinct names
+        Postconditions: File created with a placeholder header
+        """
+        if max_names is not None and max_names <= 0:
+            raise ValueError("max_names must be positive.")
+        self._max_names = max_names
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        self._names = {}  # name -> index; the table is written by close()
+        self.count = 0
+
+    def _name_index(self, name):
+        """Returns the table index for name, adding it after checking the limits."""
+        index = self._names.get(name)
+        if index is None:
+            if len(name.encode("utf-8")) > MAX_NAME_BYTES:
+                raise ValueError(f"Shape name must be at most {MAX_NAME_BYTES} UTF-8 bytes.")
+            if self._max_names is not None and len(self._names) >= self._max_names:
+                raise ValueError(f"Name table is full ({self._max_names} distinct names).")
+            index = self._names[name] = len(self._names)
+        return index
+
+    def write(self, shape):
+        """
+        Preconditions: shape is a Circle, Rectangle or Square
+        Postconditions: One record appended; a name that does not fit the
+                        name table raises ValueError and writes nothing
+        """
+        kind, fields = _fields(shape)
+        self._file.write(RECORD.pack(kind, self._name_index(shape.name), *fields))
+        self.count += 1
+
+    def write_all(self, shapes):
+        """Appends every shape from an iterable (or a ShapeCollection's rows)."""
+        if isinstance(shapes, ShapeCollection):
+            shapes = shapes.to_shapes()
+        for shape in shapes:
+            self.write(shape)
+
+    def close(self):
+        """Writes the name table and trailer and fixes up the header count."""
+        if self._file is None:
+            return
+        f = self._file
+        table_offset = f.tell()
+        for name in self._names:
+            data = name.encode("utf-8")
+            f.write(NAME_LENGTH.pack(len(data)))
+            f.write(data)
+        f.write(TRAILER.pack(table_offset, len(self._names), TRAILER_MAGIC))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, self.count))
+        f.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_layout(f):
+    """Returns (record count, names) after validating header and trailer."""
+    magic, version, _, count = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a shape file (bad header magic).")
+    if version != VERSION:
+        raise ValueError(f"Unsupported shape file version: {version}")
+    f.seek(-TRAILER.size, 2)
+    table_offset, name_count, trailer_magic = TRAILER.unpack(f.read(TRAILER.size))
+    if trailer_magic != TRAILER_MAGIC:
+        raise ValueError("Shape file is truncated (bad trailer magic).")
+    f.seek(table_offset)
+    names = []
+    for _ in range(name_count):
+        (length,) = NAME_LENGTH.unpack(f.read(NAME_LENGTH.size))
+        names.append(f.read(length).decode("utf-8"))
+    return count, names
+
+
+def _iter_records(path, block_records=4096):
+    """Yields (kind, name, f0, f1, f2, f3) tuples, reading block by block."""
+    with open(path, "rb") as f:
+        count, names = _read_layout(f)
+        f.seek(HEADER.size)
+        remaining = count
+        while remaining:
+            n = min(block_records, remaining)
+            block = f.read(n * RECORD.size)
+            for kind, name_index, f0, f1, f2, f3 in RECORD.iter_unpack(block):
+                yield kind, names[name_index], f0, f1, f2, f3
+            remaining -= n
+
+
+def read_shapes(path):
+    """
+    Preconditions: path is a binary shape file
+    Postconditions: Yields one shape object per record, in file order
+    """
+    for record in _iter_records(path):
+        yield _build(*record)
+
+
+def read_batches(path, batch_size=65536):
+    """
+    Preconditions: path is a binary shape file; batch_size is a positive int
+    Postconditions: Yields ShapeCollection batches of up to batch_size records
+    """
+    batch = ShapeCollection()
+    for record in _iter_records(path):
+        _add_to_batch(batch, *record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = ShapeCollection()
+    if len(batch):
+        yield batch
+
+
+class MappedShapeFile:
+    """Random access to a binary shape file through mmap."""
+
+    def __init__(self, path):
+        """
+        Preconditions: path is a binary shape file
+        Postconditions: File is memory-mapped; only the name table is loaded
+        """
+        with open(path, "rb") as f:
+            self._count, self._names = _read_layout(f)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def record(self, index):
+        """Returns the raw (kind, name, f0, f1, f2, f3) tuple for a record."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("MappedShapeFile index out of range.")
+        kind, name_index, f0, f1, f2, f3 = RECORD.unpack_from(
+            self._map, HEADER.size + index * RECORD.size)
+        return kind, self._names[name_index], f0, f1, f2, f3
+
+    def __getitem__(self, index):
+        return _build(*self.record(index))
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"MappedShapeFile(records={self._count})"
+
+
+# ---- JSON Lines Format ----
+
+def to_record(shape):
+    """Returns the JSON Lines dict for a shape."""
+    kind, (f0, f1, f2, f3) = _fields(shape)
+    record = {"kind": KIND_NAMES[kind], "name": shape.name, "x": f0, "y": f1}
+    if kind == CIRCLE:
+        record["radius"] = f2
+    elif kind == RECTANGLE:
+        record["length"], record["width"] = f2, f3
+    else:
+        record["side"] = f2
+    return record
+
+
+def write_jsonl(path, shapes):
+    """
+    Preconditions: shapes is an iterable of shapes or a ShapeCollection
+    Postconditions: Writes one JSON object per line; returns the record count
+    """
+    if isinstance(shapes, ShapeCollection):
+        shapes = shapes.to_shapes()
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for shape in shapes:
+            f.write(json.dumps(to_record(shape)))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _from_json(r):
+    """Returns (kind, name, f0, f1, f2, f3) for one parsed JSON Lines record.
+
+    Applies the setter rules (numbers, positive dimensions, string names),
+    raising their TypeError/ValueError messages.
+    """
+    if not isinstance(r, dict):
+        raise ValueError(f"Record must be a JSON object, not {type(r).__name__}.")
+    kind = r.get("kind")
+    if kind not in KIND_NAMES.values():
+        raise ValueError(f"Unknown shape kind {kind!r}.")
+    dimensions = {"circle": ("radius",), "rectangle": ("length", "width"),
+                  "square": ("side",)}[kind]
+    missing = [field for field in dimensions if field not in r]
+    if missing:
+        raise ValueError(f"Missing field {missing[0]!r}.")
+    name = r.get("name", kind.capitalize())
+    if not isinstance(name, str):
+        raise TypeError("Name must be a string.")
+    x, y = r.get("x", 0), r.get("y", 0)
+    check_positive = ShapeCollection._check_positive
+    if kind == "circle":
+        if not isinstance(x, (int, float)):
+            raise TypeError("x_center must be a number.")
+        if not isinstance(y, (int, float)):
+            raise TypeError("y_center must be a number.")
+        check_positive(r["radius"], "Radius")
+        return CIRCLE, name, x, y, r["radius"], 0.0
+    ShapeCollection._check_origin(x, y)
+    if kind == "rectangle":
+        check_positive(r["length"], "Length")
+        check_positive(r["width"], "Width")
+        return RECTANGLE, name, x, y, r["length"], r["width"]
+    check_positive(r["side"], "Side")
+    return SQUARE, name, x, y, r["side"], 0.0
+
+
+def _iter_jsonl(path, errors=None):
+    """
+    Yields (kind, name, f0, f1, f2, f3) tuples from a JSON Lines file. A bad
+    line raises ValueError("Line N: ..."), or is skipped and recorded as a
+    (line, message) pair if errors is a list.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                try:
+                    r = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"invalid JSON ({e.msg})") from None
+                record = _from_json(r)
+            except (TypeError, ValueError) as e:
+                if errors is None:
+                    raise ValueError(f"Line {line_number}: {e}") from None
+                errors.append((line_number, str(e)))
+                continue
+            yield record
+
+
+def read_jsonl(path, errors=None):
+    """
+    Preconditions: path is a JSON Lines shape file
+    Postconditions: Yields one shape object per valid line; bad lines raise
+                    ValueError, or are skipped and recorded as (line,
+                    message) pairs if errors is a list
+    """
+    for record in _iter_jsonl(path, errors):
+        yield _build(*record)
+
+
+def read_jsonl_batches(path, batch_size=65536, errors=None):
+    """Yields ShapeCollection batches of up to batch_size valid JSON Lines records."""
+    batch = ShapeCollection()
+    for record in _iter_jsonl(path, errors):
+        _add_to_batch(batch, *record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = ShapeCollection()
+    if len(batch):
+        yield batch
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print("=" * 50)
+    print("Shape File Formats - Unit Tests")
+    print("=" * 50)
+
+    shapes = [
+        Circle(0, 0, 4, "Circle_1"),
+        Circle(1, 1, 9, "Circle_2"),
+        Rectangle(10, 20, "Rectangle_1"),
+        Rectangle(20, 30, "Rectangle_2", 5, 5),
+        Square(10, "Square", 2, 3),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        binary = os.path.join(tmp, "scene.shp")
+        with ShapeFileWriter(binary) as writer:
+            writer.write_all(shapes)
+        print(f"\nBinary file: {os.path.getsize(binary)} bytes for {len(shapes)} shapes")
+        expected = [to_record(s) for s in shapes]
+        print(f"Round trip: {[to_record(s) for s in read_shapes(binary)] == expected}")
+
+        with MappedShapeFile(binary) as mapped:
+            print(f"{mapped!r}: [3] = {mapped[3]!r}, [-1] = {mapped[-1]!r}")
+
+        for batch in read_batches(binary, batch_size=2):
+            print(f"  batch: {batch!r}")
+
+        text = os.path.join(tmp, "scene.jsonl")
+        write_jsonl(text, shapes)
+        with open(text) as f:
+            print(f"\nJSON Lines first line: {f.readline().strip()}")
+        print(f"Round trip: {[to_record(s) for s in read_jsonl(text)] == expected}")
+        total = sum(b.total_area() for b in read_jsonl_batches(text, batch_size=4))
+        print(f"Total area from batches: {total:.5f}")
+
+        with open(text, "a") as f:
+            f.write('{"kind": "circle", "radius": -5}\n{"kind": "circle", "radius": "abc"}\n'
+                    '[1, 2]\n{"kind": "square"}\n{"kind": "circle", "radius"\n'
+                    '{"kind": "hexagon"}\n')
+        errors = []
+        good = list(read_jsonl(text, errors))
+        print(f"\nJSON Lines with bad lines: {len(good)} loaded")
+        for line, message in errors:
+            print(f"  line {line}: {message}")
+        try:
+            list(read_jsonl(text))
+        except ValueError as e:
+            print(f"Without errors=: {e}")
+
+        bounded = os.path.join(tmp, "bounded.shp")
+        with ShapeFileWriter(bounded, max_names=2) as writer:
+            writer.write_all(shapes[:2])
+            for shape in (Circle(0, 0, 1, "x" * (MAX_NAME_BYTES + 1)), shapes[2]):
+                try:
+                    writer.write(shape)
+                except ValueError as e:
+                    print(f"Rejected: {e}")
+        print(f"File still readable: {[s.name for s in read_shapes(bounded)]}")
@@ -0,0 +1,206 @@
+"""
+Shapes Hierarchy - Bulk Geometry Metrics (shape_metrics.py)
+Computes area, perimeter, extent (circle diameter or rectangle/square
+diagonal) and centroid for a list of shape objects in one pass.
+
+The shapes are grouped by exact type, each group's slots are gathered into
+columns, and each metric is computed by the ShapeCollection column kernels
+for the whole group; results are scattered back into the input order.
+Subclasses may override calc_area/calc_perimeter, so they are not given
+to the kernels: they go through their own methods, one object at a time.
+
+On plain object lists the gather and scatter cost about as much as the
+per-object calls they replace (about 0.5s vs 0.45s for 300,000 mixed
+shapes here, both building the same five columns); data that already
+lives in a ShapeCollection skips both, so ShapeCollection.metrics() is the
+fast path (about 0.14s).
+"""
+
+import math
+from array import array
+from itertools import compress, repeat
+from operator import attrgetter, is_, itemgetter
+
+from circle import Circle
+from rectangle import Rectangle
+from shape_collection import (circle_areas, circle_extents, circle_perimeters,
+                              offset_midpoints, rectangle_areas, rectangle_diagonals,
+                              rectangle_perimeters, square_areas, square_diagonals,
+                              square_perimeters)
+from square import Square
+
+METRICS = ("area", "perimeter", "extent", "centroid_x", "centroid_y")
+
+
+def _gather(shapes, *fields):
+    """Returns one array('d') per slot field, read straight from the slots."""
+    # The exact classes' setters validated the values, and skipping the
+    # property getters saves a Python call per shape and field.
+    return tuple(array("d", map(attrgetter(field), shapes)) for field in fields)
+
+
+def _circle_metrics(circles):
+    x, y, radius = _gather(circles, "_x_center", "_y_center", "_radius")
+    return (circle_areas(radius), circle_perimeters(radius), circle_extents(radius), x, y)
+
+
+def _rectangle_metrics(rects):
+    x, y, length, width = _gather(rects, "_x", "_y", "_length", "_width")
+    return (rectangle_areas(length, width), rectangle_perimeters(length, width),
+            rectangle_diagonals(length, width),
+            offset_midpoints(x, length), offset_midpoints(y, width))
+
+
+def _square_metrics(squares):
+    x, y, side = _gather(squares, "_x", "_y", "_length")  # Square keeps its side in _length
+    return (square_areas(side), square_perimeters(side), square_diagonals(side),
+            offset_midpoints(x, side), offset_midpoints(y, side))
+
+
+def _method_metrics(shapes):
+    """Per-object fallback for subclasses, which may override calc_area and friends."""
+    columns = tuple(array("d") for _ in METRICS)
+    area, perimeter, extent, centroid_x, centroid_y = columns
+    for shape in shapes:
+        if isinstance(shape, Circle):
+            diameter = 2 * shape.radius
+        elif isinstance(shape, Rectangle):
+            diameter = shape.diagonal
+        else:
+            raise TypeError(f"Unsupported shape type: {type(shape).__name__}")
+        x, y = shape.centroid()
+        area.append(shape.area)
+        perimeter.append(shape.perimeter)
+        extent.append(diameter)
+        centroid_x.append(x)
+        centroid_y.append(y)
+    return columns
+
+
+# Keyed by exact type: a subclass may override the geometry the kernels assume
+_KERNELS = {Circle: _circle_metrics, Rectangle: _rectangle_metrics,
+            Square: _square_metrics}
+
+
+def compute_metrics(shapes):
+    """
+    Preconditions: shapes is an iterable of Circle/Rectangle/Square objects
+                   (subclasses included)
+    Postconditions: Returns a dict mapping each name in METRICS to an
+                    array('d') aligned with the input order
+    """
+    shapes = list(shapes)
+    if not shapes:
+        return {name: array("d") for name in METRICS}
+    types = list(map(type, shapes))
+    kinds = set(types)
+    if len(kinds) == 1:  # one exact type: no grouping or reordering needed
+        kind = kinds.pop()
+        return dict(zip(METRICS, _KERNELS.get(kind, _method_metrics)(shapes)))
+
+    # Group by exact type, with every subclass in one fallback group
+    groups = {}
+    for kind in kinds:
+        groups.setdefault(_KERNELS.get(kind, _method_metrics), []).append(kind)
+    columns = [array("d") for _ in METRICS]
+    order = []
+    positions = range(len(shapes))
+    for kernel, members in groups.items():
+        if len(members) == 1:
+            selected = list(map(is_, types, repeat(members[0])))
+        else:
+            selected = [kind in members for kind in types]
+        order.extend(compress(positions, selected))
+        for column, values in zip(columns, kernel(list(compress(shapes, selected)))):
+            column.extend(values)
+
+    if order == list(positions):
+        return dict(zip(METRICS, columns))  # input was already grouped by type
+
+    # One inverse permutation, applied by a single itemgetter per column,
+    # puts every column back into input order
+    scatter = itemgetter(*sorted(positions, key=order.__getitem__))
+    return {name: array("d", scatter(column)) for name, column in zip(METRICS, columns)}
+
+
+def summarize(metrics):
+    """
+    Preconditions: metrics is a dict from compute_metrics or
+                   ShapeCollection.metrics
+    Postconditions: Returns {metric: {"total", "min", "max", "mean"}}; totals
+                    use math.fsum, so they do not drift with row order
+    """
+    summary = {}
+    for name, values in metrics.items():
+        if not values:
+            summary[name] = {"total": 0.0, "min": None, "max": None, "mean": None}
+            continue
+        total = math.fsum(values)
+        summary[name] = {"total": total, "min": min(values), "max": max(values),
+                         "mean": total / len(values)}
+    return summary
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    from shape_collection import ShapeCollection
+
+    print("=" * 50)
+    print("Bulk Geometry Metrics - Unit Tests")
+    print("=" * 50)
+
+    shapes = [
+        Circle(0, 0, 4, "Circle_1"),
+        Rectangle(10, 20, "Rectangle_1", 1, 1),
+        Square(10, "Square"),
+        Circle(1, 1, 9, "Circle_2"),
+    ]
+    metrics = compute_metrics(shapes)
+    print()
+    for i, shape in enumerate(shapes):
+        print(f"{shape.name}: area={metrics['area'][i]:.3f} perimeter={metrics['perimeter'][i]:.3f} "
+              f"extent={metrics['extent'][i]:.3f} "
+              f"centroid=({metrics['centroid_x'][i]}, {metrics['centroid_y'][i]})")
+
+    same = all(metrics["area"][i] == s.area and metrics["perimeter"][i] == s.perimeter
+               and (metrics["centroid_x"][i], metrics["centroid_y"][i]) == s.centroid()
+               for i, s in enumerate(shapes))
+    print(f"Matches per-object methods: {same}")
+
+    class BigCircle(Circle):
+        def calc_area(self):
+            self._area = 12.0
+
+    overridden = compute_metrics([BigCircle(0, 0, 1), Square(2)])
+    print(f"Subclass override honoured: {overridden['area'].tolist() == [12.0, 4.0]}")
+    print(f"Circle_1 circumference={shapes[0].circumference:.3f}, "
+          f"Rectangle_1 diagonal={shapes[1].diagonal:.3f}")
+
+    rng = random.Random(2)
+    makers = (lambda: Circle(rng.random(), rng.random(), rng.uniform(1, 2)),
+              lambda: Rectangle(rng.uniform(1, 2), rng.uniform(1, 2)),
+              lambda: Square(rng.uniform(1, 2)))
+    big = [rng.choice(makers)() for _ in range(300_000)]
+    start = time.perf_counter()
+    big_metrics = compute_metrics(big)
+    grouped = time.perf_counter() - start
+    start = time.perf_counter()
+    same_columns = _method_metrics(big)  # the same five columns, method by method
+    per_object = time.perf_counter() - start
+    big_coll = ShapeCollection.from_shapes(big)
+    start = time.perf_counter()
+    big_coll.metrics()
+    columnar = time.perf_counter() - start
+    print(f"\n300,000 shapes: compute_metrics {grouped:.2f}s, per-object methods "
+          f"{per_object:.2f}s, ShapeCollection.metrics() {columnar:.2f}s")
+    print(f"Per-object columns agree (to rounding): "
+          f"{all(all(map(math.isclose, a, b)) for a, b in zip(same_columns, big_metrics.values()))}")
+    summary = summarize(big_metrics)
+    print(f"Total area {summary['area']['total']:,.1f}, "
+          f"mean perimeter {summary['perimeter']['mean']:.3f}")
+    coll = ShapeCollection.from_shapes(shapes)
+    print(f"ShapeCollection.metrics() totals agree: "
+          f"{summarize(coll.metrics())['area']['total'] == summarize(metrics)['area']['total']}")
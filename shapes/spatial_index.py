@@ -0,0 +1,280 @@
+"""
+SpatialIndex Class - Uniform grid index over Circle objects.
+Each circle is bucketed into every grid cell its bounding box touches, so
+point, range, nearest-neighbour and overlap queries only look at nearby
+cells instead of every circle. Indexed circles are tracked through their
+change listeners: moving or resizing one re-buckets it automatically.
+"""
+
+import gc
+import math
+from statistics import median
+
+
+class SpatialIndex:
+    """Uniform-grid spatial index for circles."""
+
+    def __init__(self, cell_size=1.0):
+        """
+        Preconditions: cell_size is a positive number (ideally close to the
+                       typical circle diameter)
+        Postconditions: Empty index
+        """
+        if not isinstance(cell_size, (int, float)):
+            raise TypeError("Cell size must be a number.")
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive.")
+        self.cell_size = cell_size
+        self._cells = {}     # (cx, cy) -> list of circles
+        self._spans = {}     # circle -> (cx0, cy0, cx1, cy1) cell span
+        # loose bounds of occupied cells; used to stop nearest() searches
+        self._bounds = None
+
+    @classmethod
+    def from_shapes(cls, circles, cell_size=None):
+        """
+        Preconditions: circles is an iterable of Circle objects
+        Postconditions: Returns an index holding them; cell_size defaults to
+                        twice the median radius
+        """
+        circles = list(circles)
+        if cell_size is None:
+            cell_size = 2 * median(c.radius for c in circles) if circles else 1.0
+        index = cls(cell_size)
+        # Bulk loading allocates millions of small containers; pausing the
+        # cyclic collector avoids repeated full-heap scans while it runs.
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for circle in circles:
+                index.insert(circle)
+        finally:
+            if was_enabled:
+                gc.enable()
+        return index
+
+    # ---- Maintenance ----
+
+    def _span(self, circle):
+        size = self.cell_size
+        x, y, r = circle.x_center, circle.y_center, circle.radius
+        return (math.floor((x - r) / size), math.floor((y - r) / size),
+                math.floor((x + r) / size), math.floor((y + r) / size))
+
+    def _add_to_cells(self, circle, span):
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = span
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [circle]
+                else:
+                    bucket.append(circle)
+        self._spans[circle] = span
+        if self._bounds is None:
+            self._bounds = list(span)
+        else:
+            b = self._bounds
+            b[0], b[1] = min(b[0], cx0), min(b[1], cy0)
+            b[2], b[3] = max(b[2], cx1), max(b[3], cy1)
+
+    def _remove_from_cells(self, circle):
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = self._spans.pop(circle)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells[(cx, cy)]
+                bucket.remove(circle)
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    def insert(self, circle):
+        """
+        Preconditions: circle is a Circle object not already in the index
+        Postconditions: circle is indexed and re-bucketed whenever it changes
+        """
+        if circle in self._spans:
+            raise ValueError("Circle is already indexed.")
+        self._add_to_cells(circle, self._span(circle))
+        circle.add_listener(self.update)
+
+    def remove(self, circle):
+        """
+        Preconditions: circle is in the index
+        Postconditions: circle is no longer indexed or tracked
+        """
+        self._remove_from_cells(circle)
+        circle.remove_listener(self.update)
+
+    def update(self, circle):
+        """Re-buckets circle after its centre or radius changed."""
+        span = self._span(circle)
+        if span != self._spans[circle]:
+            self._remove_from_cells(circle)
+            self._add_to_cells(circle, span)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, circle):
+        return circle in self._spans
+
+    # ---- Queries ----
+
+    def _candidates(self, xmin, ymin, xmax, ymax):
+        """Returns the set of circles bucketed in cells touching the box."""
+        size = self.cell_size
+        cells = self._cells
+        found = set()
+        for cx in range(math.floor(xmin / size), math.floor(xmax / size) + 1):
+            for cy in range(math.floor(ymin / size), math.floor(ymax / size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def contains_point(self, x, y):
+        """
+        Preconditions: x, y are numbers
+        Postconditions: Returns the circles that contain the point (edge inclusive)
+        """
+        size = self.cell_size
+        bucket = self._cells.get((math.floor(x / size), math.floor(y / size)), ())
+        return [c for c in bucket
+                if (x - c.x_center) ** 2 + (y - c.y_center) ** 2 <= c.radius ** 2]
+
+    def query_range(self, xmin, ymin, xmax, ymax):
+        """
+        Preconditions: xmin <= xmax and ymin <= ymax
+        Postconditions: Returns the circles that intersect the axis-aligned box
+        """
+        result = []
+        for c in self._candidates(xmin, ymin, xmax, ymax):
+            # distance from the centre to the nearest point of the box
+            dx = max(xmin - c.x_center, 0, c.x_center - xmax)
+            dy = max(ymin - c.y_center, 0, c.y_center - ymax)
+            if dx * dx + dy * dy <= c.radius ** 2:
+                result.append(c)
+        return result
+
+    def nearest(self, x, y):
+        """
+        Preconditions: x, y are numbers
+        Postconditions: Returns (circle, distance) for the circle whose edge is
+                        closest to the point (distance 0 if inside), or
+                        (None, inf) if the index is empty
+        """
+        if not self._spans:
+            return None, math.inf
+        size = self.cell_size
+        cells = self._cells
+        px, py = math.floor(x / size), math.floor(y / size)
+        bx0, by0, bx1, by1 = self._bounds
+        max_ring = max(px - bx0, bx1 - px, py - by0, by1 - py, 0)
+        best, best_dist = None, math.inf
+        seen = set()
+        for ring in range(max_ring + 1):
+            if ring == 0:
+                ring_cells = [(px, py)]
+            else:
+                ring_cells = [(px + dx, py + dy)
+                              for dx in range(-ring, ring + 1)
+                              for dy in ((-ring, ring) if abs(dx) != ring
+                                         else range(-ring, ring + 1))]
+            for cell in ring_cells:
+                for c in cells.get(cell, ()):
+                    if c in seen:
+                        continue
+                    seen.add(c)
+                    dist = max(0.0, math.hypot(x - c.x_center, y - c.y_center) - c.radius)
+                    if dist < best_dist:
+                        best, best_dist = c, dist
+            # any circle not seen yet lies wholly outside the searched square
+            reach = min(x - (px - ring) * size, (px + ring + 1) * size - x,
+                        y - (py - ring) * size, (py + ring + 1) * size - y)
+            if best_dist <= reach:
+                break
+        return best, best_dist
+
+    def overlapping_pairs(self):
+        """
+        Preconditions: None
+        Postconditions: Returns every pair of circles whose interiors overlap,
+                        each pair exactly once
+        """
+        size = self.cell_size
+        floor = math.floor
+        pairs = []
+        for (cx, cy), bucket in self._cells.items():
+            if len(bucket) < 2:
+                continue
+            for i, a in enumerate(bucket):
+                ax, ay, ar = a.x_center, a.y_center, a.radius
+                for b in bucket[i + 1:]:
+                    bx, by, br = b.x_center, b.y_center, b.radius
+                    reach = ar + br
+                    if (ax - bx) ** 2 + (ay - by) ** 2 >= reach * reach:
+                        continue
+                    # report the pair only in the cell holding the lower-left
+                    # corner of the two bounding boxes' intersection
+                    if (floor(max(ax - ar, bx - br) / size) == cx
+                            and floor(max(ay - ar, by - br) / size) == cy):
+                        pairs.append((a, b))
+        return pairs
+
+    def __repr__(self):
+        """Returns a developer-friendly string representation."""
+        return f"SpatialIndex(cell_size={self.cell_size!r}, circles={len(self._spans)})"
+
+
+# ---- Unit Tests ----
+if __name__ == "__main__":
+    import random
+    import time
+
+    from circle import Circle
+
+    print("=" * 50)
+    print("SpatialIndex Class - Unit Tests")
+    print("=" * 50)
+
+    c1 = Circle(0, 0, 4, "Circle_1")
+    c2 = Circle(5, 0, 2, "Circle_2")
+    c3 = Circle(20, 20, 1, "Circle_3")
+    index = SpatialIndex.from_shapes([c1, c2, c3])
+    print(f"\n{index!r}")
+    print(f"Contains (4.5, 0): {[c.name for c in index.contains_point(4.5, 0)]}")
+    print(f"Range (15, 15)-(25, 25): {[c.name for c in index.query_range(15, 15, 25, 25)]}")
+    near, dist = index.nearest(18, 18)
+    print(f"Nearest to (18, 18): {near.name} at {dist:.3f}")
+    print(f"Overlapping pairs: {[(a.name, b.name) for a, b in index.overlapping_pairs()]}")
+
+    with c3.batch_update():  # the listener re-buckets it once, on exit
+        c3.x_center = 6
+        c3.y_center = 1
+    pairs = sorted(tuple(sorted((a.name, b.name))) for a, b in index.overlapping_pairs())
+    print(f"After moving Circle_3 to (6, 1): {pairs}")
+
+    # Brute-force cross-check on random data
+    rng = random.Random(7)
+    circles = [Circle(rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0.5, 3))
+               for _ in range(2000)]
+    index = SpatialIndex.from_shapes(circles)
+    fast = {frozenset((id(a), id(b))) for a, b in index.overlapping_pairs()}
+    slow = {frozenset((id(a), id(b)))
+            for i, a in enumerate(circles) for b in circles[i + 1:]
+            if math.hypot(a.x_center - b.x_center, a.y_center - b.y_center) < a.radius + b.radius}
+    print(f"\n2000 random circles: grid pairs == brute-force pairs: {fast == slow} ({len(fast)})")
+    best = min(max(0.0, math.hypot(50 - c.x_center, 50 - c.y_center) - c.radius) for c in circles)
+    print(f"nearest() distance matches brute force: {index.nearest(50, 50)[1] == best}")
+
+    n = 1_000_000
+    big = [Circle(rng.uniform(0, 10000), rng.uniform(0, 10000), rng.uniform(0.5, 3))
+           for _ in range(n)]
+    start = time.perf_counter()
+    index = SpatialIndex.from_shapes(big)
+    built = time.perf_counter() - start
+    pairs = index.overlapping_pairs()
+    print(f"{n:,} circles: built in {built:.1f}s, "
+          f"{len(pairs):,} overlaps found in {time.perf_counter() - start - built:.1f}s")
@@ -1,53 +1,91 @@
 """
 Square Class - Inherits from Rectangle.
 Represents a square with a single side length.
-Passes side as both length and width to Rectangle.
-Area is automatically recalculated when side changes.
+Passes side as both length and width to Rectangle; the side itself is
+read back from _length rather than stored a third time.
+Area is recalculated lazily after the side changes.
 """
 
+from basic_shape import BasicShape
 from rectangle import Rectangle
 
 
 class Square(Rectangle):
     """Represents a square shape (special case of Rectangle)."""
 
-    def __init__(self, side, name="Square"):
+    __slots__ = ()
+
+    def __init__(self, side, name="Square", x=0, y=0):
         """
         Preconditions: side is a positive float (side length),
-                       name is a string (shape name)
-        Postconditions: Square object initialized with area calculated
+                       name is a string (shape name),
+                       x, y are floats (lower-left corner, default origin)
+        Postconditions: Square object initialized; area calculated on first read
         """
-        self._side = side
-        super().__init__(side, side, name)
+        super().__init__(side, side, name, x, y)
         self.name = name  # ensure the name is set in BasicShape
 
+    @classmethod
+    def from_arrays(cls, side, names=None, x=None, y=None, as_collection=False):
+        """
+        Preconditions: side is a list, tuple or array of positive numbers;
+                       names is None, one string or a sequence of strings;
+                       x, y are None (origin) or number sequences of the
+                       same length
+        Postconditions: Returns a list of Squares built without per-field
+                        setter calls, or a ShapeCollection if as_collection;
+                        a bad row raises the setter's error with its index
+        """
+        if as_collection:
+            from shape_collection import ShapeCollection  # it imports this module
+            collection = ShapeCollection()
+            collection.extend_squares(side, names, x, y)
+            return collection
+        (side,) = cls._columns(side)
+        cls._check_column(side, "Side", positive=True)
+        names = cls._name_column(names, len(side), "Square")
+        x, y = cls._origin_columns(x, y, len(side))
+
+        new, init = cls.__new__, BasicShape.__init__
+        squares = []
+        for s, name, left, bottom in zip(side, names, x, y):
+            square = new(cls)
+            init(square)
+            square._length = square._width = s
+            square._name = name
+            square._x = left
+            square._y = bottom
+            squares.append(square)
+        return squares
+
     def __str__(self):
         """Returns a user-friendly string representation."""
-        return f"{self._name}: Side={self._side}, Area={self._area:.5f}"
+        return f"{self._name}: Side={self._length}, Area={self.area:.5f}"
 
     def __repr__(self):
         """Returns a developer-friendly string representation."""
-        return f"Square({self._side!r}, {self._name!r})"
+        if self._x or self._y:
+            return f"Square({self._length!r}, {self._name!r}, x={self._x!r}, y={self._y!r})"
+        return f"Square({self._length!r}, {self._name!r})"
 
     @property
     def side(self):
-        """Getter for _side."""
-        return self._side
+        """Getter for the side (stored as _length)."""
+        return self._length
 
     @side.setter
     def side(self, value):
         """
-        Setter for _side. Validates positive value and automatically
-        recalculates area by updating both length and width.
+        Setter for the side. Validates positive value, updates both
+        length and width, and marks the area for recalculation.
         """
         if not isinstance(value, (int, float)):
             raise TypeError("Side must be a number.")
         if value <= 0:
             raise ValueError("Side must be positive.")
-        self._side = value
         self._length = value
         self._width = value
-        self.calc_area()
+        self._invalidate_area()
 
 
 # ---- Unit Tests ----
@@ -61,3 +99,10 @@ if __name__ == "__main__":
 
     sq.side = 20
     print(f"After doubling side: side={sq.side}, area={sq.area}")
+
+    squares = Square.from_arrays([1, 2, 3], names="Tile", x=[0, 1, 3])
+    print(f"\nfrom_arrays: {squares}")
+    try:
+        Square.from_arrays([1, "2", 3])
+    except TypeError as e:
+        print(f"Bad row rejected: {e}")